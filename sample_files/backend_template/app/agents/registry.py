@@ -0,0 +1,300 @@
+"""
+Agent registry with a capability index for constant-time task routing.
+
+Keeps an index from task type to agent IDs, plus a parallel index of the
+agents that are currently idle, so dispatchers do not have to scan every
+agent's capabilities for each incoming task.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+
+from app.interfaces.agent import AgentStatus, IAgent
+from app.interfaces.streaming import StreamEvent
+
+
+UNAVAILABLE_STATUSES = {"error", "stopped"}
+
+
+class AgentRegistry:
+    """
+    Registry of running agents indexed by capability.
+
+    Agents enter the index when they are initialized through the registry
+    and leave it when stopped. Idle/busy state and load are tracked from
+    the ``AgentStatus`` each agent reports.
+    """
+
+    def __init__(self):
+        self._agents: Dict[str, IAgent] = {}
+        self._by_task: Dict[str, Set[str]] = {}
+        self._idle_by_task: Dict[str, Set[str]] = {}
+        self._status: Dict[str, str] = {}
+        self._load: Dict[str, float] = {}
+        self._in_flight: Dict[str, int] = {}
+
+    async def initialize_agent(self, agent: IAgent) -> bool:
+        """
+        Initialize an agent and add it to the capability index.
+
+        Args:
+            agent: Agent to initialize
+
+        Returns:
+            bool: True if initialization succeeded, False otherwise
+        """
+        if not await agent.initialize():
+            return False
+        self.register(agent, await agent.get_status())
+        return True
+
+    async def stop_agent(self, agent_id: str) -> bool:
+        """
+        Stop an agent and remove it from the capability index.
+
+        Args:
+            agent_id: ID of the agent to stop
+
+        Returns:
+            bool: True if the agent stopped successfully, False otherwise
+        """
+        agent = self._agents.get(agent_id)
+        if agent is None:
+            return False
+        self.unregister(agent_id)
+        return await agent.stop()
+
+    async def stop_all(self) -> None:
+        """Stop every registered agent."""
+        await asyncio.gather(
+            *(self.stop_agent(agent_id) for agent_id in list(self._agents)),
+            return_exceptions=True,
+        )
+
+    def register(self, agent: IAgent, status: Optional[AgentStatus] = None) -> None:
+        """
+        Add an already-initialized agent to the index.
+
+        Re-registering an agent refreshes its capability entries and keeps
+        its count of in-flight tasks.
+
+        Args:
+            agent: Agent to index
+            status: Status reported by the agent; idle if omitted
+        """
+        in_flight = self._in_flight.get(agent.agent_id, 0)
+        if agent.agent_id in self._agents:
+            self.unregister(agent.agent_id)
+
+        agent.refresh_capabilities()
+        self._agents[agent.agent_id] = agent
+        for task_type in agent.capability_names:
+            self._by_task.setdefault(task_type, set()).add(agent.agent_id)
+        self._in_flight[agent.agent_id] = in_flight
+        self._load[agent.agent_id] = 0.0
+        if status is not None:
+            self.update_status(status)
+        else:
+            self._set_status(agent.agent_id, "busy" if in_flight else "idle")
+
+    def unregister(self, agent_id: str) -> Optional[IAgent]:
+        """
+        Remove an agent from the index without stopping it.
+
+        Args:
+            agent_id: ID of the agent to remove
+
+        Returns:
+            Optional[IAgent]: The removed agent, or None if not registered
+        """
+        agent = self._agents.pop(agent_id, None)
+        if agent is None:
+            return None
+        for task_type in agent.capability_names:
+            self._discard(self._by_task, task_type, agent_id)
+            self._discard(self._idle_by_task, task_type, agent_id)
+        self._status.pop(agent_id, None)
+        self._load.pop(agent_id, None)
+        self._in_flight.pop(agent_id, None)
+        return agent
+
+    def get_agent(self, agent_id: str) -> Optional[IAgent]:
+        """Get a registered agent by ID."""
+        return self._agents.get(agent_id)
+
+    def list_agents(self) -> List[IAgent]:
+        """List all registered agents."""
+        return list(self._agents.values())
+
+    def find_agents(self, task_type: str) -> Set[str]:
+        """
+        Get IDs of all available agents able to handle a task type.
+
+        Args:
+            task_type: Type of task to route
+
+        Returns:
+            Set[str]: IDs of agents that are not stopped or in error
+        """
+        return {
+            agent_id for agent_id in self._by_task.get(task_type, ())
+            if self._status.get(agent_id) not in UNAVAILABLE_STATUSES
+        }
+
+    def find_idle_agents(self, task_type: str) -> Set[str]:
+        """
+        Get IDs of idle agents able to handle a task type.
+
+        Args:
+            task_type: Type of task to route
+
+        Returns:
+            Set[str]: IDs of idle eligible agents
+        """
+        return set(self._idle_by_task.get(task_type, ()))
+
+    def select_agent(self, task_type: str) -> Optional[IAgent]:
+        """
+        Pick the least-loaded agent for a task type.
+
+        Idle agents are preferred; if none are idle, the available agent
+        with the fewest in-flight dispatches and lowest reported load is
+        returned.
+
+        Args:
+            task_type: Type of task to route
+
+        Returns:
+            Optional[IAgent]: Selected agent, or None if no agent can handle it
+        """
+        candidates = self._idle_by_task.get(task_type) or self.find_agents(task_type)
+        if not candidates:
+            return None
+        agent_id = min(candidates, key=lambda a: (self._in_flight.get(a, 0), self._load.get(a, 0.0)))
+        return self._agents[agent_id]
+
+    def update_status(self, status: AgentStatus) -> None:
+        """
+        Update routing state from an agent's reported status.
+
+        Load is read from ``metrics["load"]`` if present, otherwise from
+        ``metrics["active_tasks"]``. An agent reporting idle stays busy while
+        tasks dispatched through the registry are still running on it.
+
+        Args:
+            status: Status reported by the agent
+        """
+        if status.agent_id not in self._agents:
+            return
+        reported = status.status
+        if reported == "idle" and self._in_flight.get(status.agent_id, 0) > 0:
+            reported = "busy"
+        self._set_status(status.agent_id, reported)
+        metrics = status.metrics
+        self._load[status.agent_id] = float(metrics.get("load", metrics.get("active_tasks", 0)))
+
+    async def refresh_status(self) -> None:
+        """Poll every agent's status concurrently and update the index."""
+        agents = list(self._agents.values())
+        statuses = await asyncio.gather(
+            *(agent.get_status() for agent in agents),
+            return_exceptions=True,
+        )
+        for agent, status in zip(agents, statuses):
+            if isinstance(status, AgentStatus):
+                self.update_status(status)
+            else:
+                self._set_status(agent.agent_id, "error")
+
+    def mark_busy(self, agent_id: str) -> None:
+        """Mark an agent busy so it is no longer offered as idle."""
+        if agent_id in self._agents:
+            self._set_status(agent_id, "busy")
+
+    def mark_idle(self, agent_id: str) -> None:
+        """Mark an agent idle so it is offered for new tasks."""
+        if agent_id in self._agents:
+            self._set_status(agent_id, "idle")
+
+    async def dispatch(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Route a task to the best available agent and execute it.
+
+        Args:
+            task: Task definition; ``task["type"]`` selects the agent
+
+        Returns:
+            Dict containing the agent's task result
+
+        Raises:
+            LookupError: If no registered agent can handle the task type
+        """
+        task_type = task.get("type")
+        agent = self.select_agent(task_type)
+        if agent is None:
+            raise LookupError(f"No available agent for task type: {task_type}")
+
+        self._acquire(agent.agent_id)
+        try:
+            return await agent.execute_task(task)
+        finally:
+            self._release(agent.agent_id)
+
+    async def stream(self, agent: IAgent, task: Dict[str, Any]) -> AsyncIterator[StreamEvent]:
+        """
+        Stream a task's partial results from a selected agent.
+
+        The agent is counted as busy until the stream is exhausted or closed.
+
+        Args:
+            agent: Agent returned by get_agent or select_agent
+            task: Task definition with type, parameters, and context
+
+        Yields:
+            StreamEvent: Partial results from the agent's stream_task
+
+        Raises:
+            LookupError: If the agent was unregistered before the stream started
+        """
+        self._acquire(agent.agent_id)
+        try:
+            async for event in agent.stream_task(task):
+                yield event
+        finally:
+            self._release(agent.agent_id)
+
+    def _acquire(self, agent_id: str) -> None:
+        if agent_id not in self._agents:
+            raise LookupError(f"Agent is no longer registered: {agent_id}")
+        self.mark_busy(agent_id)
+        self._in_flight[agent_id] += 1
+
+    def _release(self, agent_id: str) -> None:
+        # Agents registered again while the task ran may start from zero
+        if agent_id in self._agents and self._in_flight[agent_id] > 0:
+            self._in_flight[agent_id] -= 1
+            # An error or offline status reported mid-task is kept
+            if self._in_flight[agent_id] == 0 and self._status.get(agent_id) == "busy":
+                self.mark_idle(agent_id)
+
+    def _set_status(self, agent_id: str, status: str) -> None:
+        self._status[agent_id] = status
+        agent = self._agents[agent_id]
+        for task_type in agent.capability_names:
+            if status == "idle":
+                self._idle_by_task.setdefault(task_type, set()).add(agent_id)
+            else:
+                self._discard(self._idle_by_task, task_type, agent_id)
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], task_type: str, agent_id: str) -> None:
+        agents = index.get(task_type)
+        if agents is None:
+            return
+        agents.discard(agent_id)
+        if not agents:
+            del index[task_type]
+
+
+# Global agent registry instance
+agent_registry = AgentRegistry()
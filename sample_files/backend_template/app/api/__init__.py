@@ -0,0 +1 @@
+"""API route modules."""
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""
+Admin endpoints for request profiles.
+
+Each server worker keeps its own flight recorder, so these endpoints show
+and clear the profiles of the worker serving the request; ``worker`` in
+the listing identifies it. Look a profile up by the X-Profile-Id of a
+response on the same worker (one worker, or repeat until it is reached).
+"""
+
+import os
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+
+from app.core.config import settings
+from app.core.profiling import RequestProfile, flight_recorder, is_admin_token
+
+
+def require_admin(x_admin_token: Optional[str] = Header(default=None)) -> None:
+    """Require the X-Admin-Token header; the admin API is closed when ADMIN_TOKEN is unset."""
+    if not settings.admin_token:
+        raise HTTPException(status_code=403, detail="Admin API is disabled: ADMIN_TOKEN is not set")
+    if not is_admin_token(x_admin_token):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@router.get("/profiles")
+async def list_profiles(limit: int = 20) -> Dict[str, Any]:
+    """Recent slow and requested profiles, slowest first, without stages."""
+    return {
+        "worker": os.getpid(),
+        **flight_recorder.get_stats(),
+        "profiles": [profile.summary() for profile in flight_recorder.list(limit)],
+    }
+
+
+@router.get("/profiles/{profile_id}", response_model=RequestProfile)
+async def get_profile(profile_id: str) -> RequestProfile:
+    """A profile with all of its stage timings."""
+    profile = flight_recorder.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail=f"Profile not found: {profile_id}")
+    return profile
+
+
+@router.delete("/profiles")
+async def clear_profiles() -> Dict[str, Any]:
+    """Drop all kept profiles."""
+    flight_recorder.clear()
+    return {"status": "cleared"}
@@ -0,0 +1,87 @@
+"""
+Tool and workflow catalog endpoints.
+
+Catalogs are served from snapshots that are rebuilt only when a tool or
+workflow is registered or removed, with ETags for conditional GET and
+gzip/brotli compression, so clients polling the catalog mostly get 304s.
+ETags are content hashes, so they agree across worker processes.
+"""
+
+from typing import Any, Callable, Dict, Tuple
+
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from app.core.snapshots import Snapshot, SnapshotCache, snapshot_response
+from app.tools.registry import tool_registry
+from app.workflows.registry import workflow_registry
+
+
+router = APIRouter()
+
+
+tool_catalog = SnapshotCache(
+    lambda: {"tools": [tool.get_schema() for tool in sorted(tool_registry.list_tools(), key=lambda t: t.tool_id)]},
+    lambda: tool_registry.version,
+)
+
+workflow_catalog = SnapshotCache(
+    lambda: {"workflows": [
+        workflow.get_schema()
+        for workflow in sorted(workflow_registry.list_workflows(), key=lambda w: w.workflow_id)
+    ]},
+    lambda: workflow_registry.version,
+)
+
+# Per-item schema snapshots keyed by (kind, id), rebuilt when the registry version changes
+_item_snapshots: Dict[Tuple[str, str], Snapshot] = {}
+_item_versions: Dict[str, int] = {}  # registry version the kind's snapshots were last pruned at
+
+
+def _prune_items(kind: str, version: int) -> None:
+    """Drop a kind's snapshots once its registry has changed; they may be of removed items."""
+    if _item_versions.get(kind) != version:
+        for key in [key for key in _item_snapshots if key[0] == kind]:
+            del _item_snapshots[key]
+        _item_versions[kind] = version
+
+
+def _item_snapshot(kind: str, item_id: str, version: int, build: Callable[[], Any]) -> Snapshot:
+    _prune_items(kind, version)
+    snapshot = _item_snapshots.get((kind, item_id))
+    if snapshot is None:
+        snapshot = _item_snapshots[(kind, item_id)] = Snapshot(version, build())
+    return snapshot
+
+
+@router.get("/tools", tags=["tools"])
+async def list_tools(request: Request) -> Response:
+    """Schemas of all registered tools."""
+    return snapshot_response(request, tool_catalog.get())
+
+
+@router.get("/tools/{tool_id}/schema", tags=["tools"])
+async def get_tool_schema(tool_id: str, request: Request) -> Response:
+    """Schema of one tool."""
+    tool = tool_registry.get_tool(tool_id)
+    if tool is None:
+        _prune_items("tool", tool_registry.version)
+        raise HTTPException(status_code=404, detail=f"Tool not found: {tool_id}")
+    return snapshot_response(request, _item_snapshot("tool", tool_id, tool_registry.version, tool.get_schema))
+
+
+@router.get("/workflows", tags=["workflows"])
+async def list_workflows(request: Request) -> Response:
+    """Schemas of all registered workflows."""
+    return snapshot_response(request, workflow_catalog.get())
+
+
+@router.get("/workflows/{workflow_id}/schema", tags=["workflows"])
+async def get_workflow_schema(workflow_id: str, request: Request) -> Response:
+    """Schema of one workflow."""
+    workflow = workflow_registry.get_workflow(workflow_id)
+    if workflow is None:
+        _prune_items("workflow", workflow_registry.version)
+        raise HTTPException(status_code=404, detail=f"Workflow not found: {workflow_id}")
+    return snapshot_response(
+        request, _item_snapshot("workflow", workflow_id, workflow_registry.version, workflow.get_schema)
+    )
@@ -0,0 +1,34 @@
+"""
+LLM completion endpoints.
+"""
+
+from typing import Any, Dict
+
+from fastapi import APIRouter, HTTPException
+
+from app.core.serialization import FastJSONResponse
+from app.interfaces.llm import LLMRequest, LLMResponse
+from app.llm.client_pool import llm_client_pool
+from app.llm.orchestrator import llm_orchestrator
+from app.llm.providers import LLMProviderError
+
+
+router = APIRouter()
+
+
+@router.post("/complete", response_model=LLMResponse)
+async def complete(request: LLMRequest) -> FastJSONResponse:
+    """Generate a completion through the orchestrator."""
+    try:
+        return FastJSONResponse(await llm_orchestrator.complete(request))
+    except LookupError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except LLMProviderError as e:
+        # Retryable failures (timeouts, rate limits, 5xx) are temporary
+        raise HTTPException(status_code=503 if e.retryable else 502, detail=str(e))
+
+
+@router.get("/stats")
+async def stats() -> Dict[str, Any]:
+    """Cache, request coalescing and per-provider client statistics."""
+    return {**llm_orchestrator.get_stats(), "providers": llm_client_pool.get_stats()}
@@ -0,0 +1,176 @@
+"""
+Streaming endpoints for agent tasks and workflow executions.
+
+Partial results are delivered as Server-Sent Events or over a WebSocket.
+A bounded queue sits between the producer and the client connection, so a
+slow client pauses the producer instead of buffering without limit.
+"""
+
+import asyncio
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Dict, Optional
+
+from fastapi import APIRouter, Body, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+
+from app.agents.registry import agent_registry
+from app.core.config import settings
+from app.core.serialization import dumps
+from app.interfaces.streaming import StreamEvent, StreamEventType
+from app.workflows.registry import workflow_registry
+
+
+router = APIRouter()
+
+_DONE = object()
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",  # Disable proxy buffering (nginx)
+}
+
+
+async def buffered(events: AsyncIterator[StreamEvent]) -> AsyncIterator[Optional[StreamEvent]]:
+    """
+    Relay events through a bounded queue.
+
+    Yields None whenever no event arrives within the heartbeat interval so
+    callers can keep idle connections alive. Closing this generator cancels
+    the producer.
+
+    Args:
+        events: Source event stream
+
+    Yields:
+        Optional[StreamEvent]: Events from the source, or None as a heartbeat
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=settings.stream_queue_size)
+
+    async def produce():
+        try:
+            async for event in events:
+                await queue.put(event)
+        except Exception as e:
+            await queue.put(StreamEvent(type=StreamEventType.ERROR, data={"error": str(e)}))
+        await queue.put(_DONE)
+
+    producer = asyncio.create_task(produce())
+    getter = None
+    try:
+        while True:
+            if getter is None:
+                getter = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait({getter}, timeout=settings.stream_heartbeat_interval)
+            if not done:
+                yield None
+                continue
+            item, getter = getter.result(), None
+            if item is _DONE:
+                break
+            yield item
+    finally:
+        if getter is not None:
+            getter.cancel()
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+        aclose = getattr(events, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+async def sse_stream(events: AsyncIterator[StreamEvent]) -> AsyncIterator[str]:
+    """Encode an event stream as Server-Sent Events."""
+    async with aclosing(buffered(events)) as stream:
+        async for event in stream:
+            if event is None:
+                yield ": ping\n\n"
+            else:
+                yield f"event: {event.type.value}\ndata: {dumps(event).decode()}\n\n"
+
+
+def agent_events(task: Dict[str, Any]) -> AsyncIterator[StreamEvent]:
+    """
+    Resolve the agent for a task and return its event stream.
+
+    The agent is taken from ``task["agent_id"]`` if given, otherwise the
+    least-loaded agent able to handle ``task["type"]`` is selected.
+
+    Raises:
+        HTTPException: 404 if no agent is available
+    """
+    agent_id = task.get("agent_id")
+    if agent_id:
+        agent = agent_registry.get_agent(agent_id)
+    else:
+        agent = agent_registry.select_agent(task.get("type"))
+    if agent is None:
+        raise HTTPException(status_code=404, detail="No available agent for task")
+    return agent_registry.stream(agent, task)
+
+
+async def workflow_events(workflow_id: str, input_data: Dict[str, Any]) -> AsyncIterator[StreamEvent]:
+    """
+    Resolve a workflow, validate its input and return its event stream.
+
+    Raises:
+        HTTPException: 404 if the workflow is unknown, 422 if input is invalid
+    """
+    workflow = workflow_registry.get_workflow(workflow_id)
+    if workflow is None:
+        raise HTTPException(status_code=404, detail=f"Workflow not found: {workflow_id}")
+    if not await workflow.validate_input(input_data):
+        raise HTTPException(status_code=422, detail="Invalid workflow input")
+    return workflow.stream(input_data)
+
+
+@router.post("/agents/tasks/stream", tags=["agents"])
+async def stream_agent_task(task: Dict[str, Any] = Body(...)):
+    """Execute an agent task and stream partial results as Server-Sent Events."""
+    events = agent_events(task)
+    return StreamingResponse(sse_stream(events), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+@router.post("/workflows/{workflow_id}/stream", tags=["workflows"])
+async def stream_workflow(workflow_id: str, input_data: Dict[str, Any] = Body(...)):
+    """Execute a workflow and stream partial results as Server-Sent Events."""
+    events = await workflow_events(workflow_id, input_data)
+    return StreamingResponse(sse_stream(events), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+@router.websocket("/ws/stream")
+async def stream_websocket(websocket: WebSocket):
+    """
+    Stream agent tasks and workflow executions over a WebSocket.
+
+    Each client message starts one run and is answered with its events:
+        {"kind": "agent", "task": {...}}
+        {"kind": "workflow", "workflow_id": "...", "input": {...}}
+    """
+    await websocket.accept()
+    try:
+        while True:
+            try:
+                message = await websocket.receive_json()
+            except ValueError:
+                await websocket.send_json({"type": StreamEventType.ERROR.value, "data": {"error": "Messages must be valid JSON"}})
+                continue
+            if not isinstance(message, dict):
+                await websocket.send_json({"type": StreamEventType.ERROR.value, "data": {"error": "Messages must be JSON objects"}})
+                continue
+            try:
+                if message.get("kind") == "workflow":
+                    events = await workflow_events(message.get("workflow_id"), message.get("input", {}))
+                else:
+                    events = agent_events(message.get("task", {}))
+            except HTTPException as e:
+                await websocket.send_json({"type": StreamEventType.ERROR.value, "data": {"error": e.detail}})
+                continue
+
+            async with aclosing(buffered(events)) as stream:
+                async for event in stream:
+                    if event is None:
+                        await websocket.send_json({"type": "ping"})
+                    else:
+                        await websocket.send_text(dumps(event).decode())
+    except WebSocketDisconnect:
+        pass
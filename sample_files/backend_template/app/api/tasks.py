@@ -0,0 +1,84 @@
+"""
+Task queue endpoints.
+
+Agent tasks and workflow runs are queued and run by the configured task
+queue backend; clients poll a task or stream its events as Server-Sent
+Events. Tasks are scheduled fairly between tenants, identified by the
+``X-Tenant-ID`` header.
+
+The local and process backends keep tasks in the API process that took
+the submission and need a single server worker; the Celery backend shares
+task state through Redis, so any worker can serve these endpoints. Queue
+statistics are always those of the worker answering the request.
+"""
+
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+
+from app.api.streaming import SSE_HEADERS, sse_stream
+from app.core.serialization import FastJSONResponse
+from app.interfaces.task_queue import QueuedTask, QueueFullError, TaskKind
+from app.tasks.dispatch import task_queue
+
+
+router = APIRouter()
+
+
+class TaskSubmission(BaseModel):
+    """An agent task or workflow run to queue."""
+    kind: TaskKind
+    target: Optional[str] = None  # agent ID (routed by task type if omitted) or workflow ID
+    payload: Dict[str, Any] = {}  # agent task definition or workflow input
+    priority: int = Field(default=5, ge=0, le=9)  # higher runs first
+    timeout: Optional[float] = Field(default=None, gt=0)  # seconds, capped at AGENT_TIMEOUT or MAX_WORKFLOW_DURATION
+
+
+@router.post("/tasks", status_code=202, response_model=QueuedTask)
+async def submit_task(
+    submission: TaskSubmission,
+    x_tenant_id: str = Header(default="default"),
+) -> FastJSONResponse:
+    """Queue an agent task or workflow run."""
+    if submission.kind == TaskKind.WORKFLOW and not submission.target:
+        raise HTTPException(status_code=422, detail="Workflow tasks require a target workflow ID")
+    if submission.kind == TaskKind.AGENT and not (submission.target or submission.payload.get("type")):
+        raise HTTPException(status_code=422, detail="Agent tasks require a target agent ID or a task type")
+    try:
+        task = await task_queue.submit(QueuedTask(**submission.model_dump(), tenant=x_tenant_id))
+    except QueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    return FastJSONResponse(task, status_code=202)
+
+
+@router.get("/tasks/stats")
+async def task_stats() -> Dict[str, Any]:
+    """Queue depth per tenant, running tasks and outcome counts of this API process."""
+    return task_queue.get_stats()
+
+
+@router.get("/tasks/{task_id}", response_model=QueuedTask)
+async def get_task(task_id: str) -> FastJSONResponse:
+    """A task's state, and its result once finished."""
+    task = await task_queue.get(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail=f"Task not found: {task_id}")
+    return FastJSONResponse(task)
+
+
+@router.get("/tasks/{task_id}/events")
+async def stream_task_events(task_id: str):
+    """Stream a task's events as Server-Sent Events, from the start until it finishes."""
+    if await task_queue.get(task_id) is None:
+        raise HTTPException(status_code=404, detail=f"Task not found: {task_id}")
+    return StreamingResponse(sse_stream(task_queue.events(task_id)), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+@router.delete("/tasks/{task_id}")
+async def cancel_task(task_id: str) -> Dict[str, Any]:
+    """Cancel a queued or running task."""
+    if not await task_queue.cancel(task_id):
+        raise HTTPException(status_code=404, detail=f"No queued or running task: {task_id}")
+    return {"task_id": task_id, "cancelled": True}
@@ -0,0 +1,240 @@
+"""
+Bulk write path for high-volume inserts and upserts.
+
+Buffers rows in memory and writes them in batches, flushing when the batch
+size is reached or the flush interval elapses, instead of issuing one
+statement per row.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import BaseModel
+from sqlalchemy import Table, insert
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+
+
+class BulkWriteError(Exception):
+    """Raised when a batch fails to write."""
+
+    def __init__(self, rows: int, error: BaseException):
+        super().__init__(f"Bulk write of {rows} rows failed: {error}")
+        self.rows = rows
+        self.error = error
+
+
+class BulkWriteStats(BaseModel):
+    """Throughput statistics for a bulk writer."""
+    rows_written: int = 0
+    batches: int = 0
+    write_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+    rows_per_second: float = 0.0
+
+
+class BulkWriter:
+    """
+    Buffered, batched writer for a single table.
+
+    Rows are written with one executemany per batch. When ``upsert_keys`` is
+    given, batches become INSERT ... ON CONFLICT DO UPDATE on those columns
+    (PostgreSQL and SQLite); rows of a batch with the same key are merged
+    in order first, as one statement cannot update a row twice. Rows may
+    provide different columns: each batch is written as one statement per
+    column set, in one transaction. With ``use_copy`` on PostgreSQL/asyncpg,
+    plain inserts use the COPY protocol.
+
+    Usage:
+        async with BulkWriter(Product, upsert_keys=["sku"]) as writer:
+            for row in rows:
+                await writer.add(row)
+        print(writer.stats)
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        upsert_keys: Optional[List[str]] = None,
+        use_copy: bool = False,
+        session_factory=AsyncSessionLocal,
+    ):
+        self.table: Table = getattr(model, "__table__", model)
+        self.batch_size = batch_size or settings.bulk_write_batch_size
+        self.flush_interval = flush_interval if flush_interval is not None else settings.bulk_write_flush_interval
+        self.upsert_keys = upsert_keys
+        self.use_copy = use_copy
+        self.session_factory = session_factory
+
+        self._buffer: List[Dict[str, Any]] = []
+        self._flush_lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+        self._started_at: Optional[float] = None
+        self._stats = BulkWriteStats()
+
+    async def __aenter__(self) -> "BulkWriter":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close(flush=exc_type is None)
+
+    async def start(self) -> None:
+        """Start the background timer that flushes on the flush interval."""
+        self._started_at = time.perf_counter()
+        if self._timer is None and self.flush_interval > 0:
+            self._timer = asyncio.create_task(self._flush_periodically())
+
+    async def add(self, row: Dict[str, Any]) -> None:
+        """
+        Buffer a row, flushing if the batch size is reached.
+
+        Callers are held up while a full batch is written, which keeps
+        memory bounded when producing rows faster than the database accepts them.
+
+        Args:
+            row: Column name -> value mapping
+        """
+        self._raise_pending_error()
+        self._buffer.append(row)
+        if len(self._buffer) >= self.batch_size:
+            await self.flush()
+
+    async def add_many(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Buffer many rows, flushing whenever the batch size is reached."""
+        for row in rows:
+            await self.add(row)
+
+    async def flush(self) -> int:
+        """
+        Write all buffered rows.
+
+        Returns:
+            int: Number of rows written
+
+        Raises:
+            BulkWriteError: If a batch fails; its rows are dropped from the buffer
+        """
+        async with self._flush_lock:
+            written = 0
+            while self._buffer:
+                batch = self._buffer[:self.batch_size]
+                del self._buffer[:self.batch_size]
+                started = time.perf_counter()
+                try:
+                    await self._write(batch)
+                except Exception as e:
+                    raise BulkWriteError(len(batch), e) from e
+                self._stats.write_seconds += time.perf_counter() - started
+                self._stats.rows_written += len(batch)
+                self._stats.batches += 1
+                written += len(batch)
+            return written
+
+    async def close(self, flush: bool = True) -> None:
+        """
+        Stop the background timer and optionally flush remaining rows.
+
+        Args:
+            flush: Write buffered rows before closing
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            await asyncio.gather(self._timer, return_exceptions=True)
+            self._timer = None
+        if flush:
+            await self.flush()
+            self._raise_pending_error()
+        else:
+            self._buffer.clear()
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered rows not yet written."""
+        return len(self._buffer)
+
+    @property
+    def stats(self) -> BulkWriteStats:
+        """Throughput statistics so far."""
+        stats = self._stats.model_copy()
+        if self._started_at is not None:
+            stats.elapsed_seconds = time.perf_counter() - self._started_at
+        if stats.elapsed_seconds > 0:
+            stats.rows_per_second = stats.rows_written / stats.elapsed_seconds
+        return stats
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if not self._buffer:
+                continue
+            try:
+                await self.flush()
+            except BulkWriteError as e:
+                # Surfaced to the producer on its next add/flush/close
+                self._error = e
+
+    def _raise_pending_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    async def _write(self, rows: List[Dict[str, Any]]) -> None:
+        if self.upsert_keys:
+            merged: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+            for row in rows:
+                key = tuple(row.get(column) for column in self.upsert_keys)
+                merged[key] = {**merged[key], **row} if key in merged else row
+            rows = list(merged.values())
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for row in rows:
+            groups.setdefault(tuple(sorted(row)), []).append(row)
+
+        async with self.session_factory() as session:
+            async with session.begin():
+                dialect = session.bind.dialect
+                for group in groups.values():
+                    if self.use_copy and not self.upsert_keys and dialect.driver == "asyncpg":
+                        await self._copy(session, group)
+                    else:
+                        await session.execute(self._statement(dialect.name, group), group)
+
+    def _statement(self, dialect_name: str, rows: List[Dict[str, Any]]):
+        # Rows provide the same columns (see _write)
+        if not self.upsert_keys:
+            return insert(self.table)
+
+        if dialect_name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        elif dialect_name == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            raise ValueError(f"Upsert is not supported for dialect: {dialect_name}")
+
+        stmt = dialect_insert(self.table)
+        # Only the columns the batch provides; omitted columns keep their values
+        update_columns = {
+            column.name: stmt.excluded[column.name]
+            for column in self.table.columns
+            if column.name in rows[0] and column.name not in self.upsert_keys and not column.primary_key
+        }
+        if not update_columns:
+            return stmt.on_conflict_do_nothing(index_elements=self.upsert_keys)
+        return stmt.on_conflict_do_update(index_elements=self.upsert_keys, set_=update_columns)
+
+    async def _copy(self, session, rows: List[Dict[str, Any]]) -> None:
+        """Write rows with PostgreSQL COPY through the asyncpg connection."""
+        columns = list(rows[0].keys())
+        connection = await session.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            self.table.name,
+            records=[tuple(row.get(column) for column in columns) for row in rows],
+            columns=columns,
+            schema_name=self.table.schema,
+        )
@@ -4,30 +4,145 @@ Database configuration and management for [PROJECT_NAME].
 Implements async SQLAlchemy with connection pooling and health checks.
 """
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext import asyncio as sa_asyncio
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy import text, MetaData
 import asyncio
-from typing import AsyncGenerator
+import os
+from typing import Any, AsyncGenerator, Dict, List, Optional
 from app.core.config import settings
+from app.core.db_pool import InstrumentedAsyncQueuePool, PoolMetrics, instrument_pool
+from app.core.profiling import instrument_engine
+
+
+# Engines and session factories are created on first use so importing this
+# module (and the database driver) does not slow down application startup.
+_engine: Optional[AsyncEngine] = None
+_read_engine: Optional[AsyncEngine] = None
+_session_factory: Optional[async_sessionmaker] = None
+_read_session_factory: Optional[async_sessionmaker] = None
+_pool_metrics: Dict[str, PoolMetrics] = {}
+
+
+def _create_engine(url: str, name: str) -> AsyncEngine:
+    """Create an instrumented async engine with the configured pool policy."""
+    # Database engine with connection pooling. Looked up on the module so
+    # engines created after setup_telemetry are traced by the SQLAlchemy
+    # instrumentor, which patches sqlalchemy.ext.asyncio.create_async_engine
+    engine = sa_asyncio.create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout,
+        pool_recycle=settings.database_pool_recycle,
+        pool_pre_ping=settings.database_pool_pre_ping,  # Validate connections before use
+        echo=settings.database_echo,  # Log SQL queries
+    )
+    _pool_metrics[name] = instrument_pool(engine, name)
+    instrument_engine(engine)
+    return engine
+
+
+def get_engine() -> AsyncEngine:
+    """Get the primary database engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        _engine = _create_engine(settings.database_url, "primary")
+    return _engine
+
+
+def get_read_engine() -> AsyncEngine:
+    """
+    Get the engine for read-only queries.
+
+    Uses the read replica if DATABASE_READ_REPLICA_URL is set, otherwise
+    the primary engine.
+    """
+    global _read_engine
+    if not settings.database_read_replica_url:
+        return get_engine()
+    if _read_engine is None:
+        _read_engine = _create_engine(settings.database_read_replica_url, "replica")
+    return _read_engine
+
+
+def get_engines() -> List[AsyncEngine]:
+    """Engines created so far."""
+    return [engine for engine in (_engine, _read_engine) if engine is not None]
+
+
+def get_session_factory() -> async_sessionmaker:
+    """Get the async session factory, creating it on first use."""
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = async_sessionmaker(
+            get_engine(),
+            class_=AsyncSession,
+            expire_on_commit=False
+        )
+    return _session_factory
+
+
+def get_read_session_factory() -> async_sessionmaker:
+    """Get the session factory bound to the read engine."""
+    global _read_session_factory
+    if _read_session_factory is None:
+        _read_session_factory = async_sessionmaker(
+            get_read_engine(),
+            class_=AsyncSession,
+            expire_on_commit=False
+        )
+    return _read_session_factory
+
+
+def get_pool_metrics() -> Dict[str, Dict[str, Any]]:
+    """Get connection pool metrics for every engine created so far."""
+    return {name: metrics.as_dict() for name, metrics in _pool_metrics.items()}
+
+
+def _reset_after_fork() -> None:
+    """
+    Forget engines inherited from the parent process.
+
+    Pooled connections must not be shared across processes, so a forked
+    worker creates its own engines on first use. The inherited pools are
+    dropped without closing their connections, which still belong to the
+    parent.
+    """
+    global _engine, _read_engine, _session_factory, _read_session_factory
+    for engine in get_engines():
+        engine.sync_engine.dispose(close=False)
+    _engine = _read_engine = None
+    _session_factory = _read_session_factory = None
+    _pool_metrics.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
 
 
-# Database engine with connection pooling
-engine = create_async_engine(
-    settings.database_url,
-    pool_size=settings.database_pool_size,
-    max_overflow=settings.database_max_overflow,
-    pool_pre_ping=True,  # Validate connections before use
-    echo=settings.debug,  # Log SQL queries in debug mode
-)
+class _LazySessionFactory:
+    """Callable stand-in for the session factory that defers engine creation."""
+    
+    def __call__(self, **kwargs) -> AsyncSession:
+        return get_session_factory()(**kwargs)
+    
+    def __getattr__(self, name: str):
+        return getattr(get_session_factory(), name)
+
 
 # Async session factory
-AsyncSessionLocal = async_sessionmaker(
-    engine, 
-    class_=AsyncSession, 
-    expire_on_commit=False
-)
+AsyncSessionLocal = _LazySessionFactory()
+
+
+def __getattr__(name: str):
+    # Keep ``from app.core.database import engine`` working with the lazy engine
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Base class for models
 Base = declarative_base()
@@ -55,9 +170,28 @@ async def get_database_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def get_read_only_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function to get a session for read-only routes.
+    
+    Sessions are bound to the read replica when one is configured, so
+    read-heavy endpoints do not consume primary pool connections.
+    
+    Usage in FastAPI endpoints:
+        @app.get("/items/")
+        async def read_items(db: AsyncSession = Depends(get_read_only_session)):
+            # Use db session here
+    """
+    async with get_read_session_factory()() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
 async def init_database():
     """Initialize database tables."""
-    async with engine.begin() as conn:
+    async with get_engine().begin() as conn:
         # Create all tables
         await conn.run_sync(Base.metadata.create_all)
 
@@ -75,7 +209,10 @@ async def check_database_health() -> bool:
 
 async def close_database_connections():
     """Close all database connections."""
-    await engine.dispose()
+    if _read_engine is not None:
+        await _read_engine.dispose()
+    if _engine is not None:
+        await _engine.dispose()
 
 
 # Example model (uncomment and modify as needed)
@@ -0,0 +1,151 @@
+"""
+Connection pool instrumentation for [PROJECT_NAME].
+
+Tracks checkouts, overflow, connection wait time and pre-ping cost for each
+database engine, so pool sizes can be tuned from measurements.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+# Key in ConnectionRecord.info marking when a pre-ping started
+PING_STARTED_KEY = "_pre_ping_started"
+
+# Upper bounds of histogram buckets in milliseconds; the last bucket is +inf
+DEFAULT_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram in milliseconds."""
+
+    def __init__(self, buckets_ms: Optional[List[float]] = None):
+        self.buckets_ms = buckets_ms or DEFAULT_BUCKETS_MS
+        self.counts = [0] * (len(self.buckets_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        """Record a duration in seconds."""
+        ms = seconds * 1000
+        index = len(self.buckets_ms)
+        for i, bound in enumerate(self.buckets_ms):
+            if ms <= bound:
+                index = i
+                break
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total_ms += ms
+            self.max_ms = max(self.max_ms, ms)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get bucket counts and summary statistics."""
+        labels = [f"le_{bound}" for bound in self.buckets_ms] + ["le_inf"]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class PoolMetrics:
+    """Counters and histograms for one connection pool."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pool: Optional[AsyncAdaptedQueuePool] = None
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.wait_time = LatencyHistogram()
+        self.pre_ping_time = LatencyHistogram()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get current pool state and collected metrics."""
+        pool = self.pool
+        return {
+            "pool_size": pool.size() if pool is not None else None,
+            "checked_out": pool.checkedout() if pool is not None else None,
+            "checked_in": pool.checkedin() if pool is not None else None,
+            "overflow": pool.overflow() if pool is not None else None,
+            "checkouts": self.checkouts,
+            "connects": self.connects,
+            "invalidations": self.invalidations,
+            "wait_time": self.wait_time.as_dict(),
+            "pre_ping_time": self.pre_ping_time.as_dict(),
+        }
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that records how long checkouts wait for a connection.
+
+    The wait covers queueing for a free slot and opening new connections.
+    Pre-ping cost is measured separately as the time between getting a
+    reused connection and the checkout event, which SQLAlchemy fires right
+    after pinging.
+    """
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        record = super()._do_get()
+        now = time.perf_counter()
+        if self.metrics is not None:
+            self.metrics.wait_time.observe(now - started)
+            if self._pre_ping and not record.fresh:
+                # Freshly opened connections are not pinged
+                record.info[PING_STARTED_KEY] = now
+        return record
+
+    def recreate(self):
+        # Keep metrics when the pool is rebuilt, e.g. by engine.dispose()
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        if self.metrics is not None:
+            self.metrics.pool = pool
+        return pool
+
+
+def instrument_pool(engine, name: str) -> PoolMetrics:
+    """
+    Attach metrics collection to an async engine's pool.
+
+    Args:
+        engine: AsyncEngine created with InstrumentedAsyncQueuePool
+        name: Name of the engine in the metrics report
+
+    Returns:
+        PoolMetrics: Metrics object updated by pool events
+    """
+    metrics = PoolMetrics(name)
+    pool = engine.sync_engine.pool
+    metrics.pool = pool
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        pool.metrics = metrics
+
+    @event.listens_for(pool, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        metrics.connects += 1
+
+    @event.listens_for(pool, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.checkouts += 1
+        ping_started = connection_record.info.pop(PING_STARTED_KEY, None)
+        if ping_started is not None:
+            metrics.pre_ping_time.observe(time.perf_counter() - ping_started)
+
+    @event.listens_for(pool, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.invalidations += 1
+
+    return metrics
@@ -0,0 +1,195 @@
+"""
+Component health monitoring for [PROJECT_NAME].
+
+Runs every registered health probe concurrently with per-probe timeouts and
+caches the combined report, so liveness and readiness endpoints can be
+polled at high frequency without hitting the database or other backends on
+every request.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+
+Probe = Callable[[], Awaitable[bool]]
+ProbeSource = Callable[[], Dict[str, Probe]]
+
+
+class ComponentHealth(BaseModel):
+    """Result of a single component health probe."""
+    status: str  # healthy, unhealthy
+    critical: bool = True
+    latency_ms: float = 0.0
+    error: Optional[str] = None
+
+
+class HealthReport(BaseModel):
+    """Combined health of all registered components."""
+    status: str  # healthy, degraded, unhealthy
+    checked_at: str
+    components: Dict[str, ComponentHealth] = {}
+
+    @property
+    def ready(self) -> bool:
+        """True if every critical component is healthy."""
+        return all(c.status == "healthy" for c in self.components.values() if c.critical)
+
+
+class HealthMonitor:
+    """
+    Runs registered health probes and caches the results.
+
+    Probes are registered individually or through sources, which are
+    re-evaluated on every refresh so components that come and go (such as
+    agents) are always covered. Concurrent callers share a single in-flight
+    refresh, and a background loop can keep the cache warm so requests never
+    wait on probes.
+    """
+
+    def __init__(self, cache_ttl: Optional[float] = None, probe_timeout: Optional[float] = None):
+        self.cache_ttl = cache_ttl if cache_ttl is not None else settings.health_cache_ttl
+        self.probe_timeout = probe_timeout if probe_timeout is not None else settings.health_probe_timeout
+        self._probes: Dict[str, Tuple[Probe, bool]] = {}
+        self._sources: Dict[str, Tuple[ProbeSource, bool]] = {}
+        self._report: Optional[HealthReport] = None
+        self._refreshed_at = 0.0
+        self._refresh: Optional[asyncio.Task] = None
+        self._loop_task: Optional[asyncio.Task] = None
+
+    def register(self, name: str, probe: Probe, critical: bool = True) -> None:
+        """
+        Register a health probe.
+
+        Args:
+            name: Component name shown in the report
+            probe: Async callable returning True if the component is healthy
+            critical: Whether readiness depends on this component
+        """
+        self._probes[name] = (probe, critical)
+
+    def register_source(self, name: str, source: ProbeSource, critical: bool = False) -> None:
+        """
+        Register a source of probes evaluated on every refresh.
+
+        Args:
+            name: Name of the source
+            source: Callable returning component name -> probe
+            critical: Whether readiness depends on these components
+        """
+        self._sources[name] = (source, critical)
+
+    def unregister(self, name: str) -> None:
+        """Remove a probe or probe source."""
+        self._probes.pop(name, None)
+        self._sources.pop(name, None)
+
+    async def get_report(self, max_age: Optional[float] = None) -> HealthReport:
+        """
+        Get the health report, refreshing it if the cache is stale.
+
+        Args:
+            max_age: Maximum acceptable age in seconds, defaults to the cache TTL
+
+        Returns:
+            HealthReport: Cached or freshly computed report
+        """
+        max_age = self.cache_ttl if max_age is None else max_age
+        if self._report is not None and time.monotonic() - self._refreshed_at <= max_age:
+            return self._report
+
+        if self._refresh is None or self._refresh.done():
+            self._refresh = asyncio.create_task(self._run_probes())
+        return await asyncio.shield(self._refresh)
+
+    @property
+    def cached_report(self) -> Optional[HealthReport]:
+        """Last computed report without triggering a refresh."""
+        return self._report
+
+    @property
+    def report_age(self) -> Optional[float]:
+        """Seconds since the last refresh, or None if never refreshed."""
+        if self._report is None:
+            return None
+        return time.monotonic() - self._refreshed_at
+
+    async def start(self) -> None:
+        """Start refreshing the cache in the background every cache TTL."""
+        if self._loop_task is None:
+            self._loop_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        """Stop the background refresh loop."""
+        if self._loop_task is not None:
+            self._loop_task.cancel()
+            await asyncio.gather(self._loop_task, return_exceptions=True)
+            self._loop_task = None
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await self.get_report(max_age=0)
+            await asyncio.sleep(self.cache_ttl)
+
+    async def _run_probes(self) -> HealthReport:
+        probes = dict(self._probes)
+        for source, critical in self._sources.values():
+            try:
+                probes.update({name: (probe, critical) for name, probe in source().items()})
+            except Exception as e:
+                print(f"Health probe source failed: {e}")
+
+        names = list(probes)
+        results = await asyncio.gather(*(self._run_probe(*probes[name]) for name in names))
+        components = dict(zip(names, results))
+
+        if all(c.status == "healthy" for c in components.values()):
+            status = "healthy"
+        elif all(c.status == "healthy" for c in components.values() if c.critical):
+            status = "degraded"
+        else:
+            status = "unhealthy"
+
+        self._report = HealthReport(
+            status=status,
+            checked_at=datetime.utcnow().isoformat() + "Z",
+            components=components,
+        )
+        self._refreshed_at = time.monotonic()
+        return self._report
+
+    async def _run_probe(self, probe: Probe, critical: bool) -> ComponentHealth:
+        started = time.perf_counter()
+        error = None
+        try:
+            healthy = bool(await asyncio.wait_for(probe(), timeout=self.probe_timeout))
+        except asyncio.TimeoutError:
+            healthy, error = False, f"timed out after {self.probe_timeout}s"
+        except Exception as e:
+            healthy, error = False, str(e)
+        return ComponentHealth(
+            status="healthy" if healthy else "unhealthy",
+            critical=critical,
+            latency_ms=round((time.perf_counter() - started) * 1000, 2),
+            error=error,
+        )
+
+
+async def check_redis_health() -> bool:
+    """Check Redis connectivity with a PING."""
+    import redis.asyncio as redis
+
+    client = redis.from_url(settings.redis_url)
+    try:
+        return bool(await client.ping())
+    finally:
+        await client.aclose()
+
+
+# Global health monitor instance
+health_monitor = HealthMonitor()
@@ -0,0 +1,294 @@
+"""
+Per-request profiling and a flight recorder of slow requests.
+
+A sampled request (or one sent with the ``X-Profile`` header and a valid
+``X-Admin-Token``) gets a
+RequestProfile in a context variable. Agent tasks, tool executions,
+workflow nodes (see app.core.telemetry) and database queries record their
+timings into it as stages. When the request completes, profiles slower
+than the threshold, and all header-requested ones, are kept in a bounded
+ring buffer served by the admin API.
+
+Requests that are not sampled pay one context variable lookup per stage.
+
+app.core.telemetry imports this module for every agent, tool and workflow
+class, so settings and SQLAlchemy are only imported when first needed.
+"""
+
+import random
+import secrets
+import threading
+import time
+import uuid
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_ID_HEADER = b"x-profile-id"
+ADMIN_TOKEN_HEADER = b"x-admin-token"
+
+
+def is_admin_token(token: Optional[str]) -> bool:
+    """Whether a token matches ADMIN_TOKEN; always False when none is configured."""
+    from app.core.config import settings
+
+    return bool(settings.admin_token and token and secrets.compare_digest(token, settings.admin_token))
+
+
+class ProfileStage(BaseModel):
+    """One timed stage of a request."""
+    kind: str  # e.g. tool.execute, agent.execute_task, db.query
+    name: str
+    start_ms: float  # offset from the start of the request
+    duration_ms: float
+    error: Optional[str] = None
+
+
+class RequestProfile(BaseModel):
+    """Timings of one profiled request."""
+    profile_id: str
+    method: str
+    path: str
+    started_at: datetime
+    duration_ms: float = 0.0
+    status_code: Optional[int] = None
+    forced: bool = False  # requested with the X-Profile and X-Admin-Token headers
+    stages: List[ProfileStage] = []
+    dropped_stages: int = 0
+
+    def summary(self) -> Dict[str, Any]:
+        """Request fields plus total time per stage kind, without the stages."""
+        totals: Dict[str, float] = {}
+        for stage in self.stages:
+            totals[stage.kind] = totals.get(stage.kind, 0.0) + stage.duration_ms
+        return {
+            **self.model_dump(exclude={"stages"}),
+            "stage_count": len(self.stages),
+            "stage_totals_ms": totals,
+        }
+
+
+class _ActiveProfile:
+    """Mutable profile state while its request is in progress."""
+
+    __slots__ = ("profile", "started", "max_stages")
+
+    def __init__(self, profile: RequestProfile, started: float, max_stages: int):
+        self.profile = profile
+        self.started = started
+        self.max_stages = max_stages
+
+
+_active_profile: ContextVar[Optional[_ActiveProfile]] = ContextVar("active_profile", default=None)
+
+
+def record_stage(kind: str, name: str, started: float, duration: float, error: Optional[str] = None) -> None:
+    """
+    Record a stage in the current request's profile, if it is being profiled.
+
+    Args:
+        kind: Stage type, e.g. ``tool.execute``
+        name: What ran, e.g. the tool ID
+        started: time.perf_counter() at the start of the stage
+        duration: Stage duration in seconds
+        error: Error type if the stage failed
+    """
+    active = _active_profile.get()
+    if active is None:
+        return
+    profile = active.profile
+    if len(profile.stages) >= active.max_stages:
+        profile.dropped_stages += 1
+        return
+    profile.stages.append(ProfileStage(
+        kind=kind,
+        name=name,
+        start_ms=(started - active.started) * 1000,
+        duration_ms=duration * 1000,
+        error=error,
+    ))
+
+
+def is_profiling() -> bool:
+    """Whether the current request is being profiled."""
+    return _active_profile.get() is not None
+
+
+class FlightRecorder:
+    """
+    Bounded ring buffer of recent slow (and explicitly requested) profiles.
+
+    Args:
+        capacity: Maximum profiles kept; the oldest are dropped first
+        slow_threshold: Minimum request duration in seconds to keep a sampled profile
+    """
+
+    def __init__(self, capacity: Optional[int] = None, slow_threshold: Optional[float] = None):
+        # Settings are read on first use; the global recorder is created at import
+        self._capacity = capacity
+        self._slow_threshold_ms = slow_threshold * 1000 if slow_threshold is not None else None
+        self._buffer: Optional[Deque[RequestProfile]] = None
+        self._lock = threading.Lock()
+        self.profiled = 0
+        self.recorded = 0
+
+    @property
+    def capacity(self) -> int:
+        if self._capacity is None:
+            from app.core.config import settings
+
+            self._capacity = settings.profiling_max_profiles
+        return self._capacity
+
+    @property
+    def slow_threshold_ms(self) -> float:
+        if self._slow_threshold_ms is None:
+            from app.core.config import settings
+
+            self._slow_threshold_ms = settings.profiling_slow_threshold_ms
+        return self._slow_threshold_ms
+
+    @property
+    def _profiles(self) -> Deque[RequestProfile]:
+        if self._buffer is None:
+            self._buffer = deque(maxlen=self.capacity)
+        return self._buffer
+
+    def offer(self, profile: RequestProfile) -> bool:
+        """Keep a finished profile if it was slow or requested."""
+        self.profiled += 1
+        if not profile.forced and profile.duration_ms < self.slow_threshold_ms:
+            return False
+        with self._lock:
+            self._profiles.append(profile)
+        self.recorded += 1
+        return True
+
+    def list(self, limit: Optional[int] = None) -> List[RequestProfile]:
+        """Kept profiles, slowest first."""
+        with self._lock:
+            profiles = sorted(self._profiles, key=lambda p: p.duration_ms, reverse=True)
+        return profiles[:limit] if limit else profiles
+
+    def get(self, profile_id: str) -> Optional[RequestProfile]:
+        """Get a kept profile by ID."""
+        with self._lock:
+            for profile in self._profiles:
+                if profile.profile_id == profile_id:
+                    return profile
+        return None
+
+    def clear(self) -> None:
+        """Drop all kept profiles."""
+        with self._lock:
+            self._profiles.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counts of profiled and kept requests."""
+        return {
+            "profiled": self.profiled,
+            "recorded": self.recorded,
+            "kept": len(self._profiles),
+            "capacity": self.capacity,
+            "slow_threshold_ms": self.slow_threshold_ms,
+        }
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware profiling sampled requests into a FlightRecorder.
+
+    A request is profiled if it carries the ``X-Profile`` header with a
+    valid ``X-Admin-Token`` or is picked at ``sample_rate``; otherwise any
+    client could fill the recorder with forced profiles. Profiled responses get an ``X-Profile-Id``
+    header for looking the profile up in the admin API. Other requests are
+    passed straight through.
+
+    Usage:
+        app.add_middleware(ProfilingMiddleware, recorder=flight_recorder)
+    """
+
+    def __init__(self, app, recorder: "FlightRecorder", sample_rate: Optional[float] = None, max_stages: Optional[int] = None):
+        from app.core.config import settings
+
+        self.app = app
+        self.recorder = recorder
+        self.sample_rate = settings.profiling_sample_rate if sample_rate is None else sample_rate
+        self.max_stages = max_stages or settings.profiling_max_stages
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        headers = dict(scope["headers"])
+        forced = PROFILE_HEADER in headers and is_admin_token(headers.get(ADMIN_TOKEN_HEADER, b"").decode("latin-1"))
+        if not forced and (self.sample_rate <= 0 or random.random() >= self.sample_rate):
+            return await self.app(scope, receive, send)
+
+        profile = RequestProfile(
+            profile_id=uuid.uuid4().hex,
+            method=scope["method"],
+            path=scope["path"],
+            started_at=datetime.utcnow(),
+            forced=forced,
+        )
+        started = time.perf_counter()
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                profile.status_code = message["status"]
+                message = {
+                    **message,
+                    "headers": [*message.get("headers", []), (PROFILE_ID_HEADER, profile.profile_id.encode())],
+                }
+            await send(message)
+
+        token = _active_profile.set(_ActiveProfile(profile, started, self.max_stages))
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            _active_profile.reset(token)
+            profile.duration_ms = (time.perf_counter() - started) * 1000
+            self.recorder.offer(profile)
+
+
+def instrument_engine(engine) -> None:
+    """Record the queries of profiled requests as ``db.query`` stages."""
+    from sqlalchemy import event
+
+    sync_engine = getattr(engine, "sync_engine", engine)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if _active_profile.get() is not None:
+            conn.info.setdefault("profile_query_started", []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("profile_query_started")
+        if starts:
+            started = starts.pop()
+            record_stage("db.query", " ".join(statement.split())[:120], started, time.perf_counter() - started)
+
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(exception_context):
+        conn = exception_context.connection
+        starts = conn.info.get("profile_query_started") if conn is not None else None
+        if starts:
+            started = starts.pop()
+            statement = exception_context.statement or ""
+            record_stage(
+                "db.query",
+                " ".join(statement.split())[:120],
+                started,
+                time.perf_counter() - started,
+                error=type(exception_context.original_exception).__name__,
+            )
+
+
+# Global flight recorder instance
+flight_recorder = FlightRecorder()
@@ -0,0 +1,89 @@
+"""
+Fast JSON serialization for API responses and result models.
+
+FastAPI serializes a returned value by validating it against the response
+model, converting it to JSON-compatible Python objects and then encoding
+those with the json module, so a large ToolResult or WorkflowExecution is
+walked three times. ``dumps`` encodes models directly instead: with the
+optional orjson package, models are handed to orjson as shallow field
+views (no copies of ``data`` or ``result``); without it, pydantic's own
+serializer is used. Endpoints returning large payloads should return a
+FastJSONResponse themselves, which skips FastAPI's serialization step.
+
+Usage:
+    @router.get("/results/{result_id}", response_model=ToolResult)
+    async def get_result(result_id: str) -> FastJSONResponse:
+        return FastJSONResponse(await load_result(result_id))
+"""
+
+import functools
+from typing import Any, Dict
+
+import pydantic_core
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+@functools.lru_cache(maxsize=None)
+def _orjson_module():
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+# Model classes whose fields can be serialized as they are, by class
+_plain_models: Dict[type, bool] = {}
+
+
+def _is_plain(cls: type) -> bool:
+    """Whether a model has no aliases, excluded or computed fields, or custom serializers."""
+    plain = _plain_models.get(cls)
+    if plain is None:
+        decorators = cls.__pydantic_decorators__
+        plain = _plain_models[cls] = not (
+            cls.model_computed_fields
+            or decorators.field_serializers
+            or decorators.model_serializers
+            or any(
+                field.alias or field.serialization_alias or field.exclude
+                for field in cls.model_fields.values()
+            )
+        )
+    return plain
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        if _is_plain(type(obj)):
+            # Field values by reference; orjson serializes them in place
+            return {name: getattr(obj, name) for name in type(obj).model_fields}
+        return obj.__pydantic_serializer__.to_python(obj, mode="json", by_alias=True)
+    return pydantic_core.to_jsonable_python(obj)
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encode a value, including pydantic models, as compact UTF-8 JSON.
+
+    Models are serialized by alias, as FastAPI does, and UTC datetimes end
+    in ``Z`` as pydantic writes them. Values orjson does not support
+    natively (e.g. Decimal) fall back to pydantic's conversions.
+    """
+    orjson = _orjson_module()
+    if orjson is None:
+        return pydantic_core.to_json(obj, by_alias=True)
+    return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+
+
+def json_backend() -> str:
+    """Name of the JSON encoder in use."""
+    return "orjson" if _orjson_module() is not None else "pydantic"
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded with ``dumps``; accepts pydantic models as content."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,415 @@
+"""
+Pre-fork multi-worker server.
+
+The master process binds the listening socket, optionally imports the app
+(so workers share its memory pages copy-on-write and start quickly) and
+forks one uvicorn worker per CPU. Workers share nothing but the socket:
+database engines inherited from the master are discarded in each worker
+(see app.core.database), and the app's lifespan (LLM clients, embedding
+service, telemetry) runs separately in every worker.
+
+Signals to the master:
+    SIGTERM, SIGINT  graceful shutdown: workers finish in-flight requests
+    SIGHUP           rolling restart: each worker is replaced by a new one,
+                     which must be ready before the old one is stopped, so
+                     the socket keeps being served throughout
+
+With preloading a rolling restart reuses the master's imported code;
+disable SERVER_PRELOAD to have rolling restarts re-import the app (modules
+the master itself imports, such as app.core.config, are still inherited).
+
+State kept in memory is per worker. Features that own such state refuse
+to run in more than one worker (see ``single_worker_features``), and the
+worker count defaults to one when any of them is configured. Endpoints
+that report process-local state answer for whichever worker serves the
+request: /api/v1/tasks/stats, /api/v1/admin/profiles, /api/v1/llm/stats,
+/health/startup and /health/database/pool.
+
+Usage:
+    python -m app.core.server main:app --workers 4
+"""
+
+import os
+import select
+import signal
+import socket
+import sys
+import time
+import traceback
+from typing import Any, Dict, List, Optional
+
+import uvicorn
+from uvicorn.importer import import_from_string
+
+from app.core.config import settings
+from app.core.startup import startup_report
+
+
+MASTER_SIGNALS = (signal.SIGTERM, signal.SIGINT, signal.SIGHUP, signal.SIGCHLD)
+
+# Workers failing before they are ready this many times in a row stop the master
+MAX_BOOT_FAILURES = 5
+
+
+def available_cpus() -> int:
+    """
+    CPUs this process may use.
+
+    Honours CPU affinity and a cgroup v2 CPU quota (container CPU limits),
+    rounding the quota up to whole CPUs.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(1, -(-int(quota) // int(period))))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+def single_worker_features() -> List[str]:
+    """Configured features that keep their state in one process."""
+    features = []
+    if settings.task_queue_backend in ("local", "process"):
+        features.append(f"TASK_QUEUE_BACKEND={settings.task_queue_backend} (queued tasks)")
+    if settings.vector_index_dir:
+        # Every worker would map and append to the same index files
+        features.append("VECTOR_INDEX_DIR (vector and keyword index files)")
+    return features
+
+
+class _Worker:
+    """Bookkeeping for one forked worker."""
+
+    def __init__(self, pid: int, ready_fd: int):
+        self.pid = pid
+        self.ready_fd: Optional[int] = ready_fd
+        self.ready = False
+        self.stopping = False
+        self.started_at = time.monotonic()
+
+
+class _WorkerServer(uvicorn.Server):
+    """uvicorn server that tells the master once startup has completed."""
+
+    def __init__(self, config: uvicorn.Config, ready_fd: int):
+        super().__init__(config)
+        self.ready_fd = ready_fd
+
+    async def startup(self, sockets=None) -> None:
+        await super().startup(sockets=sockets)
+        if not self.should_exit:
+            os.write(self.ready_fd, b"1")
+        os.close(self.ready_fd)
+
+
+class PreforkServer:
+    """
+    Runs an ASGI app in several forked uvicorn workers sharing one socket.
+
+    Args:
+        app: Import string of the ASGI app, e.g. ``"main:app"``
+        host: Interface to bind
+        port: Port to bind
+        workers: Number of worker processes; defaults to SERVER_WORKERS, or
+            available CPUs unless a single-worker feature is configured
+        preload: Import the app in the master before forking
+        graceful_timeout: Seconds a worker gets to finish requests (or to
+            become ready) before it is killed
+        uvicorn_options: Extra uvicorn.Config options for the workers
+    """
+
+    def __init__(
+        self,
+        app: str,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        workers: Optional[int] = None,
+        preload: Optional[bool] = None,
+        graceful_timeout: Optional[float] = None,
+        uvicorn_options: Optional[Dict[str, Any]] = None,
+    ):
+        self.app = app
+        self.host = host or settings.host
+        self.port = port or settings.port
+        workers = workers or settings.server_workers
+        features = single_worker_features()
+        if workers is None:
+            workers = 1 if features else available_cpus()
+        elif workers > 1 and features:
+            raise ValueError(
+                f"{workers} workers cannot share state kept in one process by: {', '.join(features)}; "
+                "use one worker, or the celery task queue backend without VECTOR_INDEX_DIR"
+            )
+        self.worker_count = workers
+        self.single_worker_features = features
+        self.preload = settings.server_preload if preload is None else preload
+        self.graceful_timeout = graceful_timeout or settings.server_graceful_timeout
+        self.uvicorn_options = uvicorn_options or {}
+
+        self._socket: Optional[socket.socket] = None
+        self._loaded_app: Any = None
+        self._workers: Dict[int, _Worker] = {}
+        self._signals: List[int] = []
+        self._shutting_down = False
+        self._boot_failures = 0
+
+    def run(self) -> int:
+        """
+        Serve until shut down.
+
+        Returns:
+            int: Exit status for the master process
+        """
+        if not hasattr(os, "fork"):
+            raise RuntimeError("The pre-fork server requires a POSIX platform")
+
+        self._socket = socket.create_server((self.host, self.port), backlog=2048)
+        self._socket.set_inheritable(True)
+        # Inherited by workers, so the app's single-worker checks see the real count
+        settings.server_workers = self.worker_count
+        if self.preload:
+            self._loaded_app = import_from_string(self.app)
+
+        wakeup_read, wakeup_write = os.pipe()
+        os.set_blocking(wakeup_read, False)
+        os.set_blocking(wakeup_write, False)
+        signal.set_wakeup_fd(wakeup_write)
+        for sig in MASTER_SIGNALS:
+            signal.signal(sig, self._on_signal)
+        self._wakeup_fds = (wakeup_read, wakeup_write)
+
+        print(f"🚀 Master {os.getpid()} serving {self.app} on {self.host}:{self.port} "
+              f"with {self.worker_count} workers (preload={'on' if self.preload else 'off'})")
+        if self.worker_count == 1 and self.single_worker_features:
+            print(f"ℹ️  One worker: state is kept in process by {', '.join(self.single_worker_features)}")
+        try:
+            for _ in range(self.worker_count):
+                self._spawn()
+            while not self._shutting_down:
+                self._wait(timeout=1.0)
+                self._handle_signals()
+                if self._boot_failures >= MAX_BOOT_FAILURES:
+                    print(f"❌ Workers failed to start {self._boot_failures} times in a row; stopping")
+                    self._stop_all()
+                    return 1
+            self._stop_all()
+            return 0
+        finally:
+            self._socket.close()
+            signal.set_wakeup_fd(-1)
+            for fd in self._wakeup_fds:
+                os.close(fd)
+
+    # Master
+
+    def _on_signal(self, signum, frame) -> None:
+        self._signals.append(signum)
+
+    def _wait(self, timeout: float) -> None:
+        """Sleep until a signal arrives, a worker reports ready, or the timeout."""
+        fds = [self._wakeup_fds[0]] + [w.ready_fd for w in self._workers.values() if w.ready_fd is not None]
+        try:
+            readable, _, _ = select.select(fds, [], [], timeout)
+        except InterruptedError:
+            return
+        for fd in readable:
+            if fd == self._wakeup_fds[0]:
+                try:
+                    os.read(fd, 4096)
+                except BlockingIOError:
+                    pass
+            else:
+                self._read_ready(fd)
+
+    def _read_ready(self, fd: int) -> None:
+        worker = next(w for w in self._workers.values() if w.ready_fd == fd)
+        data = os.read(fd, 1)
+        os.close(fd)
+        worker.ready_fd = None
+        if data:
+            worker.ready = True
+            self._boot_failures = 0
+
+    def _handle_signals(self) -> None:
+        while self._signals:
+            signum = self._signals.pop(0)
+            if signum == signal.SIGCHLD:
+                self._reap()
+            elif signum == signal.SIGHUP:
+                self._rolling_restart()
+            else:
+                self._shutting_down = True
+        self._reap()
+
+    def _reap(self) -> None:
+        """Collect exited workers and replace those that stopped unexpectedly."""
+        while self._workers:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            worker = self._workers.pop(pid, None)
+            if worker is None:
+                continue
+            if worker.ready_fd is not None:
+                os.close(worker.ready_fd)
+            if worker.stopping or self._shutting_down:
+                continue
+            if not worker.ready:
+                self._boot_failures += 1
+            print(f"⚠️  Worker {pid} exited unexpectedly ({self._describe(status)}); restarting")
+            self._spawn()
+
+    def _rolling_restart(self) -> None:
+        """Replace workers one at a time, starting each replacement first."""
+        print(f"🔄 Rolling restart of {len(self._workers)} workers")
+        for old in [w for w in self._workers.values() if not w.stopping]:
+            if self._shutting_down:
+                return
+            new = self._spawn()
+            if not self._wait_until(lambda: new.ready or new.pid not in self._workers):
+                print(f"⚠️  Replacement worker {new.pid} did not become ready; keeping worker {old.pid}")
+                self._stop(new)
+                return
+            if new.pid not in self._workers:
+                print(f"⚠️  Replacement worker exited during startup; keeping worker {old.pid}")
+                return
+            self._stop(old)
+        print("✅ Rolling restart complete")
+
+    def _wait_until(self, condition) -> bool:
+        """Keep serving master duties until condition() holds or the timeout passes."""
+        deadline = time.monotonic() + self.graceful_timeout
+        while not condition():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._wait(min(remaining, 0.5))
+            # Only reap here; other signals are handled after the restart step
+            if signal.SIGCHLD in self._signals:
+                self._signals = [s for s in self._signals if s != signal.SIGCHLD]
+                self._reap()
+            if any(s in (signal.SIGTERM, signal.SIGINT) for s in self._signals):
+                self._shutting_down = True
+                return condition()
+        return True
+
+    def _stop(self, worker: _Worker) -> None:
+        """Gracefully stop one worker, killing it after the graceful timeout."""
+        worker.stopping = True
+        self._signal(worker.pid, signal.SIGTERM)
+        if not self._wait_until(lambda: worker.pid not in self._workers):
+            self._signal(worker.pid, signal.SIGKILL)
+            self._wait_until(lambda: worker.pid not in self._workers)
+
+    def _stop_all(self) -> None:
+        """Gracefully stop every worker."""
+        print(f"🔄 Stopping {len(self._workers)} workers...")
+        self._shutting_down = True
+        for worker in self._workers.values():
+            worker.stopping = True
+            self._signal(worker.pid, signal.SIGTERM)
+        deadline = time.monotonic() + self.graceful_timeout
+        while self._workers and time.monotonic() < deadline:
+            self._wait(0.2)
+            self._reap()
+        for pid in list(self._workers):
+            self._signal(pid, signal.SIGKILL)
+        while self._workers:
+            try:
+                pid, _ = os.waitpid(-1, 0)
+            except ChildProcessError:
+                break
+            self._workers.pop(pid, None)
+        print("✅ All workers stopped")
+
+    @staticmethod
+    def _signal(pid: int, signum: int) -> None:
+        try:
+            os.kill(pid, signum)
+        except ProcessLookupError:
+            pass
+
+    @staticmethod
+    def _describe(status: int) -> str:
+        if os.WIFSIGNALED(status):
+            return f"signal {signal.Signals(os.WTERMSIG(status)).name}"
+        return f"exit code {os.waitstatus_to_exitcode(status)}"
+
+    def _spawn(self) -> _Worker:
+        ready_read, ready_write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(ready_read)
+            code = 1
+            try:
+                code = self._run_worker(ready_write)
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                os._exit(code)
+        os.close(ready_write)
+        worker = _Worker(pid, ready_read)
+        self._workers[pid] = worker
+        return worker
+
+    # Worker
+
+    def _run_worker(self, ready_fd: int) -> int:
+        """Serve requests in a forked worker until told to stop."""
+        # Master signal handling must not leak into the worker
+        signal.set_wakeup_fd(-1)
+        for fd in self._wakeup_fds:
+            os.close(fd)
+        for sig in MASTER_SIGNALS:
+            signal.signal(sig, signal.SIG_DFL)
+        # Time to ready counts from the fork, not from the master's start
+        startup_report.started_at = time.perf_counter()
+
+        config = uvicorn.Config(
+            self._loaded_app if self.preload else self.app,
+            host=self.host,
+            port=self.port,
+            timeout_graceful_shutdown=self.graceful_timeout,
+            **self.uvicorn_options,
+        )
+        server = _WorkerServer(config, ready_fd)
+        server.run(sockets=[self._socket])
+        return 0 if server.started else 1
+
+
+def run_server(app: str, **kwargs) -> None:
+    """Run the pre-fork server and exit with its status."""
+    sys.exit(PreforkServer(app, **kwargs).run())
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the app in pre-forked uvicorn workers")
+    parser.add_argument("app", nargs="?", default="main:app", help="ASGI app import string")
+    parser.add_argument("--host", help="Interface to bind (default: HOST)")
+    parser.add_argument("--port", type=int, help="Port to bind (default: PORT)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: SERVER_WORKERS, else available CPUs or 1, see single_worker_features)")
+    parser.add_argument("--no-preload", action="store_true", help="Import the app in each worker instead of the master")
+    parser.add_argument("--log-level", default=settings.log_level.lower())
+    args = parser.parse_args()
+
+    # The app import string is resolved relative to the working directory
+    sys.path.insert(0, os.getcwd())
+    run_server(
+        args.app,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        preload=False if args.no_preload else None,
+        uvicorn_options={"log_level": args.log_level},
+    )
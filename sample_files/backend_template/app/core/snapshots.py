@@ -0,0 +1,164 @@
+"""
+Versioned, precompressed JSON snapshots served with ETags.
+
+A snapshot is built once per version of its source (e.g. a registry) and
+kept as serialized JSON plus lazily compressed gzip and brotli bodies.
+Responses carry a strong ETag per encoding, so polling clients that send
+If-None-Match get an empty 304 and the server does no serialization or
+compression work for unchanged data.
+"""
+
+import functools
+import gzip
+import hashlib
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import Request, Response
+
+from app.core.serialization import dumps
+
+
+_ENCODINGS = ("br", "gzip")
+
+
+@functools.lru_cache(maxsize=None)
+def _brotli_module():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+class Snapshot:
+    """Serialized JSON body with its version, ETag and compressed variants."""
+
+    def __init__(self, version: Any, data: Any):
+        self.version = version
+        self.body = dumps(data)
+        self.digest = hashlib.sha256(self.body).hexdigest()[:32]
+        self._compressed: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def etag(self, encoding: Optional[str] = None) -> str:
+        """Strong ETag; each encoding is a distinct representation."""
+        return f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+
+    def encoded(self, encoding: Optional[str]) -> bytes:
+        """Body in the given content encoding, compressed once and cached."""
+        if encoding is None:
+            return self.body
+        body = self._compressed.get(encoding)
+        if body is None:
+            with self._lock:
+                body = self._compressed.get(encoding)
+                if body is None:
+                    if encoding == "br":
+                        body = _brotli_module().compress(self.body, quality=11)
+                    else:
+                        body = gzip.compress(self.body, compresslevel=9, mtime=0)
+                    self._compressed[encoding] = body
+        return body
+
+
+class SnapshotCache:
+    """
+    Rebuilds a snapshot only when its source version changes.
+
+    Args:
+        build: Returns the JSON-serializable data for the snapshot
+        version: Returns the source's current version, e.g. a registry's
+            change counter; compared on every get, so it must be cheap
+
+    Usage:
+        catalog = SnapshotCache(
+            lambda: [tool.get_schema() for tool in tool_registry.list_tools()],
+            lambda: tool_registry.version,
+        )
+        snapshot = catalog.get()
+    """
+
+    def __init__(self, build: Callable[[], Any], version: Callable[[], Any]):
+        self.build = build
+        self.version = version
+        self._snapshot: Optional[Snapshot] = None
+        self._lock = threading.Lock()
+        self.builds = 0
+
+    def get(self) -> Snapshot:
+        """Current snapshot, rebuilt if the source has changed."""
+        version = self.version()
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.version != version:
+            with self._lock:
+                snapshot = self._snapshot
+                if snapshot is None or snapshot.version != version:
+                    snapshot = self._snapshot = Snapshot(version, self.build())
+                    self.builds += 1
+        return snapshot
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick brotli or gzip from an Accept-Encoding header, preferring brotli.
+
+    Returns:
+        Optional[str]: "br", "gzip", or None for an uncompressed response
+    """
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    for encoding in _ENCODINGS:
+        if encoding == "br" and _brotli_module() is None:
+            continue
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+def _etag_matches(if_none_match: str, snapshot: Snapshot) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return any(snapshot.etag(encoding) in tags for encoding in (None, *_ENCODINGS))
+
+
+def snapshot_response(request: Request, snapshot: Snapshot, cache_control: str = "no-cache") -> Response:
+    """
+    Serve a snapshot with conditional GET and content negotiation.
+
+    ``no-cache`` lets clients keep the response but revalidate it on every
+    use, which costs a 304 while the snapshot is unchanged.
+
+    Args:
+        request: Incoming request (If-None-Match and Accept-Encoding are used)
+        snapshot: Snapshot to serve
+        cache_control: Cache-Control header value
+
+    Returns:
+        Response: 304 if the client's copy is current, otherwise the body
+    """
+    encoding = negotiate_encoding(request.headers.get("accept-encoding", ""))
+    headers = {
+        "ETag": snapshot.etag(encoding),
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, snapshot):
+        return Response(status_code=304, headers=headers)
+
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=snapshot.encoded(encoding), media_type="application/json", headers=headers)
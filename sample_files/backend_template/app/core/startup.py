@@ -0,0 +1,113 @@
+"""
+Startup timing and background warm-up for [PROJECT_NAME].
+
+Records how long each startup phase takes so cold-start regressions are
+visible, and warms up deferred components after the application is ready.
+"""
+
+import asyncio
+import importlib
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+class StartupReport:
+    """
+    Timings of startup phases, measured from when this module is imported.
+
+    Phases recorded after the application reports ready (for example
+    background warm-up) are kept separately so the time to readiness is not
+    inflated by work that no longer blocks it.
+    """
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.ready_at: Optional[float] = None
+        self.phases: Dict[str, float] = {}
+        self.warmup_phases: Dict[str, float] = {}
+        self.warmup_errors: Dict[str, str] = {}
+        self.warmup_complete = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Time a block of startup work.
+
+        Args:
+            name: Name of the phase in the report
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def record(self, name: str, duration: float) -> None:
+        """Record the duration of a phase in seconds."""
+        if self.ready_at is None:
+            self.phases[name] = duration
+        else:
+            self.warmup_phases[name] = duration
+
+    def mark_ready(self) -> None:
+        """Mark the application as ready to serve traffic."""
+        self.ready_at = time.perf_counter()
+
+    @property
+    def time_to_ready(self) -> Optional[float]:
+        """Seconds from import to readiness, or None if not ready yet."""
+        if self.ready_at is None:
+            return None
+        return self.ready_at - self.started_at
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the report as a JSON-serialisable dict (durations in ms)."""
+        return {
+            "time_to_ready_ms": None if self.time_to_ready is None else round(self.time_to_ready * 1000, 2),
+            "phases_ms": {name: round(d * 1000, 2) for name, d in self.phases.items()},
+            "warmup_phases_ms": {name: round(d * 1000, 2) for name, d in self.warmup_phases.items()},
+            "warmup_errors": dict(self.warmup_errors),
+            "warmup_complete": self.warmup_complete,
+        }
+
+    def print_summary(self) -> None:
+        """Print phase timings to stdout."""
+        print(f"⏱️  Ready in {self.time_to_ready * 1000:.1f} ms")
+        for name, duration in self.phases.items():
+            print(f"  {name}: {duration * 1000:.1f} ms")
+
+
+async def warm_up(tasks: List[Callable[[], Any]], modules: List[str], report: "StartupReport") -> None:
+    """
+    Run deferred initialization in the background.
+
+    Blocking callables and module imports run in a worker thread so the
+    event loop keeps serving requests. Failures are recorded in the report
+    rather than raised.
+
+    Args:
+        tasks: Blocking callables to run, timed under their function name
+        modules: Module names to import ahead of first use
+        report: Report to record timings in
+    """
+    for task in tasks:
+        name = getattr(task, "__name__", repr(task))
+        try:
+            with report.phase(name):
+                await asyncio.to_thread(task)
+        except Exception as e:
+            report.warmup_errors[name] = str(e)
+
+    for module in modules:
+        try:
+            with report.phase(f"import {module}"):
+                await asyncio.to_thread(importlib.import_module, module)
+        except Exception as e:
+            report.warmup_errors[f"import {module}"] = str(e)
+
+    report.warmup_complete = True
+
+
+# Global startup report, created as early as possible during import
+startup_report = StartupReport()
@@ -0,0 +1,146 @@
+"""
+Span and metric instrumentation for agents, tools and workflows.
+
+The IAgent, ITool and IWorkflow base classes wrap their subclasses'
+``execute_task``, ``execute`` and ``execute_node`` implementations with an
+Operation, which opens a span and records a latency histogram, an
+in-flight gauge and an error counter for every call, plus a stage in the
+request's profile when the request is being profiled (app.core.profiling).
+
+Spans and instruments come from the global OpenTelemetry providers.
+Until ``enable_tracing`` is called (by ``setup_telemetry``) no spans are
+opened at all, and span attributes are only built for sampled spans, so
+the cost without tracing is a few metric updates per call.
+"""
+
+import functools
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, FrozenSet, Optional
+
+from opentelemetry import metrics, trace
+from opentelemetry.trace import Status, StatusCode
+
+from app.core.profiling import record_stage
+
+
+tracer = trace.get_tracer("app")
+meter = metrics.get_meter("app")
+
+# Operations already being recorded in the current task, so a subclass
+# calling super() or a wrapper around the same component is recorded once
+_active_operations: ContextVar[FrozenSet[tuple]] = ContextVar("active_operations", default=frozenset())
+
+# Even a no-op span costs several microseconds, so none are started until
+# a tracer provider is installed
+_tracing_enabled = False
+
+
+def enable_tracing(enabled: bool = True) -> None:
+    """Start (or stop) opening spans for instrumented operations."""
+    global _tracing_enabled
+    _tracing_enabled = enabled
+
+
+class Operation:
+    """
+    A traced and metered operation, e.g. a tool execution.
+
+    Records ``<metric_prefix>.duration`` (seconds), ``<metric_prefix>.active``
+    and ``<metric_prefix>.errors`` with the attributes from ``attributes``,
+    which should be low-cardinality (component and node IDs, not task IDs).
+
+    Args:
+        span_name: Name of the span opened per call
+        metric_prefix: Prefix of the metric instrument names
+        description: What is being measured, for instrument descriptions
+        attributes: (self, *args, **kwargs) -> metric and span attributes
+        span_attributes: (self, *args, **kwargs) -> extra span-only
+            attributes, only called for sampled spans
+        error_type: result -> error type for calls that return a failure
+            instead of raising, or None
+    """
+
+    def __init__(
+        self,
+        span_name: str,
+        metric_prefix: str,
+        description: str,
+        attributes: Callable[..., Dict[str, Any]],
+        span_attributes: Optional[Callable[..., Dict[str, Any]]] = None,
+        error_type: Optional[Callable[[Any], Optional[str]]] = None,
+    ):
+        self.span_name = span_name
+        self.attributes = attributes
+        self.span_attributes = span_attributes
+        self.error_type = error_type
+        self.duration = meter.create_histogram(
+            f"{metric_prefix}.duration", unit="s", description=f"Duration of {description}"
+        )
+        self.active = meter.create_up_down_counter(
+            f"{metric_prefix}.active", unit="{call}", description=f"{description.capitalize()} in progress"
+        )
+        self.errors = meter.create_counter(
+            f"{metric_prefix}.errors", unit="{error}", description=f"Failed {description}"
+        )
+
+    def wrap(self, func: Callable) -> Callable:
+        """Instrument an async method."""
+        if getattr(func, "__instrumented__", False):
+            return func
+
+        @functools.wraps(func)
+        async def wrapper(instance, *args, **kwargs):
+            attributes = self.attributes(instance, *args, **kwargs)
+            key = (self.span_name, *attributes.values())
+            active = _active_operations.get()
+            if key in active:
+                return await func(instance, *args, **kwargs)
+
+            token = _active_operations.set(active | {key})
+            self.active.add(1, attributes)
+            started = time.perf_counter()
+            error_type = None
+            try:
+                if not _tracing_enabled:
+                    result = await func(instance, *args, **kwargs)
+                    if self.error_type is not None:
+                        error_type = self.error_type(result)
+                    return result
+                with tracer.start_as_current_span(self.span_name) as span:
+                    recording = span.is_recording()
+                    if recording:
+                        span.set_attributes(attributes)
+                        if self.span_attributes is not None:
+                            span.set_attributes(self.span_attributes(instance, *args, **kwargs))
+                    result = await func(instance, *args, **kwargs)
+                    if self.error_type is not None:
+                        error_type = self.error_type(result)
+                        if error_type is not None and recording:
+                            span.set_status(Status(StatusCode.ERROR, error_type))
+                    return result
+            except BaseException as e:
+                error_type = type(e).__name__
+                raise
+            finally:
+                _active_operations.reset(token)
+                self.active.add(-1, attributes)
+                elapsed = time.perf_counter() - started
+                self.duration.record(elapsed, attributes)
+                record_stage(self.span_name, "/".join(str(v) for v in attributes.values() if v), started, elapsed, error_type)
+                if error_type is not None:
+                    self.errors.add(1, {**attributes, "error.type": error_type})
+
+        wrapper.__instrumented__ = True
+        return wrapper
+
+    def instrument(self, cls: type, method: str) -> None:
+        """Instrument ``cls.method`` if the class itself implements it."""
+        func = cls.__dict__.get(method)
+        if func is not None and not getattr(func, "__isabstractmethod__", False):
+            setattr(cls, method, self.wrap(func))
+
+
+def first_argument(args: tuple, kwargs: Dict[str, Any], name: str) -> Any:
+    """The first argument of a call, passed positionally or by name."""
+    return args[0] if args else kwargs.get(name)
@@ -0,0 +1,216 @@
+"""
+Trace sampling and span export configuration.
+
+Head sampling keeps a fixed ratio of traces, chosen at the root and
+followed by child spans and downstream services (parent-based). With tail
+sampling enabled, spans of traces the ratio dropped are still recorded and
+buffered until their local root span ends; the whole trace is exported if
+any span failed or the root took longer than the latency threshold, and
+discarded otherwise. This keeps every slow or failed request at the cost of
+recording (but not exporting) the rest.
+
+The OpenTelemetry SDK is imported here rather than in app.core.telemetry so
+that it is only loaded when tracing is actually set up.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Sequence
+
+from opentelemetry.context import Context
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SpanExporter
+from opentelemetry.sdk.trace.sampling import (
+    Decision,
+    ParentBased,
+    Sampler,
+    SamplingResult,
+    TraceIdRatioBased,
+)
+from opentelemetry.trace import Link, SpanContext, SpanKind, StatusCode, TraceFlags, get_current_span
+from opentelemetry.util.types import Attributes
+
+from app.core.config import settings
+
+
+class RecordOnlySampler(Sampler):
+    """Records every span without sampling it, for tail sampling to decide later."""
+
+    def should_sample(
+        self,
+        parent_context: Optional[Context],
+        trace_id: int,
+        name: str,
+        kind: Optional[SpanKind] = None,
+        attributes: Attributes = None,
+        links: Optional[Sequence[Link]] = None,
+        trace_state=None,
+    ) -> SamplingResult:
+        parent = get_current_span(parent_context).get_span_context()
+        return SamplingResult(Decision.RECORD_ONLY, attributes, parent.trace_state if parent.is_valid else None)
+
+    def get_description(self) -> str:
+        return "RecordOnlySampler"
+
+
+class RatioOrRecordSampler(Sampler):
+    """Samples a ratio of root spans and records the rest for tail sampling."""
+
+    def __init__(self, ratio: float):
+        self._ratio = TraceIdRatioBased(ratio)
+        self._record = RecordOnlySampler()
+
+    def should_sample(self, parent_context, trace_id, name, kind=None, attributes=None, links=None, trace_state=None):
+        result = self._ratio.should_sample(parent_context, trace_id, name, kind, attributes, links, trace_state)
+        if result.decision == Decision.RECORD_AND_SAMPLE:
+            return result
+        return self._record.should_sample(parent_context, trace_id, name, kind, attributes, links, trace_state)
+
+    def get_description(self) -> str:
+        return f"RatioOrRecordSampler{{{self._ratio.rate}}}"
+
+
+def build_sampler(ratio: float, tail_sampling: bool) -> Sampler:
+    """
+    Build a parent-based sampler keeping ``ratio`` of new traces.
+
+    With ``tail_sampling`` the spans of unsampled traces are recorded
+    instead of dropped, for TailSamplingSpanProcessor.
+    """
+    if not tail_sampling:
+        return ParentBased(TraceIdRatioBased(ratio))
+    record = RecordOnlySampler()
+    return ParentBased(
+        RatioOrRecordSampler(ratio),
+        remote_parent_not_sampled=record,
+        local_parent_not_sampled=record,
+    )
+
+
+def _as_sampled(span: ReadableSpan) -> ReadableSpan:
+    """Copy of a recorded span flagged as sampled, so exporters accept it."""
+    context = span.context
+    return ReadableSpan(
+        name=span.name,
+        context=SpanContext(
+            context.trace_id,
+            context.span_id,
+            context.is_remote,
+            TraceFlags(TraceFlags.SAMPLED),
+            context.trace_state,
+        ),
+        parent=span.parent,
+        resource=span.resource,
+        attributes=span.attributes,
+        events=span.events,
+        links=span.links,
+        kind=span.kind,
+        status=span.status,
+        start_time=span.start_time,
+        end_time=span.end_time,
+        instrumentation_scope=span.instrumentation_scope,
+    )
+
+
+class TailSamplingSpanProcessor(SpanProcessor):
+    """
+    Forwards sampled spans and keeps unsampled traces that were slow or failed.
+
+    Spans of unsampled traces are buffered per trace until the trace's local
+    root span ends. At most ``max_traces`` traces are buffered; the oldest
+    are dropped beyond that. Spans ending after their root (e.g. from
+    background tasks) follow the decision already made for the trace.
+
+    Args:
+        delegate: Processor receiving kept spans (usually a BatchSpanProcessor)
+        latency_threshold: Root span duration in seconds above which a trace is kept
+        max_traces: Maximum traces buffered while awaiting a decision
+    """
+
+    def __init__(self, delegate: SpanProcessor, latency_threshold: float, max_traces: int = 1000):
+        self.delegate = delegate
+        self.latency_threshold_ns = int(latency_threshold * 1e9)
+        self.max_traces = max_traces
+        self._traces: "OrderedDict[int, List[ReadableSpan]]" = OrderedDict()
+        self._decisions: "OrderedDict[int, bool]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.kept = 0
+        self.dropped = 0
+
+    def on_start(self, span, parent_context: Optional[Context] = None) -> None:
+        self.delegate.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        if span.context.trace_flags.sampled:
+            self.delegate.on_end(span)
+            return
+
+        trace_id = span.context.trace_id
+        is_root = span.parent is None or span.parent.is_remote
+        with self._lock:
+            decision = self._decisions.get(trace_id)
+            if decision is None:
+                spans = self._traces.get(trace_id)
+                if spans is None:
+                    spans = self._traces[trace_id] = []
+                    if len(self._traces) > self.max_traces:
+                        self._traces.popitem(last=False)
+                spans.append(span)
+                if not is_root:
+                    return
+                del self._traces[trace_id]
+                decision = any(s.status.status_code == StatusCode.ERROR for s in spans) or (
+                    span.end_time - span.start_time >= self.latency_threshold_ns
+                )
+                self._decisions[trace_id] = decision
+                if len(self._decisions) > self.max_traces:
+                    self._decisions.popitem(last=False)
+                if decision:
+                    self.kept += 1
+                else:
+                    self.dropped += 1
+            else:
+                spans = [span]
+
+        if decision:
+            for kept in spans:
+                self.delegate.on_end(_as_sampled(kept))
+
+    def shutdown(self) -> None:
+        self.delegate.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self.delegate.force_flush(timeout_millis)
+
+
+def build_tracer_provider(exporter: SpanExporter, resource: Optional[Resource] = None) -> TracerProvider:
+    """
+    Build a tracer provider from the TRACE_* and OTEL_BSP_* settings.
+
+    Args:
+        exporter: Span exporter, e.g. OTLPSpanExporter
+        resource: Resource describing this service
+
+    Returns:
+        TracerProvider: Provider with the configured sampler and span processors
+    """
+    provider = TracerProvider(
+        resource=resource,
+        sampler=build_sampler(settings.trace_sample_ratio, settings.trace_tail_sampling),
+    )
+    processor: SpanProcessor = BatchSpanProcessor(
+        exporter,
+        max_queue_size=settings.otel_bsp_max_queue_size,
+        schedule_delay_millis=settings.otel_bsp_schedule_delay_ms,
+        max_export_batch_size=settings.otel_bsp_max_export_batch_size,
+        export_timeout_millis=settings.otel_bsp_export_timeout_ms,
+    )
+    if settings.trace_tail_sampling:
+        processor = TailSamplingSpanProcessor(
+            processor,
+            latency_threshold=settings.trace_tail_latency_threshold_ms / 1000,
+            max_traces=settings.trace_tail_max_traces,
+        )
+    provider.add_span_processor(processor)
+    return provider
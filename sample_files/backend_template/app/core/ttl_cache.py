@@ -0,0 +1,67 @@
+"""
+In-process LRU cache with per-entry TTL.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    LRU cache whose entries expire after a TTL.
+
+    An optional ``on_evict`` callback is invoked with the key and value of
+    every entry removed by expiry, eviction or deletion, so callers can keep
+    secondary indexes in sync.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl: float,
+        on_evict: Optional[Callable[[str, Any], None]] = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self.delete(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        if key in self._entries:
+            self.delete(key)
+        self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        while len(self._entries) > self.max_entries:
+            evicted_key, (_, evicted) = self._entries.popitem(last=False)
+            if self.on_evict is not None:
+                self.on_evict(evicted_key, evicted)
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry."""
+        entry = self._entries.pop(key, None)
+        if entry is not None and self.on_evict is not None:
+            self.on_evict(key, entry[1])
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for key in list(self._entries):
+            self.delete(key)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1 @@
+"""Streaming ingestion of product catalogs and document collections."""
@@ -0,0 +1,107 @@
+"""
+Record preparation and text chunking.
+
+These functions run in worker processes, so they are pure, take and return
+plain picklable values, and import nothing from the application.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+def chunk_text(text: str, chunk_size: int, overlap: int) -> List[str]:
+    """
+    Split text into windows of about ``chunk_size`` characters.
+
+    Windows end on whitespace where possible and consecutive windows share
+    ``overlap`` characters of context.
+
+    Args:
+        text: Text to split
+        chunk_size: Maximum characters per chunk
+        overlap: Characters repeated at the start of the next chunk
+
+    Returns:
+        List[str]: Non-empty chunks
+    """
+    text = " ".join(text.split())
+    if len(text) <= chunk_size:
+        return [text] if text else []
+
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = min(start + chunk_size, len(text))
+        if end < len(text):
+            boundary = text.rfind(" ", start + 1, end)
+            if boundary > start + overlap:
+                end = boundary
+        chunks.append(text[start:end].strip())
+        if end >= len(text):
+            break
+        start = max(end - overlap, start + 1)
+        # Do not start the next window mid-word
+        if start > 0 and text[start - 1] != " ":
+            space = text.find(" ", start, end)
+            if space != -1:
+                start = space + 1
+    return [chunk for chunk in chunks if chunk]
+
+
+def content_hash(text: str, metadata: Dict[str, Any]) -> str:
+    """Hash of a chunk's text and metadata; any change to either changes it."""
+    payload = json.dumps(metadata, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"{text}\x00{payload}".encode("utf-8")).hexdigest()
+
+
+def prepare_records(
+    records: Sequence[Tuple[int, Dict[str, Any]]],
+    id_field: str,
+    text_fields: Optional[Sequence[str]],
+    chunk_size: int,
+    overlap: int,
+) -> List[Dict[str, Any]]:
+    """
+    Turn raw records into chunks ready for embedding.
+
+    A document ID repeated within the batch keeps only its last record, so
+    chunk IDs are unique and earlier versions are never indexed.
+
+    Args:
+        records: (offset, record) pairs
+        id_field: Field holding the document ID; the offset is used if missing
+        text_fields: Fields concatenated into the document text; all string
+            fields if omitted
+        chunk_size: Maximum characters per chunk
+        overlap: Characters of overlap between chunks
+
+    Returns:
+        Chunk dicts with id, document_id, offset, text, metadata and a
+        content hash over text and metadata
+    """
+    latest: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+    for offset, record in records:
+        latest[str(record.get(id_field) or offset)] = (offset, record)
+
+    chunks = []
+    for document_id, (offset, record) in latest.items():
+        fields = text_fields or [key for key, value in record.items() if isinstance(value, str) and key != id_field]
+        text = "\n".join(str(record[field]) for field in fields if record.get(field))
+        metadata = {
+            key: value for key, value in record.items()
+            if isinstance(value, (str, int, float, bool)) and key not in fields
+        }
+        metadata["document_id"] = document_id
+
+        for index, chunk in enumerate(chunk_text(text, chunk_size, overlap)):
+            chunk_metadata = {**metadata, "chunk": index}
+            chunks.append({
+                "id": f"{document_id}#{index}",
+                "document_id": document_id,
+                "offset": offset,
+                "text": chunk,
+                "metadata": chunk_metadata,
+                "hash": content_hash(chunk, chunk_metadata),
+            })
+    return chunks
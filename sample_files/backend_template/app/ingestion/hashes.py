@@ -0,0 +1,214 @@
+"""
+Content-hash tables for incremental re-indexing.
+
+Each indexed document and chunk has its content hash recorded, so a
+re-import only embeds and indexes chunks that are new or changed. Chunks
+that disappeared are removed, and so are documents missing from a full
+sync.
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Any, Dict, List, Sequence
+
+from pydantic import BaseModel
+from sqlalchemy import Column, DateTime, Integer, String, delete, select
+
+from app.core.bulk import BulkWriter
+from app.core.database import AsyncSessionLocal, Base
+
+
+class DocumentHashModel(Base):
+    """Database table with the content hash of each indexed document."""
+    __tablename__ = "ingestion_document_hashes"
+
+    index_name = Column(String, primary_key=True)
+    document_id = Column(String, primary_key=True)
+    source = Column(String, nullable=False, index=True)
+    content_hash = Column(String(64), nullable=False)
+    chunk_count = Column(Integer, nullable=False)
+    last_seen_run = Column(String, nullable=False)  # sync run that last saw the document
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+
+class ChunkHashModel(Base):
+    """Database table with the content hash of each indexed chunk."""
+    __tablename__ = "ingestion_chunk_hashes"
+
+    index_name = Column(String, primary_key=True)
+    chunk_id = Column(String, primary_key=True)
+    document_id = Column(String, nullable=False, index=True)
+    content_hash = Column(String(64), nullable=False)
+
+
+class ChunkDiff(BaseModel):
+    """Result of comparing a batch of chunks with the recorded hashes."""
+    changed: List[Dict[str, Any]] = []  # new or modified chunks to (re)index
+    unchanged: int = 0
+    stale_chunk_ids: List[str] = []  # chunks of changed documents that no longer exist
+    documents: List[Dict[str, Any]] = []  # document hash rows to record
+    chunks: List[Dict[str, Any]] = []  # chunk hash rows to record for changed documents
+
+
+def document_hash(chunk_hashes: Sequence[str]) -> str:
+    """Hash of a document's chunk hashes, in chunk order."""
+    return hashlib.sha256("".join(chunk_hashes).encode("ascii")).hexdigest()
+
+
+class ContentHashStore:
+    """
+    Reads and records content hashes for one index and source.
+
+    Documents whose combined hash is unchanged are skipped without loading
+    their chunk hashes; only changed documents are compared chunk by chunk.
+    """
+
+    def __init__(self, index_name: str, source: str, session_factory=AsyncSessionLocal):
+        self.index_name = index_name
+        self.source = source
+        self.session_factory = session_factory
+
+    async def diff(self, chunks: Sequence[Dict[str, Any]], run_id: str) -> ChunkDiff:
+        """
+        Compare prepared chunks with the recorded hashes.
+
+        Args:
+            chunks: Chunk dicts from prepare_records (with ``hash``)
+            run_id: Sync run marking the documents as seen
+
+        Returns:
+            ChunkDiff: Chunks to index, chunks to delete and hash rows to record
+        """
+        # Keyed by chunk ID, so a chunk given twice is recorded once (last wins)
+        by_document: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for chunk in chunks:
+            by_document.setdefault(chunk["document_id"], {})[chunk["id"]] = chunk
+
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(DocumentHashModel.document_id, DocumentHashModel.content_hash).where(
+                    DocumentHashModel.index_name == self.index_name,
+                    DocumentHashModel.document_id.in_(list(by_document)),
+                )
+            )
+            known = dict(result.all())
+
+            diff = ChunkDiff()
+            changed_documents = []
+            now = datetime.utcnow()
+            for document_id, document_chunks in by_document.items():
+                document_chunks = list(document_chunks.values())
+                digest = document_hash([chunk["hash"] for chunk in document_chunks])
+                diff.documents.append({
+                    "index_name": self.index_name,
+                    "document_id": document_id,
+                    "source": self.source,
+                    "content_hash": digest,
+                    "chunk_count": len(document_chunks),
+                    "last_seen_run": run_id,
+                    "updated_at": now,
+                })
+                if known.get(document_id) == digest:
+                    diff.unchanged += len(document_chunks)
+                else:
+                    changed_documents.append(document_id)
+
+            if not changed_documents:
+                return diff
+
+            result = await session.execute(
+                select(ChunkHashModel.chunk_id, ChunkHashModel.content_hash).where(
+                    ChunkHashModel.index_name == self.index_name,
+                    ChunkHashModel.document_id.in_(changed_documents),
+                )
+            )
+            known_chunks = dict(result.all())
+
+        current_ids = set()
+        for document_id in changed_documents:
+            for chunk in by_document[document_id].values():
+                current_ids.add(chunk["id"])
+                if known_chunks.get(chunk["id"]) == chunk["hash"]:
+                    diff.unchanged += 1
+                else:
+                    diff.changed.append(chunk)
+                diff.chunks.append({
+                    "index_name": self.index_name,
+                    "chunk_id": chunk["id"],
+                    "document_id": document_id,
+                    "content_hash": chunk["hash"],
+                })
+        diff.stale_chunk_ids = [chunk_id for chunk_id in known_chunks if chunk_id not in current_ids]
+        return diff
+
+    async def record(self, diffs: Sequence[ChunkDiff]) -> None:
+        """
+        Record the hashes from applied diffs.
+
+        Call only after the corresponding index changes are persisted.
+        """
+        stale = [chunk_id for diff in diffs for chunk_id in diff.stale_chunk_ids]
+        if stale:
+            async with self.session_factory() as session:
+                async with session.begin():
+                    await session.execute(
+                        delete(ChunkHashModel).where(
+                            ChunkHashModel.index_name == self.index_name,
+                            ChunkHashModel.chunk_id.in_(stale),
+                        )
+                    )
+
+        async with BulkWriter(ChunkHashModel, upsert_keys=["index_name", "chunk_id"],
+                              flush_interval=0, session_factory=self.session_factory) as writer:
+            for diff in diffs:
+                await writer.add_many(diff.chunks)
+        async with BulkWriter(DocumentHashModel, upsert_keys=["index_name", "document_id"],
+                              flush_interval=0, session_factory=self.session_factory) as writer:
+            for diff in diffs:
+                await writer.add_many(diff.documents)
+
+    async def missing_documents(self, run_id: str, limit: int = 1000) -> Dict[str, List[str]]:
+        """
+        Find documents from this source that the given run did not see.
+
+        Returns:
+            Dict[str, List[str]]: Chunk IDs per missing document, at most ``limit`` documents
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(DocumentHashModel.document_id).where(
+                    DocumentHashModel.index_name == self.index_name,
+                    DocumentHashModel.source == self.source,
+                    DocumentHashModel.last_seen_run != run_id,
+                ).limit(limit)
+            )
+            document_ids = list(result.scalars())
+            if not document_ids:
+                return {}
+            result = await session.execute(
+                select(ChunkHashModel.document_id, ChunkHashModel.chunk_id).where(
+                    ChunkHashModel.index_name == self.index_name,
+                    ChunkHashModel.document_id.in_(document_ids),
+                )
+            )
+            missing: Dict[str, List[str]] = {document_id: [] for document_id in document_ids}
+            for document_id, chunk_id in result.all():
+                missing[document_id].append(chunk_id)
+            return missing
+
+    async def forget(self, document_ids: Sequence[str]) -> None:
+        """Delete the hash rows of removed documents."""
+        async with self.session_factory() as session:
+            async with session.begin():
+                await session.execute(
+                    delete(ChunkHashModel).where(
+                        ChunkHashModel.index_name == self.index_name,
+                        ChunkHashModel.document_id.in_(document_ids),
+                    )
+                )
+                await session.execute(
+                    delete(DocumentHashModel).where(
+                        DocumentHashModel.index_name == self.index_name,
+                        DocumentHashModel.document_id.in_(document_ids),
+                    )
+                )
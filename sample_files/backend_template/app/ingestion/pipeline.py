@@ -0,0 +1,283 @@
+"""
+Streaming ingestion pipeline: read -> parse/chunk -> embed -> store.
+
+Records are read lazily in batches, chunked in a process pool and indexed
+through the hybrid retriever. Each stage hands work to the next through a
+bounded queue, so a slow stage (usually embedding) pauses the ones before
+it and memory stays flat regardless of source size. Progress is checkpointed
+in the database (after the indexes are saved) so an interrupted job resumes
+from its last checkpoint.
+
+With incremental indexing, chunk content hashes are compared with those
+recorded by earlier runs: unchanged chunks are not re-embedded, and chunks
+of changed or removed documents are deleted from the index.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.ingestion.chunking import prepare_records
+from app.ingestion.hashes import ChunkDiff, ContentHashStore
+from app.ingestion.progress import IngestionProgressStore
+from app.ingestion.sources import Record, open_source
+from app.retrieval.hybrid import HybridRetriever, RetrievalDocument
+
+
+_DONE = object()
+
+
+class IngestionStats(BaseModel):
+    """Throughput statistics for one ingestion run."""
+    job_id: str
+    records: int = 0
+    chunks: int = 0
+    unchanged_chunks: int = 0
+    deleted_chunks: int = 0
+    batches: int = 0
+    resumed_from: int = 0
+    elapsed_seconds: float = 0.0
+    records_per_second: float = 0.0
+
+
+class IngestionPipeline:
+    """
+    Ingests one source into a named retrieval index.
+
+    Usage:
+        pipeline = IngestionPipeline("catalog-nightly", "products.csv", id_field="sku",
+                                     text_fields=["name", "description"])
+        stats = await pipeline.run()
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        source: str,
+        index: str = "default",
+        id_field: str = "id",
+        text_fields: Optional[Sequence[str]] = None,
+        records: Optional[Iterator[Record]] = None,
+        retriever: Optional[HybridRetriever] = None,
+        progress_store: Optional[IngestionProgressStore] = None,
+        batch_size: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        chunk_overlap: Optional[int] = None,
+        incremental: Optional[bool] = None,
+        delete_missing: bool = True,
+        hash_store: Optional[ContentHashStore] = None,
+    ):
+        self.job_id = job_id
+        self.source = source
+        self.records = records
+        self.retriever = retriever or HybridRetriever(index)
+        self.progress_store = progress_store or IngestionProgressStore()
+        self.batch_size = batch_size or settings.ingestion_batch_size
+        self.queue_size = queue_size or settings.ingestion_queue_size
+        self.workers = workers or settings.ingestion_workers or os.cpu_count() or 1
+        self.checkpoint_batches = settings.ingestion_checkpoint_batches
+        self.incremental = settings.ingestion_incremental if incremental is None else incremental
+        self.delete_missing = delete_missing
+        self.hash_store = hash_store or ContentHashStore(index, source)
+        self._run_id: Optional[str] = None
+        self._pending_diffs: List[ChunkDiff] = []
+        self._prepare = partial(
+            prepare_records,
+            id_field=id_field,
+            text_fields=list(text_fields) if text_fields else None,
+            chunk_size=chunk_size or settings.ingestion_chunk_size,
+            overlap=chunk_overlap if chunk_overlap is not None else settings.ingestion_chunk_overlap,
+        )
+
+    async def run(self, resume: bool = True) -> IngestionStats:
+        """
+        Run the pipeline to completion.
+
+        Args:
+            resume: Continue an unfinished job with the same ID instead of
+                starting over. With incremental indexing a restarted job
+                still skips chunks that are already indexed.
+
+        Returns:
+            IngestionStats: Records and chunks processed in this run
+        """
+        job = await self.progress_store.start(self.job_id, self.source, resume=resume)
+        stats = IngestionStats(job_id=self.job_id, resumed_from=job.records_processed)
+        # Stable across resumes, so documents seen before a crash count as seen
+        self._run_id = job.started_at.isoformat()
+        self._pending_diffs = []
+        started = time.perf_counter()
+
+        records = self.records if self.records is not None else open_source(self.source)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        # spawn: forking a process with a running event loop and threads is unsafe
+        pool = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+
+        producer = asyncio.create_task(self._produce(records, job.records_processed, queue, pool))
+        consumer = asyncio.create_task(self._consume(queue, stats))
+        try:
+            await asyncio.gather(producer, consumer)
+            if self.incremental and self.delete_missing:
+                stats.deleted_chunks += await self._delete_missing()
+        except BaseException as e:
+            producer.cancel()
+            consumer.cancel()
+            await asyncio.gather(producer, consumer, return_exceptions=True)
+            self._discard(queue)
+            await self.progress_store.finish(self.job_id, error=f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        await self.progress_store.finish(self.job_id)
+        stats.elapsed_seconds = time.perf_counter() - started
+        if stats.elapsed_seconds > 0:
+            stats.records_per_second = stats.records / stats.elapsed_seconds
+        return stats
+
+    @staticmethod
+    def _discard(queue: asyncio.Queue) -> None:
+        """Drop batches still queued after a failure."""
+        while not queue.empty():
+            item = queue.get_nowait()
+            if item is not _DONE:
+                future = item[2]
+                future.cancel()
+                if future.done() and not future.cancelled():
+                    future.exception()
+
+    async def _produce(self, records: Iterator[Record], skip: int, queue: asyncio.Queue, pool: ProcessPoolExecutor) -> None:
+        """Read record batches and submit them for chunking, in source order."""
+        loop = asyncio.get_running_loop()
+        numbered = islice(enumerate(records), skip, None)
+        while True:
+            batch = await asyncio.to_thread(lambda: list(islice(numbered, self.batch_size)))
+            if not batch:
+                break
+            future = loop.run_in_executor(pool, self._prepare, batch)
+            # Blocks while the queue is full: backpressure from the store stage
+            await queue.put((batch[-1][0] + 1, len(batch), future))
+        await queue.put(_DONE)
+
+    async def _consume(self, queue: asyncio.Queue, stats: IngestionStats) -> None:
+        """Embed and index chunked batches in order and checkpoint progress."""
+        records_processed = pending_chunks = pending_batches = 0
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                break
+            records_processed, record_count, future = item
+            chunks = await future
+            indexed = await self.store(chunks, stats)
+            stats.records += record_count
+            stats.chunks += indexed
+            stats.batches += 1
+            pending_chunks += indexed
+            pending_batches += 1
+            if pending_batches >= self.checkpoint_batches:
+                await self._checkpoint(records_processed, pending_chunks)
+                pending_chunks = pending_batches = 0
+        if pending_batches:
+            await self._checkpoint(records_processed, pending_chunks)
+
+    async def _checkpoint(self, records_processed: int, chunks_indexed: int) -> None:
+        # Persist the indexes before the progress that depends on them
+        # and the hashes before the progress; a crash in between only
+        # re-indexes chunks whose hashes were not recorded yet
+        await asyncio.to_thread(self.retriever.save)
+        if self._pending_diffs:
+            await self.hash_store.record(self._pending_diffs)
+            self._pending_diffs = []
+        await self.progress_store.advance(self.job_id, records_processed, chunks_indexed)
+
+    async def store(self, chunks: List[Dict[str, Any]], stats: Optional[IngestionStats] = None) -> int:
+        """
+        Embed and index a batch of chunks.
+
+        With incremental indexing only new or changed chunks are indexed,
+        and chunks dropped from changed documents are deleted.
+
+        Returns:
+            int: Number of chunks indexed
+        """
+        if self.incremental:
+            diff = await self.hash_store.diff(chunks, self._run_id)
+            if diff.stale_chunk_ids:
+                deleted = await self.retriever.delete_documents(diff.stale_chunk_ids)
+                if stats is not None:
+                    stats.deleted_chunks += deleted
+            if stats is not None:
+                stats.unchanged_chunks += diff.unchanged
+            self._pending_diffs.append(diff)
+            chunks = diff.changed
+        return await self.retriever.index_documents([
+            RetrievalDocument(id=chunk["id"], text=chunk["text"], metadata=chunk["metadata"])
+            for chunk in chunks
+        ])
+
+    async def _delete_missing(self) -> int:
+        """Delete chunks of documents no longer in the source."""
+        deleted = 0
+        while True:
+            missing = await self.hash_store.missing_documents(self._run_id)
+            if not missing:
+                return deleted
+            chunk_ids = [chunk_id for ids in missing.values() for chunk_id in ids]
+            if chunk_ids:
+                deleted += await self.retriever.delete_documents(chunk_ids)
+            await asyncio.to_thread(self.retriever.save)
+            await self.hash_store.forget(list(missing))
+
+
+async def _main(args) -> None:
+    from app.core.database import init_database
+    from app.llm.client_pool import llm_client_pool
+    from app.llm.embeddings import embedding_service
+    from app.llm.orchestrator import llm_orchestrator
+    from app.llm.providers import build_providers
+
+    await init_database()
+    for provider in build_providers():
+        llm_orchestrator.register_provider(provider)
+    await embedding_service.start()
+    try:
+        pipeline = IngestionPipeline(
+            args.job_id or os.path.basename(args.source),
+            args.source,
+            index=args.index,
+            id_field=args.id_field,
+            text_fields=args.text_fields.split(",") if args.text_fields else None,
+            incremental=False if args.full else None,
+            delete_missing=not args.keep_missing,
+        )
+        stats = await pipeline.run(resume=not args.restart)
+        print(stats.model_dump_json(indent=2))
+    finally:
+        await embedding_service.stop()
+        await llm_client_pool.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Ingest a catalog or document directory into a retrieval index")
+    parser.add_argument("source", help="CSV, JSON, JSON-lines file or directory of text documents")
+    parser.add_argument("--job-id", help="Job ID used for resumable progress (default: source file name)")
+    parser.add_argument("--index", default="default")
+    parser.add_argument("--id-field", default="id")
+    parser.add_argument("--text-fields", help="Comma-separated fields to embed (default: all string fields)")
+    parser.add_argument("--restart", action="store_true", help="Ignore saved progress and start over")
+    parser.add_argument("--full", action="store_true", help="Re-index every chunk, ignoring content hashes")
+    parser.add_argument("--keep-missing", action="store_true",
+                        help="Keep documents that are no longer in the source (partial or delta sources)")
+    asyncio.run(_main(parser.parse_args()))
@@ -0,0 +1,114 @@
+"""
+Resumable ingestion progress stored in the application database.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+from sqlalchemy import Column, DateTime, Integer, String, Text
+
+from app.core.database import AsyncSessionLocal, Base
+
+
+class IngestionJobModel(Base):
+    """Database table tracking ingestion jobs."""
+    __tablename__ = "ingestion_jobs"
+
+    job_id = Column(String, primary_key=True)
+    source = Column(String, nullable=False)
+    status = Column(String(16), nullable=False)  # running, completed, failed
+    records_processed = Column(Integer, nullable=False, default=0)
+    chunks_indexed = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    started_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+
+class IngestionJob(BaseModel):
+    """Progress of an ingestion job."""
+    job_id: str
+    source: str
+    status: str
+    records_processed: int = 0
+    chunks_indexed: int = 0
+    error: Optional[str] = None
+    started_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class IngestionProgressStore:
+    """
+    Records how far each ingestion job has got.
+
+    ``records_processed`` only advances after a batch is fully indexed, so a
+    job restarted after a crash resumes from the first unindexed record.
+    """
+
+    def __init__(self, session_factory=AsyncSessionLocal):
+        self.session_factory = session_factory
+
+    async def start(self, job_id: str, source: str, resume: bool = True) -> IngestionJob:
+        """
+        Create or resume a job.
+
+        An unfinished job for the same source keeps its progress when
+        ``resume`` is set; otherwise progress starts from zero.
+
+        Returns:
+            IngestionJob: Job state to resume from
+        """
+        async with self.session_factory() as session:
+            async with session.begin():
+                job = await session.get(IngestionJobModel, job_id)
+                now = datetime.utcnow()
+                if job is None:
+                    job = IngestionJobModel(job_id=job_id, source=source, started_at=now)
+                    session.add(job)
+                can_resume = resume and job.status in ("running", "failed") and job.source == source
+                if not can_resume:
+                    job.records_processed = 0
+                    job.chunks_indexed = 0
+                    job.started_at = now
+                job.source = source
+                job.status = "running"
+                job.error = None
+                job.updated_at = now
+            return self._to_job(job)
+
+    async def advance(self, job_id: str, records_processed: int, chunks_indexed: int) -> None:
+        """Record a fully indexed batch."""
+        async with self.session_factory() as session:
+            async with session.begin():
+                job = await session.get(IngestionJobModel, job_id)
+                job.records_processed = records_processed
+                job.chunks_indexed += chunks_indexed
+                job.updated_at = datetime.utcnow()
+
+    async def finish(self, job_id: str, error: Optional[str] = None) -> None:
+        """Mark a job completed, or failed with an error."""
+        async with self.session_factory() as session:
+            async with session.begin():
+                job = await session.get(IngestionJobModel, job_id)
+                job.status = "failed" if error else "completed"
+                job.error = error
+                job.updated_at = datetime.utcnow()
+
+    async def get(self, job_id: str) -> Optional[IngestionJob]:
+        """Get a job's progress."""
+        async with self.session_factory() as session:
+            job = await session.get(IngestionJobModel, job_id)
+            return None if job is None else self._to_job(job)
+
+    @staticmethod
+    def _to_job(job: IngestionJobModel) -> IngestionJob:
+        return IngestionJob(
+            job_id=job.job_id,
+            source=job.source,
+            status=job.status,
+            records_processed=job.records_processed,
+            chunks_indexed=job.chunks_indexed,
+            error=job.error,
+            started_at=job.started_at,
+            updated_at=job.updated_at,
+        )
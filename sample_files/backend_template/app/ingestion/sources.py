@@ -0,0 +1,114 @@
+"""
+Streaming readers for catalog and document sources.
+
+Every reader yields one record dict at a time, so files of any size are
+read with constant memory.
+"""
+
+import csv
+import json
+import os
+from typing import Any, Dict, Iterator, Sequence
+
+
+Record = Dict[str, Any]
+
+TEXT_EXTENSIONS = (".txt", ".md", ".markdown", ".html", ".rst")
+
+
+def iter_csv(path: str, encoding: str = "utf-8") -> Iterator[Record]:
+    """Yield rows of a CSV file with a header row as dicts."""
+    with open(path, newline="", encoding=encoding) as f:
+        yield from csv.DictReader(f)
+
+
+def iter_jsonl(path: str, encoding: str = "utf-8") -> Iterator[Record]:
+    """Yield objects from a JSON-lines file, skipping blank lines."""
+    with open(path, encoding=encoding) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_json_array(path: str, encoding: str = "utf-8", read_size: int = 1 << 16) -> Iterator[Record]:
+    """
+    Yield the elements of a top-level JSON array without loading the file.
+
+    The file is read in ``read_size`` blocks and elements are decoded one at
+    a time as soon as they are complete.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, encoding=encoding) as f:
+        buffer = ""
+        position = 0
+        started = False
+        eof = False
+
+        while True:
+            # Skip whitespace and separators between elements
+            while position < len(buffer) and buffer[position] in " \t\r\n,":
+                position += 1
+
+            if position < len(buffer):
+                if not started:
+                    if buffer[position] != "[":
+                        raise ValueError(f"{path}: expected a top-level JSON array")
+                    started = True
+                    position += 1
+                    continue
+                if buffer[position] == "]":
+                    return
+                try:
+                    element, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                else:
+                    yield element
+                    position = end
+                    continue
+            elif eof:
+                if started:
+                    raise ValueError(f"{path}: unterminated JSON array")
+                return
+
+            block = f.read(read_size)
+            eof = not block
+            buffer = buffer[position:] + block
+            position = 0
+
+
+def iter_text_files(directory: str, extensions: Sequence[str] = TEXT_EXTENSIONS, encoding: str = "utf-8") -> Iterator[Record]:
+    """
+    Yield one record per text document under a directory.
+
+    Records have ``id`` (path relative to the directory) and ``text``.
+    Files are visited in sorted order so offsets are stable across runs.
+    """
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            if not name.lower().endswith(tuple(extensions)):
+                continue
+            path = os.path.join(root, name)
+            with open(path, encoding=encoding, errors="replace") as f:
+                yield {"id": os.path.relpath(path, directory), "text": f.read()}
+
+
+def open_source(path: str) -> Iterator[Record]:
+    """
+    Choose a reader from the path.
+
+    Directories are read as text documents; files by extension
+    (.csv, .jsonl/.ndjson, .json).
+    """
+    if os.path.isdir(path):
+        return iter_text_files(path)
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return iter_csv(path)
+    if extension in (".jsonl", ".ndjson"):
+        return iter_jsonl(path)
+    if extension == ".json":
+        return iter_json_array(path)
+    raise ValueError(f"Unsupported ingestion source: {path}")
@@ -6,7 +6,10 @@ to ensure extensibility and consistency across the system.
 """
 
 from .agent import IAgent
+from .llm import ILLMProvider
+from .streaming import StreamEvent, StreamEventType
+from .task_queue import ITaskQueue
 from .tool import ITool
 from .workflow import IWorkflow
 
-__all__ = ["IAgent", "ITool", "IWorkflow"]
\ No newline at end of file
+__all__ = ["IAgent", "ILLMProvider", "ITaskQueue", "ITool", "IWorkflow", "StreamEvent", "StreamEventType"]
\ No newline at end of file
@@ -3,9 +3,12 @@ Agent interface definition for standardized agent implementation.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from pydantic import BaseModel
 
+from app.core.telemetry import Operation, first_argument
+from .streaming import StreamEvent, StreamEventType
+
 
 class AgentCapability(BaseModel):
     """Defines a capability that an agent possesses."""
@@ -23,18 +26,53 @@ class AgentStatus(BaseModel):
     metrics: Dict[str, Any] = {}
 
 
+def _task_type(args: tuple, kwargs: Dict[str, Any]) -> str:
+    task = first_argument(args, kwargs, "task")
+    return str(task.get("type", "")) if isinstance(task, dict) else ""
+
+
+def _task_error(result: Any) -> Optional[str]:
+    if isinstance(result, dict) and result.get("status") in ("error", "failed"):
+        return f"task_{result['status']}"
+    return None
+
+
+TASK_OPERATION = Operation(
+    "agent.execute_task",
+    "agent.task",
+    "agent task executions",
+    attributes=lambda agent, *args, **kwargs: {
+        "agent.id": agent.agent_id,
+        "task.type": _task_type(args, kwargs),
+    },
+    span_attributes=lambda agent, *args, **kwargs: {
+        "agent.class": type(agent).__name__,
+        "task.id": str((first_argument(args, kwargs, "task") or {}).get("id", "")),
+    },
+    error_type=_task_error,
+)
+
+
 class IAgent(ABC):
     """
     Standard interface for all agents in the system.
     
     All agents must implement this interface to ensure consistent
     interaction patterns and lifecycle management.
+    
+    ``execute_task`` implementations are traced and metered automatically
+    (see app.core.telemetry).
     """
     
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        TASK_OPERATION.instrument(cls, "execute_task")
+    
     def __init__(self, agent_id: str, config: Dict[str, Any]):
         self.agent_id = agent_id
         self.config = config
         self._status = "idle"
+        self._capability_names: Optional[frozenset] = None
     
     @property
     @abstractmethod
@@ -65,6 +103,23 @@ class IAgent(ABC):
         """
         pass
     
+    async def stream_task(self, task: Dict[str, Any]) -> AsyncIterator[StreamEvent]:
+        """
+        Execute a task and yield partial results as they become available.
+        
+        The default implementation yields the finished result of
+        execute_task as a single RESULT event; agents that can produce
+        tokens or intermediate results should override this.
+        
+        Args:
+            task: Task definition with type, parameters, and context
+            
+        Yields:
+            StreamEvent: Partial results, ending with a RESULT event
+        """
+        result = await self.execute_task(task)
+        yield StreamEvent(type=StreamEventType.RESULT, data=result)
+    
     @abstractmethod
     async def get_status(self) -> AgentStatus:
         """Get current agent status and metrics."""
@@ -93,6 +148,17 @@ class IAgent(ABC):
         except Exception:
             return False
     
+    @property
+    def capability_names(self) -> frozenset:
+        """Names of this agent's capabilities, computed once and cached."""
+        if self._capability_names is None:
+            self._capability_names = frozenset(cap.name for cap in self.capabilities)
+        return self._capability_names
+    
+    def refresh_capabilities(self) -> None:
+        """Drop cached capability names after the capabilities list changes."""
+        self._capability_names = None
+    
     def can_handle_task(self, task_type: str) -> bool:
         """
         Check if this agent can handle a specific task type.
@@ -103,4 +169,4 @@ class IAgent(ABC):
         Returns:
             bool: True if agent can handle the task, False otherwise
         """
-        return any(cap.name == task_type for cap in self.capabilities)
\ No newline at end of file
+        return task_type in self.capability_names
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""
+LLM provider interface definition for standardized provider implementation.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel
+
+
+class LLMMessage(BaseModel):
+    """A single chat message."""
+    role: str  # system, user, assistant
+    content: str
+
+
+class LLMRequest(BaseModel):
+    """Request for a chat completion."""
+    messages: List[LLMMessage]
+    provider: Optional[str] = None
+    model: Optional[str] = None
+    max_tokens: Optional[int] = None
+    temperature: Optional[float] = None
+
+
+class LLMResponse(BaseModel):
+    """Result of a chat completion."""
+    content: str
+    provider: str
+    model: Optional[str] = None
+    usage: Dict[str, int] = {}
+    latency: float = 0.0
+    metadata: Dict[str, Any] = {}
+
+
+class ILLMProvider(ABC):
+    """
+    Standard interface for LLM providers.
+
+    Providers wrap a single upstream API (OpenAI, Anthropic, ...) behind a
+    common request/response model so orchestration logic stays provider
+    agnostic.
+    """
+
+    def __init__(self, provider_id: str, config: Dict[str, Any] = None):
+        self.provider_id = provider_id
+        self.config = config or {}
+
+    @property
+    @abstractmethod
+    def default_model(self) -> str:
+        """Model used when a request does not specify one."""
+        pass
+
+    @abstractmethod
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        """
+        Generate a chat completion.
+
+        Args:
+            request: Completion request
+
+        Returns:
+            LLMResponse: Generated completion
+        """
+        pass
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed a batch of texts.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            List of embedding vectors, one per input text
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support embeddings")
+
+    async def health_check(self) -> bool:
+        """
+        Perform health check on the provider.
+
+        Returns:
+            bool: True if provider is healthy, False otherwise
+        """
+        return True
@@ -0,0 +1,24 @@
+"""
+Streaming event definition shared by streaming agents and workflows.
+"""
+
+from typing import Any, Optional
+from pydantic import BaseModel
+from enum import Enum
+
+
+class StreamEventType(str, Enum):
+    """Types of events emitted while streaming a result."""
+    TOKEN = "token"
+    PARTIAL = "partial"
+    PROGRESS = "progress"
+    NODE_COMPLETED = "node_completed"
+    RESULT = "result"
+    ERROR = "error"
+
+
+class StreamEvent(BaseModel):
+    """A single partial result emitted by a streaming agent or workflow."""
+    type: StreamEventType
+    data: Any = None
+    node_id: Optional[str] = None
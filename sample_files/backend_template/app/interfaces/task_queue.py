@@ -0,0 +1,128 @@
+"""
+Task queue interface definition for dispatching agent tasks and workflow runs.
+"""
+
+import uuid
+from abc import ABC, abstractmethod
+from datetime import datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, Optional
+from pydantic import BaseModel, Field
+
+from .streaming import StreamEvent
+
+
+class TaskKind(str, Enum):
+    """What a queued task runs."""
+    AGENT = "agent"
+    WORKFLOW = "workflow"
+
+
+class TaskState(str, Enum):
+    """Lifecycle state of a queued task."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    TIMED_OUT = "timed_out"
+    CANCELLED = "cancelled"
+
+
+FINISHED_STATES = {TaskState.COMPLETED, TaskState.FAILED, TaskState.TIMED_OUT, TaskState.CANCELLED}
+
+
+class QueuedTask(BaseModel):
+    """An agent task or workflow run submitted to a task queue."""
+    task_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    kind: TaskKind
+    target: Optional[str] = None  # agent ID (routed by task type if omitted) or workflow ID
+    payload: Dict[str, Any] = {}  # agent task definition or workflow input
+    tenant: str = "default"
+    priority: int = Field(default=5, ge=0, le=9)  # higher runs first
+    timeout: Optional[float] = None  # seconds, capped at AGENT_TIMEOUT or MAX_WORKFLOW_DURATION
+    state: TaskState = TaskState.QUEUED
+    submitted_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    result: Any = None
+    error: Optional[str] = None
+
+
+class TaskOutcome(BaseModel):
+    """How a task run ended, as reported by the worker that ran it."""
+    state: TaskState
+    result: Any = None
+    error: Optional[str] = None
+
+
+class ITaskQueue(ABC):
+    """
+    Standard interface for task queue backends.
+
+    A queue accepts tasks from API processes, runs them on workers (in the
+    same process, in worker processes or on remote workers) in priority
+    order with fair sharing between tenants, and streams each task's events
+    back to subscribers.
+    """
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Start dispatching tasks to workers."""
+        pass
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop dispatching and cancel running tasks."""
+        pass
+
+    @abstractmethod
+    async def submit(self, task: QueuedTask) -> QueuedTask:
+        """
+        Enqueue a task.
+
+        Args:
+            task: Task to run
+
+        Returns:
+            QueuedTask: The queued task with its timeout resolved
+
+        Raises:
+            QueueFullError: If too many tasks are already waiting
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, task_id: str) -> Optional[QueuedTask]:
+        """Get a task's current state, or None if unknown or expired."""
+        pass
+
+    @abstractmethod
+    async def cancel(self, task_id: str) -> bool:
+        """
+        Cancel a queued or running task.
+
+        Returns:
+            bool: True if the task was cancelled, False if unknown or finished
+        """
+        pass
+
+    @abstractmethod
+    def events(self, task_id: str) -> AsyncIterator[StreamEvent]:
+        """
+        Stream a task's events from the start until it finishes.
+
+        Subscribers joining late receive the events still buffered first.
+
+        Raises:
+            LookupError: If the task is unknown or expired
+        """
+        pass
+
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, running tasks and outcome counts."""
+        pass
+
+
+class QueueFullError(Exception):
+    """Raised when a task is submitted to a queue at capacity."""
@@ -7,6 +7,8 @@ from typing import Any, Dict, List, Optional
 from pydantic import BaseModel
 from enum import Enum
 
+from app.core.telemetry import Operation
+
 
 class ToolCategory(str, Enum):
     """Categories for organizing tools."""
@@ -37,14 +39,32 @@ class ToolResult(BaseModel):
     metadata: Dict[str, Any] = {}
 
 
+TOOL_OPERATION = Operation(
+    "tool.execute",
+    "tool.execution",
+    "tool executions",
+    attributes=lambda tool, *args, **kwargs: {"tool.id": tool.tool_id},
+    span_attributes=lambda tool, *args, **kwargs: {
+        "tool.name": tool.name,
+        "tool.category": tool.category.value,
+    },
+    error_type=lambda result: None if getattr(result, "success", True) else "tool_error",
+)
+
+
 class ITool(ABC):
     """
     Standard interface for all tools in the system.
     
     Tools are reusable components that perform specific actions
-    and can be used by agents or workflows.
+    and can be used by agents or workflows. ``execute`` implementations
+    are traced and metered automatically (see app.core.telemetry).
     """
     
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        TOOL_OPERATION.instrument(cls, "execute")
+    
     def __init__(self, tool_id: str, config: Dict[str, Any] = None):
         self.tool_id = tool_id
         self.config = config or {}
@@ -127,6 +147,7 @@ class ITool(ABC):
             Dict: JSON schema describing the tool and its parameters
         """
         return {
+            "tool_id": self.tool_id,
             "name": self.name,
             "description": self.description,
             "category": self.category.value,
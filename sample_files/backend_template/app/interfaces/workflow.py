@@ -3,10 +3,13 @@ Workflow interface definition for LangGraph workflow implementation.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from pydantic import BaseModel
 from enum import Enum
 
+from app.core.telemetry import Operation, first_argument
+from .streaming import StreamEvent, StreamEventType
+
 
 class WorkflowStatus(str, Enum):
     """Status of workflow execution."""
@@ -18,6 +21,10 @@ class WorkflowStatus(str, Enum):
     PAUSED = "paused"
 
 
+# Statuses after which an execution appends no further checkpoints unless resumed
+FINISHED_STATUSES = {WorkflowStatus.COMPLETED, WorkflowStatus.FAILED, WorkflowStatus.CANCELLED}
+
+
 class WorkflowNode(BaseModel):
     """Definition of a workflow node."""
     node_id: str
@@ -39,14 +46,57 @@ class WorkflowExecution(BaseModel):
     error: Optional[str] = None
 
 
+def _execution_error(execution: Any) -> Optional[str]:
+    if getattr(execution, "status", None) == WorkflowStatus.FAILED:
+        return "workflow_failed"
+    return None
+
+
+def _node_attributes(workflow: "IWorkflow", *args, **kwargs) -> Dict[str, Any]:
+    node = first_argument(args, kwargs, "node")
+    return {
+        "workflow.id": workflow.workflow_id,
+        "node.id": getattr(node, "node_id", ""),
+        "node.type": getattr(node, "type", ""),
+    }
+
+
+WORKFLOW_OPERATION = Operation(
+    "workflow.execute",
+    "workflow.execution",
+    "workflow executions",
+    attributes=lambda workflow, *args, **kwargs: {"workflow.id": workflow.workflow_id},
+    span_attributes=lambda workflow, *args, **kwargs: {"workflow.class": type(workflow).__name__},
+    error_type=_execution_error,
+)
+
+NODE_OPERATION = Operation(
+    "workflow.node",
+    "workflow.node",
+    "workflow node executions",
+    attributes=_node_attributes,
+    span_attributes=lambda workflow, node, inputs=None, *args, **kwargs: {
+        "node.name": node.name,
+        "node.dependencies": len(inputs or {}),
+    },
+)
+
+
 class IWorkflow(ABC):
     """
     Standard interface for LangGraph workflows.
     
     Workflows define complex multi-step processes that can involve
-    multiple agents, tools, and decision points.
+    multiple agents, tools, and decision points. ``execute`` and
+    ``execute_node`` implementations are traced and metered automatically
+    (see app.core.telemetry).
     """
     
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        WORKFLOW_OPERATION.instrument(cls, "execute")
+        NODE_OPERATION.instrument(cls, "execute_node")
+    
     def __init__(self, workflow_id: str, config: Dict[str, Any] = None):
         self.workflow_id = workflow_id
         self.config = config or {}
@@ -92,6 +142,23 @@ class IWorkflow(ABC):
         """
         pass
     
+    async def stream(self, input_data: Dict[str, Any]) -> AsyncIterator[StreamEvent]:
+        """
+        Execute the workflow and yield partial results as they become available.
+        
+        The default implementation yields the finished execution as a
+        single RESULT event; workflows that can report node outputs or
+        tokens as they are produced should override this.
+        
+        Args:
+            input_data: Initial data for workflow execution
+            
+        Yields:
+            StreamEvent: Partial results, ending with a RESULT event
+        """
+        execution = await self.execute(input_data)
+        yield StreamEvent(type=StreamEventType.RESULT, data=execution)
+    
     @abstractmethod
     async def pause(self, execution_id: str) -> bool:
         """
@@ -144,6 +211,30 @@ class IWorkflow(ABC):
         """
         pass
     
+    async def execute_node(
+        self,
+        node: WorkflowNode,
+        inputs: Dict[str, Any],
+        input_data: Dict[str, Any],
+    ) -> Any:
+        """
+        Execute a single node of the workflow.
+        
+        Used by the DAG runtime, which calls this for each node once all of
+        the nodes listed in ``node.config["depends_on"]`` have completed.
+        Workflows that run on the runtime must override it; WorkflowRuntime
+        refuses workflows that do not.
+        
+        Args:
+            node: Node to execute
+            inputs: Outputs of the node's dependencies keyed by node_id
+            input_data: Initial data for workflow execution
+            
+        Returns:
+            Any: JSON-serialisable node output
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not implement execute_node")
+    
     async def validate_input(self, input_data: Dict[str, Any]) -> bool:
         """
         Validate input data before workflow execution.
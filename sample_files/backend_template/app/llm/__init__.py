@@ -0,0 +1 @@
+"""LLM orchestration, provider clients and embeddings."""
\ No newline at end of file
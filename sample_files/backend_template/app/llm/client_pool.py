@@ -0,0 +1,103 @@
+"""
+Shared HTTP clients for upstream LLM APIs.
+
+One long-lived httpx.AsyncClient is kept per provider so connections (and
+their TLS sessions) are reused across requests instead of being opened per
+agent call.
+"""
+
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.llm.rate_limit import AdaptiveTokenBucket
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class LLMClientPool:
+    """
+    Per-provider pool of keep-alive HTTP clients and rate limiters.
+
+    Clients use HTTP/2 when the ``h2`` package is installed (multiplexing
+    concurrent requests over one connection) and fall back to HTTP/1.1
+    keep-alive otherwise.
+    """
+
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.transport = transport
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._limiters: Dict[str, AdaptiveTokenBucket] = {}
+        self._http2: Optional[bool] = None
+
+    def get_client(self, provider_id: str, base_url: str, headers: Optional[Dict[str, str]] = None) -> httpx.AsyncClient:
+        """
+        Get the shared client for a provider, creating it on first use.
+
+        Args:
+            provider_id: Provider identifier
+            base_url: API base URL
+            headers: Default headers (authentication, API version)
+
+        Returns:
+            httpx.AsyncClient: Shared client
+        """
+        client = self._clients.get(provider_id)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                base_url=base_url,
+                headers=headers,
+                http2=self._use_http2(),
+                timeout=httpx.Timeout(settings.llm_request_timeout, connect=10.0),
+                limits=httpx.Limits(
+                    max_connections=settings.llm_max_connections,
+                    max_keepalive_connections=settings.llm_max_keepalive_connections,
+                    keepalive_expiry=settings.llm_keepalive_expiry,
+                ),
+                transport=self.transport,
+            )
+            self._clients[provider_id] = client
+        return client
+
+    def _use_http2(self) -> bool:
+        if self._http2 is None:
+            self._http2 = settings.llm_http2 and _http2_available()
+            if settings.llm_http2 and not self._http2:
+                print("LLM client pool: h2 not installed, using HTTP/1.1 keep-alive")
+        return self._http2
+
+    def get_limiter(self, provider_id: str) -> AdaptiveTokenBucket:
+        """Get the rate limiter for a provider, creating it on first use."""
+        limiter = self._limiters.get(provider_id)
+        if limiter is None:
+            limiter = AdaptiveTokenBucket(settings.llm_rate_limit_rps, settings.llm_rate_limit_burst)
+            self._limiters[provider_id] = limiter
+        return limiter
+
+    async def close(self) -> None:
+        """Close all clients and their connections."""
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-provider client and rate limiter state."""
+        return {
+            provider_id: {
+                "http2": bool(self._http2),
+                "open": provider_id in self._clients and not self._clients[provider_id].is_closed,
+                "rate_limit": limiter.get_stats(),
+            }
+            for provider_id, limiter in self._limiters.items()
+        }
+
+
+# Global LLM client pool instance
+llm_client_pool = LLMClientPool()
@@ -0,0 +1,220 @@
+"""
+Micro-batched embedding service.
+
+Concurrent embed calls are collected over a short window and sent upstream
+as one batched provider request, then fanned back out to the callers.
+Embeddings are cached by content hash so unchanged text is never
+re-embedded.
+"""
+
+import asyncio
+import hashlib
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.ttl_cache import TTLCache
+from app.llm.orchestrator import llm_orchestrator
+
+
+EmbedBatchFunction = Callable[[List[str]], Awaitable[List[List[float]]]]
+
+
+class EmbeddingService:
+    """
+    Embedding front end with request batching, deduplication and caching.
+
+    Requests for the same text that are queued or in flight share one
+    result. By default batches go to the orchestrator's default provider.
+    """
+
+    def __init__(
+        self,
+        embed_batch: Optional[EmbedBatchFunction] = None,
+        namespace: Optional[str] = None,
+        batch_window: Optional[float] = None,
+        max_batch_size: Optional[int] = None,
+        max_concurrent_batches: Optional[int] = None,
+        cache_max_entries: Optional[int] = None,
+        cache_ttl: Optional[float] = None,
+    ):
+        self._embed_batch = embed_batch
+        self._namespace = namespace
+        self.batch_window = (
+            batch_window if batch_window is not None else settings.embedding_batch_window_ms / 1000
+        )
+        self.max_batch_size = max_batch_size or settings.embedding_max_batch_size
+        self.max_concurrent_batches = max_concurrent_batches or settings.embedding_max_concurrent_batches
+        self.cache = TTLCache(
+            cache_max_entries or settings.embedding_cache_max_entries,
+            cache_ttl or settings.embedding_cache_ttl,
+        )
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._worker: Optional[asyncio.Task] = None
+        self._batches: set = set()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+        self.stats: Dict[str, int] = {
+            "requests": 0,
+            "cache_hits": 0,
+            "deduplicated": 0,
+            "batches": 0,
+            "embedded": 0,
+        }
+
+    async def start(self) -> None:
+        """Start the batching worker."""
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_batches)
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the worker after sending any queued texts."""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        await asyncio.gather(self._worker, return_exceptions=True)
+        self._worker = None
+
+        while self._queue is not None and not self._queue.empty():
+            batch = self._drain(self.max_batch_size)
+            self._batches.add(asyncio.create_task(self._dispatch(batch)))
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+
+    async def embed(self, text: str) -> List[float]:
+        """
+        Embed a single text.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            List[float]: Embedding vector
+        """
+        return (await self.embed_many([text]))[0]
+
+    async def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed several texts; they are batched together with other callers.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            List of embedding vectors in input order
+        """
+        if self._worker is None or self._worker.done():
+            await self.start()
+
+        futures = []
+        for text in texts:
+            self.stats["requests"] += 1
+            key = self.content_key(text)
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.stats["cache_hits"] += 1
+                future = asyncio.get_running_loop().create_future()
+                future.set_result(cached)
+            elif key in self._pending:
+                self.stats["deduplicated"] += 1
+                future = self._pending[key]
+            else:
+                future = asyncio.get_running_loop().create_future()
+                self._pending[key] = future
+                self._queue.put_nowait((key, text))
+            futures.append(future)
+
+        # Shield so one caller cancelling does not fail others sharing a text
+        return list(await asyncio.gather(*(asyncio.shield(f) for f in futures)))
+
+    def content_key(self, text: str) -> str:
+        """Cache key for a text: hash of the embedding namespace and content."""
+        digest = hashlib.sha256(f"{self.namespace}\x00{text}".encode("utf-8")).hexdigest()
+        return f"emb:{digest}"
+
+    @property
+    def namespace(self) -> str:
+        """Identifies the embedding model so vectors from different models never mix."""
+        if self._namespace is not None:
+            return self._namespace
+        if self._embed_batch is not None:
+            return "custom"
+        return settings.default_llm_provider
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request, cache and batching counters."""
+        batches = self.stats["batches"]
+        return {
+            **self.stats,
+            "average_batch_size": self.stats["embedded"] / batches if batches else 0.0,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "cache_entries": len(self.cache),
+        }
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                if self.batch_window > 0 and self._queue.qsize() < self.max_batch_size - 1:
+                    # Give concurrent callers a moment to join this batch
+                    await asyncio.sleep(self.batch_window)
+                batch += self._drain(self.max_batch_size - 1)
+                await self._semaphore.acquire()
+            except asyncio.CancelledError:
+                # Hand the texts back so stop() can still send them
+                for item in batch:
+                    self._queue.put_nowait(item)
+                raise
+
+            task = asyncio.create_task(self._dispatch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batch_done)
+
+    def _batch_done(self, task: asyncio.Task) -> None:
+        self._batches.discard(task)
+        self._semaphore.release()
+
+    def _drain(self, limit: int) -> List[Tuple[str, str]]:
+        items = []
+        while len(items) < limit and self._queue is not None and not self._queue.empty():
+            items.append(self._queue.get_nowait())
+        return items
+
+    async def _dispatch(self, batch: List[Tuple[str, str]]) -> None:
+        keys = [key for key, _ in batch]
+        try:
+            vectors = await self._call([text for _, text in batch])
+            if len(vectors) != len(batch):
+                raise ValueError(f"Expected {len(batch)} embeddings, got {len(vectors)}")
+        except BaseException as e:
+            for key in keys:
+                future = self._pending.pop(key, None)
+                if future is None or future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        self.stats["batches"] += 1
+        self.stats["embedded"] += len(batch)
+        for key, vector in zip(keys, vectors):
+            self.cache.set(key, vector)
+            future = self._pending.pop(key, None)
+            if future is not None and not future.done():
+                future.set_result(vector)
+
+    async def _call(self, texts: List[str]) -> List[List[float]]:
+        if self._embed_batch is not None:
+            return await self._embed_batch(texts)
+        return await llm_orchestrator.get_provider().embed(texts)
+
+
+# Global embedding service instance; started and stopped in the app lifespan
+embedding_service = EmbeddingService()
@@ -0,0 +1,183 @@
+"""
+Local mock of the OpenAI and Anthropic HTTP APIs for offline testing.
+
+Serves OpenAI-style endpoints under /openai/v1 and Anthropic-style
+endpoints under /anthropic/v1, with configurable latency, rate limiting
+(429 + Retry-After) and failure injection. Distinct client ports are
+counted so connection reuse by the client pool can be observed.
+
+Usage:
+    python -m app.llm.mock_server --port 8081
+
+    OPENAI_BASE_URL=http://localhost:8081/openai/v1
+    ANTHROPIC_BASE_URL=http://localhost:8081/anthropic/v1
+
+In-process (no sockets):
+    pool = LLMClientPool(transport=httpx.ASGITransport(app=mock_app))
+"""
+
+import argparse
+import asyncio
+import hashlib
+import random
+import re
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+
+EMBEDDING_DIMENSIONS = 64
+
+
+class MockBehaviour(BaseModel):
+    """Tunable behaviour of a mocked provider."""
+    latency: float = 0.0  # seconds per request
+    rate_limit_rps: Optional[float] = None  # None disables 429s
+    retry_after: float = 1.0  # seconds advertised on 429
+    failure_rate: float = 0.0  # fraction of requests answered with 503
+
+
+class MockProviderState:
+    """Behaviour and counters for one mocked provider."""
+
+    def __init__(self):
+        self.behaviour = MockBehaviour()
+        self.requests = 0
+        self.throttled = 0
+        self.failed = 0
+        self.connections: Set[Tuple[str, int]] = set()
+        self._window: List[float] = []
+
+    def admit(self, request: Request) -> Optional[JSONResponse]:
+        """Record a request and return an error response if it should fail."""
+        self.requests += 1
+        if request.client is not None:
+            self.connections.add((request.client.host, request.client.port))
+
+        now = time.monotonic()
+        if self.behaviour.rate_limit_rps is not None:
+            self._window = [t for t in self._window if now - t < 1.0]
+            if len(self._window) >= self.behaviour.rate_limit_rps:
+                self.throttled += 1
+                return JSONResponse(
+                    {"error": {"type": "rate_limit_error", "message": "Rate limit exceeded"}},
+                    status_code=429,
+                    headers={"retry-after": str(self.behaviour.retry_after)},
+                )
+            self._window.append(now)
+
+        if random.random() < self.behaviour.failure_rate:
+            self.failed += 1
+            return JSONResponse({"error": {"type": "overloaded", "message": "Service unavailable"}}, status_code=503)
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "behaviour": self.behaviour.model_dump(),
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "failed": self.failed,
+            "connections": len(self.connections),
+        }
+
+
+def mock_embedding(text: str) -> List[float]:
+    """Deterministic bag-of-words embedding; texts sharing words are similar."""
+    vector = [0.0] * EMBEDDING_DIMENSIONS
+    for word in re.findall(r"\w+", text.lower()):
+        digest = hashlib.sha256(word.encode("utf-8")).digest()
+        vector[digest[0] % EMBEDDING_DIMENSIONS] += 1.0 if digest[1] % 2 else -1.0
+    return vector
+
+
+def _reply(messages: List[Dict[str, Any]]) -> str:
+    last = next((m["content"] for m in reversed(messages) if m.get("role") == "user"), "")
+    return f"Mock reply to: {last}"
+
+
+mock_app = FastAPI(title="Mock LLM API")
+states: Dict[str, MockProviderState] = {"openai": MockProviderState(), "anthropic": MockProviderState()}
+
+
+async def _admit(provider: str, request: Request) -> Optional[JSONResponse]:
+    state = states[provider]
+    error = state.admit(request)
+    if error is None and state.behaviour.latency > 0:
+        await asyncio.sleep(state.behaviour.latency)
+    return error
+
+
+@mock_app.post("/openai/v1/chat/completions")
+async def openai_chat(request: Request):
+    error = await _admit("openai", request)
+    if error is not None:
+        return error
+    body = await request.json()
+    content = _reply(body.get("messages", []))
+    return {
+        "id": f"chatcmpl-mock-{states['openai'].requests}",
+        "object": "chat.completion",
+        "model": body.get("model"),
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 10, "completion_tokens": len(content.split())},
+    }
+
+
+@mock_app.post("/openai/v1/embeddings")
+async def openai_embeddings(request: Request):
+    error = await _admit("openai", request)
+    if error is not None:
+        return error
+    body = await request.json()
+    texts = body["input"] if isinstance(body["input"], list) else [body["input"]]
+    return {
+        "object": "list",
+        "model": body.get("model"),
+        "data": [{"object": "embedding", "index": i, "embedding": mock_embedding(t)} for i, t in enumerate(texts)],
+    }
+
+
+@mock_app.post("/anthropic/v1/messages")
+async def anthropic_messages(request: Request):
+    error = await _admit("anthropic", request)
+    if error is not None:
+        return error
+    body = await request.json()
+    content = _reply(body.get("messages", []))
+    return {
+        "id": f"msg_mock_{states['anthropic'].requests}",
+        "type": "message",
+        "role": "assistant",
+        "model": body.get("model"),
+        "content": [{"type": "text", "text": content}],
+        "stop_reason": "end_turn",
+        "usage": {"input_tokens": 10, "output_tokens": len(content.split())},
+    }
+
+
+@mock_app.put("/_mock/{provider}")
+async def configure(provider: str, behaviour: MockBehaviour):
+    """Replace a provider's behaviour."""
+    if provider not in states:
+        raise HTTPException(status_code=404, detail=f"Unknown provider: {provider}")
+    states[provider].behaviour = behaviour
+    return states[provider].get_stats()
+
+
+@mock_app.get("/_mock/stats")
+async def stats():
+    """Request, throttling and connection counts per provider."""
+    return {provider: state.get_stats() for provider, state in states.items()}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Mock OpenAI/Anthropic API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    args = parser.parse_args()
+    uvicorn.run(mock_app, host=args.host, port=args.port)
@@ -0,0 +1,313 @@
+"""
+LLM orchestration with request coalescing and response caching.
+
+Routes completion requests to registered providers, shares one upstream call
+between concurrent identical requests, and serves repeated or near-identical
+prompts from an exact-match cache and an embedding-similarity cache.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.ttl_cache import TTLCache
+from app.interfaces.llm import ILLMProvider, LLMRequest, LLMResponse
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+EmbedFunction = Callable[[str], Awaitable[List[float]]]
+
+
+def _digest(payload: Any) -> str:
+    data = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def request_key(request: LLMRequest) -> str:
+    """Exact-match cache key for a fully resolved request."""
+    return _digest(request.model_dump(mode="json"))
+
+
+def semantic_parts(request: LLMRequest) -> Tuple[str, str]:
+    """
+    Split a request into a namespace and the text to compare semantically.
+
+    Only the final user message is compared by embedding; everything else
+    (provider, model, parameters, system prompt and earlier turns) must
+    match exactly and forms the namespace.
+
+    Returns:
+        Tuple of (namespace, text)
+    """
+    messages = request.model_dump(mode="json")["messages"]
+    text = messages[-1]["content"] if messages and messages[-1]["role"] == "user" else ""
+    context = request.model_dump(mode="json", exclude={"messages"})
+    context["messages"] = messages[:-1]
+    return _digest(context), text
+
+
+class SemanticCache:
+    """
+    Response cache matched by cosine similarity of prompt embeddings.
+
+    Embeddings are kept normalised in one preallocated float32 matrix so a
+    lookup is a single matrix-vector product. Entry lifetime (TTL and LRU)
+    is managed by a TTLCache whose evictions free matrix slots. numpy is
+    imported only when a semantic cache is created.
+    """
+
+    def __init__(self, max_entries: int, ttl: float, threshold: float):
+        import numpy as np
+
+        self.threshold = threshold
+        # One spare slot: TTLCache evicts only after inserting the new entry
+        self.capacity = max_entries + 1
+        self._entries = TTLCache(max_entries, ttl, on_evict=self._free_slot)
+        self._matrix: Optional[np.ndarray] = None
+        self._valid = np.zeros(self.capacity, dtype=bool)
+        self._namespaces = np.empty(self.capacity, dtype=object)
+        self._slot_keys: List[Optional[str]] = [None] * self.capacity
+        self._free = list(range(self.capacity - 1, -1, -1))
+
+    def lookup(self, namespace: str, embedding: List[float]) -> Optional[Tuple[LLMResponse, float]]:
+        """
+        Find the most similar cached prompt in the same namespace.
+
+        Args:
+            namespace: Namespace from semantic_parts
+            embedding: Embedding of the prompt text
+
+        Returns:
+            Optional tuple of (cached response, similarity) above the threshold
+        """
+        import numpy as np
+
+        if self._matrix is None:
+            return None
+        query = self._normalise(embedding)
+        for _ in range(3):
+            mask = self._valid & (self._namespaces == namespace)
+            if not mask.any():
+                return None
+            scores = self._matrix @ query
+            scores[~mask] = -np.inf
+            slot = int(np.argmax(scores))
+            score = float(scores[slot])
+            if score < self.threshold:
+                return None
+            entry = self._entries.get(self._slot_keys[slot])
+            if entry is not None:
+                return entry[1], score
+            # Entry expired and its slot was freed; try the next best match
+        return None
+
+    def store(self, key: str, namespace: str, embedding: List[float], response: LLMResponse) -> None:
+        """
+        Cache a response under its prompt embedding.
+
+        Args:
+            key: Exact-match key of the request
+            namespace: Namespace from semantic_parts
+            embedding: Embedding of the prompt text
+            response: Response to cache
+        """
+        import numpy as np
+
+        vector = self._normalise(embedding)
+        if self._matrix is None:
+            self._matrix = np.zeros((self.capacity, vector.shape[0]), dtype=np.float32)
+        self._entries.delete(key)
+
+        slot = self._free.pop()
+        self._matrix[slot] = vector
+        self._namespaces[slot] = namespace
+        self._slot_keys[slot] = key
+        self._valid[slot] = True
+        self._entries.set(key, (slot, response))
+
+    def _free_slot(self, key: str, entry: Tuple[int, LLMResponse]) -> None:
+        slot = entry[0]
+        self._valid[slot] = False
+        self._namespaces[slot] = None
+        self._slot_keys[slot] = None
+        self._free.append(slot)
+
+    @staticmethod
+    def _normalise(embedding: List[float]) -> "np.ndarray":
+        import numpy as np
+
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LLMOrchestrator:
+    """
+    Entry point for LLM completions.
+
+    Each request is resolved against the configured defaults, then served
+    from the exact-match cache, joined to an identical in-flight request, or
+    served from the semantic cache, and only otherwise sent upstream.
+    Response metadata records which of these happened.
+    """
+
+    def __init__(
+        self,
+        embed: Optional[EmbedFunction] = None,
+        cache_enabled: Optional[bool] = None,
+        semantic_cache_enabled: Optional[bool] = None,
+    ):
+        self.embed = embed
+        self._providers: Dict[str, ILLMProvider] = {}
+        self._in_flight: Dict[str, asyncio.Task] = {}
+
+        if cache_enabled is None:
+            cache_enabled = settings.llm_cache_enabled
+        if semantic_cache_enabled is None:
+            semantic_cache_enabled = settings.llm_semantic_cache_enabled
+
+        self.exact_cache = TTLCache(settings.llm_cache_max_entries, settings.llm_cache_ttl) if cache_enabled else None
+        self.semantic_cache = SemanticCache(
+            settings.llm_cache_max_entries,
+            settings.llm_cache_ttl,
+            settings.llm_semantic_cache_threshold,
+        ) if semantic_cache_enabled else None
+
+        self.stats: Dict[str, int] = {
+            "requests": 0,
+            "exact_hits": 0,
+            "semantic_hits": 0,
+            "coalesced": 0,
+            "upstream_calls": 0,
+        }
+
+    def register_provider(self, provider: ILLMProvider) -> None:
+        """
+        Register a provider under its provider_id.
+
+        Args:
+            provider: Provider to register
+        """
+        self._providers[provider.provider_id] = provider
+
+    def get_provider(self, provider_id: Optional[str] = None) -> ILLMProvider:
+        """
+        Get a provider by ID, defaulting to DEFAULT_LLM_PROVIDER.
+
+        Raises:
+            LookupError: If the provider is not registered
+        """
+        provider_id = provider_id or settings.default_llm_provider
+        provider = self._providers.get(provider_id)
+        if provider is None:
+            raise LookupError(f"LLM provider not configured: {provider_id}")
+        return provider
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        """
+        Generate a completion, using caches and in-flight requests where possible.
+
+        Args:
+            request: Completion request; unset fields use configured defaults
+
+        Returns:
+            LLMResponse: Completion, with ``metadata["cache"]`` set to
+            exact, semantic or miss and ``metadata["coalesced"]`` set when
+            the result was shared with a concurrent identical request
+        """
+        self.stats["requests"] += 1
+        request = self._resolve(request)
+        key = request_key(request)
+
+        if self.exact_cache is not None:
+            cached = self.exact_cache.get(key)
+            if cached is not None:
+                self.stats["exact_hits"] += 1
+                return self._annotate(cached, cache="exact")
+
+        task = self._in_flight.get(key)
+        coalesced = task is not None
+        if coalesced:
+            self.stats["coalesced"] += 1
+        else:
+            # Run upstream in its own task so one caller cancelling does not
+            # fail the others waiting on the same request
+            task = asyncio.ensure_future(self._fetch(request, key))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        response, cache_status = await asyncio.shield(task)
+        return self._annotate(response, cache=cache_status, coalesced=coalesced)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request, cache and coalescing counters."""
+        return {
+            **self.stats,
+            "in_flight": len(self._in_flight),
+            "exact_cache_entries": len(self.exact_cache) if self.exact_cache is not None else 0,
+            "semantic_cache_entries": len(self.semantic_cache) if self.semantic_cache is not None else 0,
+        }
+
+    async def _fetch(self, request: LLMRequest, key: str) -> Tuple[LLMResponse, str]:
+        provider = self.get_provider(request.provider)
+
+        namespace = text = embedding = None
+        if self.semantic_cache is not None:
+            namespace, text = semantic_parts(request)
+            if text:
+                embedding = await self._embed(provider, text)
+            if embedding is not None:
+                hit = self.semantic_cache.lookup(namespace, embedding)
+                if hit is not None:
+                    self.stats["semantic_hits"] += 1
+                    response, similarity = hit
+                    response = response.model_copy(update={"metadata": {**response.metadata, "similarity": similarity}})
+                    return response, "semantic"
+
+        self.stats["upstream_calls"] += 1
+        started = time.perf_counter()
+        response = await provider.complete(request)
+        response.latency = time.perf_counter() - started
+
+        if self.exact_cache is not None:
+            self.exact_cache.set(key, response)
+        if embedding is not None:
+            self.semantic_cache.store(key, namespace, embedding, response)
+        return response, "miss"
+
+    async def _embed(self, provider: ILLMProvider, text: str) -> Optional[List[float]]:
+        try:
+            if self.embed is not None:
+                return await self.embed(text)
+            return (await provider.embed([text]))[0]
+        except NotImplementedError:
+            # Provider has no embeddings API; skip the semantic cache
+            return None
+        except Exception as e:
+            print(f"LLM semantic cache embedding failed, skipping cache: {e}")
+            return None
+
+    def _resolve(self, request: LLMRequest) -> LLMRequest:
+        provider = self.get_provider(request.provider)
+        return request.model_copy(update={
+            "provider": provider.provider_id,
+            "model": request.model or provider.default_model,
+            "max_tokens": request.max_tokens if request.max_tokens is not None else settings.max_tokens,
+            "temperature": request.temperature if request.temperature is not None else settings.temperature,
+        })
+
+    @staticmethod
+    def _annotate(response: LLMResponse, **metadata: Any) -> LLMResponse:
+        return response.model_copy(update={"metadata": {**response.metadata, **metadata}})
+
+
+# Global LLM orchestrator instance; providers are registered at startup
+llm_orchestrator = LLMOrchestrator()
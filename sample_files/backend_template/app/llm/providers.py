@@ -0,0 +1,282 @@
+"""
+HTTP LLM providers built on the shared client pool.
+
+Providers call the upstream REST APIs directly through LLMClientPool, so
+every provider shares keep-alive connections and an adaptive rate limiter
+regardless of which agent issues the request.
+"""
+
+import asyncio
+import random
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.interfaces.llm import ILLMProvider, LLMRequest, LLMResponse
+from app.llm.client_pool import LLMClientPool, llm_client_pool
+
+
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+
+
+class LLMProviderError(Exception):
+    """Raised when an upstream LLM call fails."""
+
+    def __init__(self, provider_id: str, message: str, status_code: Optional[int] = None, retryable: bool = False):
+        super().__init__(f"{provider_id}: {message}")
+        self.provider_id = provider_id
+        self.status_code = status_code
+        self.retryable = retryable
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds or as an HTTP date.
+
+    Returns:
+        Optional[float]: Delay in seconds, or None if absent or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class HTTPLLMProvider(ILLMProvider):
+    """
+    Base class for providers reached over HTTP.
+
+    Handles rate limiting, retries with backoff on retryable status codes,
+    and feeding 429/retry-after responses back into the rate limiter.
+    Subclasses supply the URL, headers and request/response mapping.
+    """
+
+    base_url: str = ""
+
+    def __init__(self, provider_id: str, api_key: str, config: Dict[str, Any] = None, pool: Optional[LLMClientPool] = None):
+        super().__init__(provider_id, config)
+        self.api_key = api_key
+        self.pool = pool or llm_client_pool
+        self.base_url = self.config.get("base_url", self.base_url)
+        self.max_retries = self.config.get("max_retries", settings.llm_max_retries)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """Default headers sent with every request."""
+        return {}
+
+    async def post(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        POST a JSON payload to the provider.
+
+        Args:
+            path: Path relative to the base URL
+            payload: Request body
+
+        Returns:
+            Dict[str, Any]: Decoded JSON response
+
+        Raises:
+            LLMProviderError: If the request fails after all retries
+        """
+        client = self.pool.get_client(self.provider_id, self.base_url, self.headers)
+        limiter = self.pool.get_limiter(self.provider_id)
+
+        for attempt in range(self.max_retries + 1):
+            await limiter.acquire()
+            try:
+                response = await client.post(path, json=payload)
+            except httpx.TransportError as e:
+                error = LLMProviderError(self.provider_id, f"{type(e).__name__}: {e}", retryable=True)
+                retry_after = None
+            else:
+                if response.status_code < 400:
+                    limiter.on_success()
+                    return response.json()
+                retry_after = parse_retry_after(response.headers.get("retry-after"))
+                if response.status_code == 429:
+                    limiter.on_throttled(retry_after)
+                error = LLMProviderError(
+                    self.provider_id,
+                    f"HTTP {response.status_code}: {response.text[:200]}",
+                    status_code=response.status_code,
+                    retryable=response.status_code in RETRYABLE_STATUS,
+                )
+
+            if not error.retryable or attempt == self.max_retries:
+                raise error
+            if error.status_code != 429:
+                # 429 waits are handled by the limiter on the next acquire
+                await asyncio.sleep(retry_after if retry_after is not None else self._backoff(attempt))
+
+        raise error
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        return min(8.0, 0.25 * 2 ** attempt) * (0.5 + random.random() / 2)
+
+    async def health_check(self) -> bool:
+        """Healthy unless the limiter is currently paused by a 429."""
+        return self.pool.get_limiter(self.provider_id).get_stats()["paused_for"] == 0
+
+
+class OpenAIProvider(HTTPLLMProvider):
+    """OpenAI chat completions and embeddings API."""
+
+    base_url = settings.openai_base_url
+
+    @property
+    def default_model(self) -> str:
+        return self.config.get("model", "gpt-4o-mini")
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.api_key}"}
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        data = await self.post("/chat/completions", {
+            "model": request.model or self.default_model,
+            "messages": [message.model_dump() for message in request.messages],
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+        })
+        usage = data.get("usage") or {}
+        return LLMResponse(
+            content=data["choices"][0]["message"]["content"] or "",
+            provider=self.provider_id,
+            model=data.get("model"),
+            usage={
+                "input_tokens": usage.get("prompt_tokens", 0),
+                "output_tokens": usage.get("completion_tokens", 0),
+            },
+        )
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        data = await self.post("/embeddings", {
+            "model": self.config.get("embedding_model", "text-embedding-3-small"),
+            "input": texts,
+        })
+        return [item["embedding"] for item in sorted(data["data"], key=lambda item: item["index"])]
+
+
+class AnthropicProvider(HTTPLLMProvider):
+    """Anthropic messages API."""
+
+    base_url = settings.anthropic_base_url
+
+    @property
+    def default_model(self) -> str:
+        return self.config.get("model", "claude-3-5-haiku-latest")
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"x-api-key": self.api_key, "anthropic-version": "2023-06-01"}
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        system = "\n\n".join(m.content for m in request.messages if m.role == "system")
+        payload = {
+            "model": request.model or self.default_model,
+            "messages": [m.model_dump() for m in request.messages if m.role != "system"],
+            "max_tokens": request.max_tokens or settings.max_tokens,
+        }
+        if system:
+            payload["system"] = system
+        if request.temperature is not None:
+            payload["temperature"] = request.temperature
+
+        data = await self.post("/messages", payload)
+        usage = data.get("usage") or {}
+        return LLMResponse(
+            content="".join(block.get("text", "") for block in data.get("content", []) if block.get("type") == "text"),
+            provider=self.provider_id,
+            model=data.get("model"),
+            usage={
+                "input_tokens": usage.get("input_tokens", 0),
+                "output_tokens": usage.get("output_tokens", 0),
+            },
+        )
+
+
+class FailoverProvider(ILLMProvider):
+    """
+    Provider that falls back to alternatives when the primary fails.
+
+    Retryable failures (throttling, 5xx, connection errors) that persist after
+    the primary's own retries move the request to the next provider. The
+    requested model only applies to the primary; fallbacks use their own
+    default model. ``metadata["failover_from"]`` lists the providers skipped.
+    """
+
+    def __init__(self, providers: List[ILLMProvider]):
+        super().__init__(providers[0].provider_id)
+        self.providers = providers
+
+    @property
+    def default_model(self) -> str:
+        return self.providers[0].default_model
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        failed: List[str] = []
+        for index, provider in enumerate(self.providers):
+            attempt = request if index == 0 else request.model_copy(update={"model": None})
+            try:
+                response = await provider.complete(attempt)
+            except LLMProviderError as e:
+                if not e.retryable or index == len(self.providers) - 1:
+                    raise
+                print(f"LLM provider {provider.provider_id} failed, failing over: {e}")
+                failed.append(provider.provider_id)
+                continue
+            if failed:
+                response.metadata = {**response.metadata, "failover_from": failed}
+            return response
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        # Embeddings from different providers are not comparable, so only
+        # the first provider that supports them is used
+        for provider in self.providers:
+            try:
+                return await provider.embed(texts)
+            except NotImplementedError:
+                continue
+        raise NotImplementedError("No configured provider supports embeddings")
+
+    async def health_check(self) -> bool:
+        results = await asyncio.gather(*(p.health_check() for p in self.providers), return_exceptions=True)
+        return any(result is True for result in results)
+
+
+def build_providers(pool: Optional[LLMClientPool] = None) -> List[ILLMProvider]:
+    """
+    Create providers for every configured API key.
+
+    With failover enabled each provider is wrapped so it falls back to the
+    others, in the order: itself, then the remaining configured providers.
+
+    Args:
+        pool: Client pool, defaults to the global pool
+
+    Returns:
+        List[ILLMProvider]: Providers keyed by their provider_id
+    """
+    providers: List[ILLMProvider] = []
+    if settings.openai_api_key:
+        providers.append(OpenAIProvider("openai", settings.openai_api_key, pool=pool))
+    if settings.anthropic_api_key:
+        providers.append(AnthropicProvider("anthropic", settings.anthropic_api_key, pool=pool))
+
+    if not settings.llm_failover_enabled or len(providers) < 2:
+        return providers
+    return [
+        FailoverProvider([primary] + [p for p in providers if p is not primary])
+        for primary in providers
+    ]
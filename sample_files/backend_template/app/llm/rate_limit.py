@@ -0,0 +1,95 @@
+"""
+Adaptive client-side rate limiting for upstream LLM APIs.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+
+class AdaptiveTokenBucket:
+    """
+    Token bucket whose refill rate adapts to upstream throttling.
+
+    Each request takes one token. When the upstream answers 429, the rate is
+    halved and the bucket is paused for the server's retry-after period;
+    each successful request then raises the rate additively back towards the
+    configured maximum (AIMD), so the client settles just below the
+    provider's actual limit instead of repeatedly hitting it.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: int,
+        min_rate: Optional[float] = None,
+        increase: Optional[float] = None,
+    ):
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min_rate or max(rate / 32, 0.1)
+        self.increase = increase or max(rate / 50, 0.01)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+        self.throttled = 0
+
+    async def acquire(self) -> float:
+        """
+        Wait for a token.
+
+        Waiters are served in arrival order.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        started = time.monotonic()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return time.monotonic() - started
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def on_success(self) -> None:
+        """Additively increase the rate after a successful request."""
+        self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttled(self, retry_after: Optional[float] = None) -> None:
+        """
+        Back off after the upstream rejected a request with 429.
+
+        Args:
+            retry_after: Server-provided delay in seconds, if any
+        """
+        self.throttled += 1
+        now = time.monotonic()
+        self._refill(now)
+        # Requests sent before the first 429 of a burst come back throttled
+        # too; only the first one in a pause window reduces the rate
+        if now >= self._paused_until:
+            self.rate = max(self.min_rate, self.rate / 2)
+        self._tokens = 0.0
+        delay = retry_after if retry_after is not None else 1 / self.rate
+        self._paused_until = max(self._paused_until, now + delay)
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def get_stats(self) -> dict:
+        """Get the current rate and throttling count."""
+        return {
+            "rate": round(self.rate, 3),
+            "max_rate": self.max_rate,
+            "tokens": round(self._tokens, 3),
+            "throttled": self.throttled,
+            "paused_for": max(0.0, round(self._paused_until - time.monotonic(), 3)),
+        }
@@ -0,0 +1 @@
+"""Local retrieval indexes for products and knowledge documents."""
@@ -0,0 +1,207 @@
+"""
+Inverted index with BM25 ranking for keyword and exact-identifier search.
+"""
+
+import heapq
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import require_single_worker, settings
+
+
+BM25_FILE = "bm25.json"
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:[-_./][a-z0-9]+)*")
+_SEPARATOR = re.compile(r"[-_./]")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase terms.
+
+    Compound identifiers such as SKUs ("AB-1234-XL") are kept whole and also
+    indexed by their parts, so both exact and partial lookups match.
+    """
+    terms = []
+    for token in _TOKEN.findall(text.lower()):
+        terms.append(token)
+        if _SEPARATOR.search(token):
+            terms.extend(part for part in _SEPARATOR.split(token) if part)
+    return terms
+
+
+class BM25Index:
+    """
+    Incrementally updated inverted index scored with Okapi BM25.
+
+    Postings map each term to the term frequency per document. Per-term IDF
+    values are cached and invalidated when the collection changes.
+
+    Args:
+        k1: Term frequency saturation
+        b: Document length normalisation
+        path: Directory to persist the index in; None keeps it in memory
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, path: Optional[str] = None):
+        self.k1 = k1
+        self.b = b
+        self.path = path
+        self._postings: Dict[str, Dict[str, int]] = {}
+        self._doc_terms: Dict[str, Counter] = {}
+        self._doc_lengths: Dict[str, int] = {}
+        self._total_length = 0
+        self._idf: Dict[str, float] = {}
+        self._lock = threading.RLock()
+
+        if path is not None and os.path.exists(os.path.join(path, BM25_FILE)):
+            self._load()
+
+    def add(self, ids: Sequence[str], texts: Sequence[str]) -> None:
+        """
+        Add or replace documents.
+
+        Args:
+            ids: Document IDs; for an ID given more than once the last text wins
+            texts: Document texts
+        """
+        documents = dict(zip(ids, texts))
+        with self._lock:
+            self.delete(list(documents))
+            for doc_id, text in documents.items():
+                terms = Counter(tokenize(text))
+                self._doc_terms[doc_id] = terms
+                length = sum(terms.values())
+                self._doc_lengths[doc_id] = length
+                self._total_length += length
+                for term, tf in terms.items():
+                    self._postings.setdefault(term, {})[doc_id] = tf
+            self._idf.clear()
+
+    def delete(self, ids: Sequence[str]) -> int:
+        """
+        Delete documents by ID.
+
+        Returns:
+            int: Number of documents deleted
+        """
+        deleted = 0
+        with self._lock:
+            for doc_id in ids:
+                terms = self._doc_terms.pop(doc_id, None)
+                if terms is None:
+                    continue
+                for term in terms:
+                    posting = self._postings[term]
+                    del posting[doc_id]
+                    if not posting:
+                        del self._postings[term]
+                self._total_length -= self._doc_lengths.pop(doc_id)
+                deleted += 1
+            if deleted:
+                self._idf.clear()
+        return deleted
+
+    def search(self, query: str, k: int = 10) -> List[Tuple[str, float]]:
+        """
+        Rank documents for a keyword query.
+
+        Args:
+            query: Query text
+            k: Number of results
+
+        Returns:
+            List of (id, score), best first
+        """
+        with self._lock:
+            if not self._doc_terms:
+                return []
+            average_length = self._total_length / len(self._doc_terms)
+            scores: Dict[str, float] = {}
+            for term in set(tokenize(query)):
+                posting = self._postings.get(term)
+                if not posting:
+                    continue
+                idf = self._term_idf(term, len(posting))
+                for doc_id, tf in posting.items():
+                    norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[doc_id] / average_length)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + norm)
+
+        return heapq.nlargest(k, scores.items(), key=lambda item: item[1])
+
+    def _term_idf(self, term: str, doc_freq: int) -> float:
+        idf = self._idf.get(term)
+        if idf is None:
+            total = len(self._doc_terms)
+            idf = math.log(1 + (total - doc_freq + 0.5) / (doc_freq + 0.5))
+            self._idf[term] = idf
+        return idf
+
+    def save(self) -> None:
+        """Write the index to its directory (persistent indexes only)."""
+        if self.path is None:
+            return
+        with self._lock:
+            os.makedirs(self.path, exist_ok=True)
+            tmp = os.path.join(self.path, BM25_FILE + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"k1": self.k1, "b": self.b, "documents": self._doc_terms}, f)
+            os.replace(tmp, os.path.join(self.path, BM25_FILE))
+
+    def _load(self) -> None:
+        with open(os.path.join(self.path, BM25_FILE), encoding="utf-8") as f:
+            data = json.load(f)
+        self.k1 = data["k1"]
+        self.b = data["b"]
+        for doc_id, terms in data["documents"].items():
+            terms = Counter(terms)
+            self._doc_terms[doc_id] = terms
+            self._doc_lengths[doc_id] = sum(terms.values())
+            self._total_length += self._doc_lengths[doc_id]
+            for term, tf in terms.items():
+                self._postings.setdefault(term, {})[doc_id] = tf
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_terms
+
+    def get_stats(self) -> Dict[str, float]:
+        """Get document, term and length statistics."""
+        return {
+            "documents": len(self._doc_terms),
+            "terms": len(self._postings),
+            "average_length": self._total_length / len(self._doc_terms) if self._doc_terms else 0.0,
+        }
+
+
+_indexes: Dict[str, BM25Index] = {}
+
+
+def get_bm25_index(name: str = "default") -> BM25Index:
+    """
+    Get a named keyword index, creating it on first use.
+
+    Stored alongside the vector index of the same name under VECTOR_INDEX_DIR
+    when that setting is configured, which needs a single server worker.
+    """
+    index = _indexes.get(name)
+    if index is None:
+        path = os.path.join(settings.vector_index_dir, name) if settings.vector_index_dir else None
+        if path is not None:
+            require_single_worker("VECTOR_INDEX_DIR")
+        index = BM25Index(path=path)
+        _indexes[name] = index
+    return index
+
+
+def save_bm25_indexes() -> None:
+    """Persist every keyword index that has a directory."""
+    for index in _indexes.values():
+        index.save()
@@ -0,0 +1,164 @@
+"""
+Hybrid keyword + vector retrieval with reciprocal rank fusion.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.llm.embeddings import embedding_service
+from app.retrieval.bm25 import BM25Index, get_bm25_index
+from app.retrieval.vector_index import VectorIndex, get_vector_index
+
+
+class RetrievalDocument(BaseModel):
+    """A document to index for hybrid retrieval."""
+    id: str
+    text: str
+    metadata: Dict[str, Any] = {}
+
+
+class HybridHit(BaseModel):
+    """A fused search result."""
+    id: str
+    score: float
+    vector_rank: Optional[int] = None
+    keyword_rank: Optional[int] = None
+    metadata: Dict[str, Any] = {}
+
+
+def reciprocal_rank_fusion(
+    rankings: Dict[str, List[str]],
+    rrf_k: int = 60,
+    weights: Optional[Dict[str, float]] = None,
+) -> Dict[str, float]:
+    """
+    Fuse ranked ID lists: each list contributes weight / (rrf_k + rank).
+
+    Args:
+        rankings: Ranked document IDs per retriever, best first
+        rrf_k: Rank damping constant
+        weights: Optional weight per retriever (default 1.0)
+
+    Returns:
+        Dict[str, float]: Fused score per document ID
+    """
+    weights = weights or {}
+    scores: Dict[str, float] = {}
+    for name, ids in rankings.items():
+        weight = weights.get(name, 1.0)
+        for rank, doc_id in enumerate(ids, start=1):
+            scores[doc_id] = scores.get(doc_id, 0.0) + weight / (rrf_k + rank)
+    return scores
+
+
+class HybridRetriever:
+    """
+    Keeps a BM25 index and a vector index over the same documents in sync
+    and queries both concurrently.
+
+    Keyword search catches SKUs and exact product names that embeddings
+    blur; vector search catches paraphrases. Rankings are fused with RRF.
+    """
+
+    def __init__(
+        self,
+        name: str = "default",
+        vector_index: Optional[VectorIndex] = None,
+        keyword_index: Optional[BM25Index] = None,
+        embed_many=None,
+    ):
+        self.vector_index = vector_index or get_vector_index(name)
+        self.keyword_index = keyword_index or get_bm25_index(name)
+        self.embed_many = embed_many or embedding_service.embed_many
+
+    async def index_documents(self, documents: Sequence[RetrievalDocument]) -> int:
+        """
+        Add or replace documents in both indexes.
+
+        Returns:
+            int: Number of documents indexed
+        """
+        if not documents:
+            return 0
+        ids = [doc.id for doc in documents]
+        texts = [doc.text for doc in documents]
+        vectors = await self.embed_many(texts)
+        await asyncio.to_thread(self.vector_index.add, ids, vectors, [doc.metadata for doc in documents])
+        await asyncio.to_thread(self.keyword_index.add, ids, texts)
+        return len(documents)
+
+    async def delete_documents(self, ids: Sequence[str]) -> int:
+        """
+        Remove documents from both indexes.
+
+        Returns:
+            int: Number of documents removed from the vector index
+        """
+        self.keyword_index.delete(ids)
+        return self.vector_index.delete(ids)
+
+    def save(self) -> None:
+        """Persist both indexes (no-op for in-memory indexes)."""
+        self.vector_index.save()
+        self.keyword_index.save()
+
+    async def search(
+        self,
+        query: str,
+        k: int = 10,
+        vector: Optional[List[float]] = None,
+        weights: Optional[Dict[str, float]] = None,
+    ) -> List[HybridHit]:
+        """
+        Search both indexes concurrently and fuse the rankings.
+
+        Args:
+            query: Query text
+            k: Number of results
+            vector: Precomputed query embedding; embedded from query if omitted
+            weights: Optional "vector"/"keyword" weights for fusion
+
+        Returns:
+            List[HybridHit]: Fused results, best first
+        """
+        candidates = k * settings.hybrid_candidate_multiplier
+
+        async def vector_search():
+            query_vector = vector if vector is not None else (await self.embed_many([query]))[0]
+            return (await asyncio.to_thread(self.vector_index.search, query_vector, candidates))[0]
+
+        vector_hits, keyword_hits = await asyncio.gather(
+            vector_search(),
+            asyncio.to_thread(self.keyword_index.search, query, candidates),
+        )
+
+        vector_ids = [doc_id for doc_id, _, _ in vector_hits]
+        keyword_ids = [doc_id for doc_id, _ in keyword_hits]
+        fused = reciprocal_rank_fusion(
+            {"vector": vector_ids, "keyword": keyword_ids},
+            rrf_k=settings.hybrid_rrf_k,
+            weights=weights,
+        )
+
+        vector_ranks = {doc_id: rank for rank, doc_id in enumerate(vector_ids, start=1)}
+        keyword_ranks = {doc_id: rank for rank, doc_id in enumerate(keyword_ids, start=1)}
+
+        # Ties go to keyword matches: exact SKU/name hits are the more precise signal
+        missing = len(vector_ids) + len(keyword_ids) + 1
+        ranked = sorted(
+            fused.items(),
+            key=lambda item: (-item[1], keyword_ranks.get(item[0], missing), vector_ranks.get(item[0], missing)),
+        )[:k]
+        return [
+            HybridHit(
+                id=doc_id,
+                score=score,
+                vector_rank=vector_ranks.get(doc_id),
+                keyword_rank=keyword_ranks.get(doc_id),
+                metadata=self.vector_index.get_metadata(doc_id),
+            )
+            for doc_id, score in ranked
+        ]
@@ -0,0 +1,403 @@
+"""
+In-process vector index with vectorized top-k search.
+
+Vectors live in one contiguous float32 matrix, in memory or memory-mapped
+from a file under the index directory, so a batch of queries is scored with
+a single matrix product and the top k are selected with argpartition.
+Deletes leave tombstones that are removed by compaction.
+
+Growing or compacting a memory-mapped index writes its rows to a new
+vectors file and then points the index at it, so the files on disk always
+describe the same rows. Compaction renumbers rows and rewrites the
+ID/metadata sidecar; growing keeps row numbers, so only a small header
+naming the new file is written. On load, whichever of the two names the
+newer vectors file is used.
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from app.core.config import require_single_worker, settings
+
+
+VECTORS_FILE = "vectors.f32"  # indexes saved before vectors files were versioned
+META_FILE = "meta.json"
+HEADER_FILE = "header.json"  # vectors file and capacity written when the index grows
+
+SearchHit = Tuple[str, float, Dict[str, Any]]
+
+
+class VectorIndex:
+    """
+    Dense vector index supporting incremental add/delete.
+
+    Adding an existing ID replaces its vector (the old row is tombstoned).
+    When tombstones exceed ``compaction_threshold`` of the used rows, the
+    live rows are rewritten contiguously.
+
+    Args:
+        dim: Vector dimension; inferred from the first add if omitted
+        metric: "cosine" (vectors are normalised on insert) or "dot"
+        path: Directory for memory-mapped storage; None keeps the index in memory
+        initial_capacity: Rows allocated up front; capacity doubles as needed
+        compaction_threshold: Tombstone fraction that triggers compaction
+    """
+
+    def __init__(
+        self,
+        dim: Optional[int] = None,
+        metric: str = "cosine",
+        path: Optional[str] = None,
+        initial_capacity: int = 1024,
+        compaction_threshold: Optional[float] = None,
+    ):
+        if metric not in ("cosine", "dot"):
+            raise ValueError(f"Unsupported metric: {metric}")
+        self.dim = dim
+        self.metric = metric
+        self.path = path
+        self.initial_capacity = initial_capacity
+        self.compaction_threshold = (
+            compaction_threshold if compaction_threshold is not None
+            else settings.vector_index_compaction_threshold
+        )
+
+        self._vectors: Optional[np.ndarray] = None
+        self._alive = np.zeros(0, dtype=bool)
+        self._ids: List[Optional[str]] = []
+        self._metadata: List[Optional[Dict[str, Any]]] = []
+        self._rows: Dict[str, int] = {}
+        self._size = 0
+        self._vectors_file = VECTORS_FILE
+        self._generation = 0
+        # Searches may run in worker threads while writers mutate the index
+        self._lock = threading.RLock()
+
+        if path is not None and os.path.exists(os.path.join(path, META_FILE)):
+            self._load()
+
+    def add(
+        self,
+        ids: Sequence[str],
+        vectors: Union[np.ndarray, Sequence[Sequence[float]]],
+        metadata: Optional[Sequence[Optional[Dict[str, Any]]]] = None,
+    ) -> None:
+        """
+        Add or replace vectors.
+
+        Args:
+            ids: Document IDs; for an ID given more than once the last vector wins
+            vectors: Matrix of shape (len(ids), dim)
+            metadata: Optional metadata per vector, returned with search hits
+        """
+        matrix = self._prepare(vectors)
+        if matrix.shape[0] != len(ids):
+            raise ValueError(f"Got {len(ids)} ids for {matrix.shape[0]} vectors")
+        metadata = metadata or [None] * len(ids)
+        last = {doc_id: position for position, doc_id in enumerate(ids)}
+        if len(last) < len(ids):
+            keep = sorted(last.values())
+            ids = [ids[position] for position in keep]
+            matrix = matrix[keep]
+            metadata = [metadata[position] for position in keep]
+
+        with self._lock:
+            self._tombstone(ids)
+            self._reserve(self._size + len(ids))
+            start, end = self._size, self._size + len(ids)
+            self._vectors[start:end] = matrix
+            self._alive[start:end] = True
+            for offset, (doc_id, meta) in enumerate(zip(ids, metadata)):
+                self._ids[start + offset] = doc_id
+                self._metadata[start + offset] = meta
+                self._rows[doc_id] = start + offset
+            self._size = end
+            self.maybe_compact()
+
+    def delete(self, ids: Sequence[str]) -> int:
+        """
+        Delete vectors by ID.
+
+        Returns:
+            int: Number of vectors deleted
+        """
+        with self._lock:
+            deleted = self._tombstone(ids)
+            self.maybe_compact()
+            return deleted
+
+    def search(
+        self,
+        queries: Union[np.ndarray, Sequence[float], Sequence[Sequence[float]]],
+        k: int = 10,
+    ) -> List[List[SearchHit]]:
+        """
+        Find the k nearest vectors for each query.
+
+        Args:
+            queries: One vector of shape (dim,) or a batch of shape (n, dim)
+            k: Results per query
+
+        Returns:
+            One list of (id, score, metadata) per query, best first
+        """
+        with self._lock:
+            if self._vectors is None or len(self) == 0 or k <= 0:
+                return [[] for _ in range(np.atleast_2d(queries).shape[0])]
+
+            matrix = self._prepare(queries)
+            scores = matrix @ self._vectors[:self._size].T
+            scores[:, ~self._alive[:self._size]] = -np.inf
+
+            k = min(k, len(self))
+            if k < scores.shape[1]:
+                top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            else:
+                top = np.broadcast_to(np.arange(scores.shape[1]), (scores.shape[0], scores.shape[1]))
+            top_scores = np.take_along_axis(scores, top, axis=1)
+            order = np.argsort(-top_scores, axis=1)
+            top = np.take_along_axis(top, order, axis=1)
+            top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+            return [
+                [
+                    (self._ids[row], float(score), self._metadata[row] or {})
+                    for row, score in zip(rows, row_scores)
+                ]
+                for rows, row_scores in zip(top.tolist(), top_scores.tolist())
+            ]
+
+    def get(self, doc_id: str) -> Optional[np.ndarray]:
+        """Get a copy of the stored vector for an ID."""
+        with self._lock:
+            row = self._rows.get(doc_id)
+            return None if row is None else np.array(self._vectors[row])
+
+    def get_metadata(self, doc_id: str) -> Dict[str, Any]:
+        """Get the metadata stored for an ID (empty if unknown)."""
+        with self._lock:
+            row = self._rows.get(doc_id)
+            return {} if row is None else (self._metadata[row] or {})
+
+    def maybe_compact(self) -> bool:
+        """Compact if the tombstone fraction exceeds the threshold."""
+        if self._size and self.tombstones / self._size > self.compaction_threshold:
+            self.compact()
+            return True
+        return False
+
+    def compact(self) -> None:
+        """Rewrite live rows contiguously, dropping tombstones."""
+        with self._lock:
+            if self._vectors is None:
+                return
+            live = np.flatnonzero(self._alive[:self._size])
+            capacity = max(self.initial_capacity, len(live))
+            vectors = self._allocate(capacity)
+            vectors[:len(live)] = self._vectors[live]
+            self._install(vectors)
+
+            self._ids = [self._ids[row] for row in live] + [None] * (capacity - len(live))
+            self._metadata = [self._metadata[row] for row in live] + [None] * (capacity - len(live))
+            self._alive = np.zeros(capacity, dtype=bool)
+            self._alive[:len(live)] = True
+            self._rows = {doc_id: row for row, doc_id in enumerate(self._ids[:len(live)])}
+            self._size = len(live)
+            self.save()
+
+    def save(self) -> None:
+        """Flush vectors and write the ID/metadata sidecar (memory-mapped indexes only)."""
+        if self.path is None:
+            return
+        with self._lock:
+            if isinstance(self._vectors, np.memmap):
+                self._vectors.flush()
+            meta = {
+                "vectors_file": self._vectors_file,
+                "dim": self.dim,
+                "metric": self.metric,
+                "size": self._size,
+                "capacity": self.capacity,
+                "ids": self._ids[:self._size],
+                "alive": self._alive[:self._size].tolist(),
+                "metadata": self._metadata[:self._size],
+            }
+            tmp = os.path.join(self.path, META_FILE + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(tmp, os.path.join(self.path, META_FILE))
+            self._remove_stale_files()
+
+    @property
+    def capacity(self) -> int:
+        return 0 if self._vectors is None else self._vectors.shape[0]
+
+    @property
+    def tombstones(self) -> int:
+        return self._size - len(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._rows
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get size, capacity and tombstone counts."""
+        return {
+            "vectors": len(self),
+            "tombstones": self.tombstones,
+            "capacity": self.capacity,
+            "dim": self.dim,
+            "metric": self.metric,
+            "memory_mapped": isinstance(self._vectors, np.memmap),
+        }
+
+    def _prepare(self, vectors) -> np.ndarray:
+        matrix = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        if self.dim is None:
+            self.dim = matrix.shape[1]
+        if matrix.shape[1] != self.dim:
+            raise ValueError(f"Expected vectors of dimension {self.dim}, got {matrix.shape[1]}")
+        if self.metric == "cosine":
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix = matrix / np.where(norms == 0, 1, norms)
+        return matrix
+
+    def _tombstone(self, ids: Sequence[str]) -> int:
+        deleted = 0
+        for doc_id in ids:
+            row = self._rows.pop(doc_id, None)
+            if row is not None:
+                self._alive[row] = False
+                self._metadata[row] = None
+                deleted += 1
+        return deleted
+
+    def _reserve(self, rows: int) -> None:
+        if rows <= self.capacity:
+            return
+        capacity = max(self.initial_capacity, self.capacity)
+        while capacity < rows:
+            capacity *= 2
+
+        vectors = self._allocate(capacity)
+        if self._vectors is not None:
+            vectors[:self._size] = self._vectors[:self._size]
+        self._install(vectors)
+
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:self._size] = self._alive[:self._size]
+        self._alive = alive
+        self._ids.extend([None] * (capacity - len(self._ids)))
+        self._metadata.extend([None] * (capacity - len(self._metadata)))
+        self._save_header()
+
+    def _allocate(self, capacity: int) -> np.ndarray:
+        if self.path is None:
+            return np.zeros((capacity, self.dim), dtype=np.float32)
+        os.makedirs(self.path, exist_ok=True)
+        # A new file per generation; the files on disk keep naming the
+        # previous one until the new one is installed and recorded
+        self._generation += 1
+        return np.memmap(
+            os.path.join(self.path, f"vectors.{self._generation}.f32"),
+            dtype=np.float32,
+            mode="w+",
+            shape=(capacity, self.dim),
+        )
+
+    def _install(self, vectors: np.ndarray) -> None:
+        if self.path is not None:
+            vectors.flush()
+            self._vectors_file = os.path.basename(vectors.filename)
+        self._vectors = vectors
+
+    def _save_header(self) -> None:
+        """
+        Point the index on disk at the current vectors file.
+
+        Used when growing: rows keep their numbers, so the saved sidecar
+        still describes the first rows of the new file.
+        """
+        if self.path is None:
+            return
+        tmp = os.path.join(self.path, HEADER_FILE + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"vectors_file": self._vectors_file, "capacity": self.capacity}, f)
+        os.replace(tmp, os.path.join(self.path, HEADER_FILE))
+        self._remove_stale_files()
+
+    def _remove_stale_files(self) -> None:
+        """Delete vectors files the sidecar no longer points to."""
+        for name in os.listdir(self.path):
+            if name.startswith("vectors.") and name != self._vectors_file:
+                try:
+                    os.remove(os.path.join(self.path, name))
+                except OSError:
+                    pass  # still mapped on some platforms; removed on a later save
+
+    def _load(self) -> None:
+        with open(os.path.join(self.path, META_FILE), encoding="utf-8") as f:
+            meta = json.load(f)
+        self.dim = meta["dim"]
+        self.metric = meta["metric"]
+        self._size = meta["size"]
+        capacity = meta["capacity"]
+        self._vectors_file = meta.get("vectors_file", VECTORS_FILE)
+        self._generation = _generation(self._vectors_file)
+        header_path = os.path.join(self.path, HEADER_FILE)
+        if os.path.exists(header_path):
+            with open(header_path, encoding="utf-8") as f:
+                header = json.load(f)
+            # The index grew after the sidecar was saved
+            if _generation(header["vectors_file"]) > self._generation:
+                self._vectors_file = header["vectors_file"]
+                self._generation = _generation(self._vectors_file)
+                capacity = header["capacity"]
+        self._vectors = np.memmap(
+            os.path.join(self.path, self._vectors_file), dtype=np.float32, mode="r+", shape=(capacity, self.dim)
+        )
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._alive[:self._size] = meta["alive"]
+        self._ids = meta["ids"] + [None] * (capacity - self._size)
+        self._metadata = meta["metadata"] + [None] * (capacity - self._size)
+        self._rows = {
+            doc_id: row for row, doc_id in enumerate(meta["ids"]) if meta["alive"][row]
+        }
+
+
+def _generation(vectors_file: str) -> int:
+    """Generation of a vectors file name; 0 for the unversioned file."""
+    return 0 if vectors_file == VECTORS_FILE else int(vectors_file.split(".")[1])
+
+
+_indexes: Dict[str, VectorIndex] = {}
+
+
+def get_vector_index(name: str = "default") -> VectorIndex:
+    """
+    Get a named index, creating it on first use.
+
+    Indexes are memory-mapped under VECTOR_INDEX_DIR/<name> when that setting
+    is configured, and held in memory otherwise. Only one process may write
+    the files, so that setting needs a single server worker.
+    """
+    index = _indexes.get(name)
+    if index is None:
+        path = os.path.join(settings.vector_index_dir, name) if settings.vector_index_dir else None
+        if path is not None:
+            require_single_worker("VECTOR_INDEX_DIR")
+        index = VectorIndex(metric=settings.vector_index_metric, path=path)
+        _indexes[name] = index
+    return index
+
+
+def save_vector_indexes() -> None:
+    """Persist every memory-mapped index."""
+    for index in _indexes.values():
+        index.save()
@@ -0,0 +1 @@
+"""Dispatch of agent tasks and workflow runs to local or remote workers."""
@@ -0,0 +1,206 @@
+"""
+Celery task queue backend.
+
+API processes keep ordering tasks with their fair queue and send a task to
+Celery only when one of their ``workers`` slots is free, so Celery's own
+queue stays short and tasks can be run by any worker host. Workers publish
+each task's events, and finally its outcome, to a Redis stream that the
+submitting API process reads, so results stream back as they are produced.
+
+Task state is mirrored into Redis (see app.tasks.task_store), so with
+several API processes any of them can serve a task's state and events and
+accept its cancellation, whichever process it was submitted to.
+
+Run workers with:
+    celery -A app.tasks.celery_queue worker --concurrency 4
+
+Workers need the agents and workflows that tasks are routed to; set
+TASK_WORKER_SETUP to a function registering them (see app.tasks.runner).
+"""
+
+import asyncio
+from typing import AsyncIterator, Optional, Tuple, Union
+
+import redis
+import redis.asyncio as aioredis
+from celery import Celery
+
+from app.core.config import settings
+from app.core.serialization import dumps
+from app.interfaces.streaming import StreamEvent
+from app.interfaces.task_queue import QueuedTask, TaskOutcome
+from app.tasks.queue import DispatchingTaskQueue, _TaskRecord
+from app.tasks.runner import run_queued_task, setup_worker
+from app.tasks.task_store import RedisTaskStore, events_key
+
+
+RUN_TASK = "app.tasks.run_queued_task"
+
+celery_app = Celery("app", broker=settings.celery_broker_url)
+celery_app.conf.update(
+    task_serializer="json",
+    accept_content=["json"],
+    task_ignore_result=True,  # outcomes return over the task's event stream
+    worker_prefetch_multiplier=1,  # API processes order tasks; workers should not hoard them
+    broker_transport_options={"priority_steps": list(range(10)), "queue_order_strategy": "priority"},
+)
+
+
+# Worker side
+
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_redis: Optional[redis.Redis] = None
+
+
+def _worker_state() -> Tuple[asyncio.AbstractEventLoop, redis.Redis]:
+    """Event loop and Redis client of this worker process, created on first use."""
+    global _worker_loop, _worker_redis
+    if _worker_loop is None:
+        # One loop per process, so agents can keep loop-bound clients between tasks
+        _worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+        _worker_redis = redis.Redis.from_url(settings.redis_url)
+        _worker_loop.run_until_complete(setup_worker())
+    return _worker_loop, _worker_redis
+
+
+@celery_app.task(name=RUN_TASK)
+def run_task(raw: str) -> None:
+    """Run a queued task and publish its events and outcome."""
+    task = QueuedTask.model_validate_json(raw)
+    loop, client = _worker_state()
+    key = events_key(task.task_id)
+
+    def publish(event: StreamEvent) -> None:
+        client.xadd(key, {"event": dumps(event)}, maxlen=settings.task_queue_max_events, approximate=True)
+
+    outcome = loop.run_until_complete(run_queued_task(task, publish))
+    client.xadd(key, {"outcome": dumps(outcome)})
+    client.expire(key, settings.task_queue_result_ttl)
+
+
+# API side
+
+class CeleryTaskQueue(DispatchingTaskQueue):
+    """Runs tasks on Celery workers and reads their events from Redis."""
+
+    backend = "celery"
+    shared_state = True
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._redis: Optional[aioredis.Redis] = None
+        self._store: Optional[RedisTaskStore] = None
+        # Task snapshots to store, in order; a future marks a flush point
+        self._writes: "asyncio.Queue[Union[QueuedTask, asyncio.Future, None]]" = asyncio.Queue()
+        self._writer: Optional[asyncio.Task] = None
+        self._listener: Optional[asyncio.Task] = None
+
+    async def _start_backend(self) -> None:
+        self._redis = aioredis.from_url(settings.redis_url)
+        self._store = RedisTaskStore(self._redis, self.result_ttl)
+        self._writer = asyncio.create_task(self._write_loop())
+        self._listener = asyncio.create_task(self._listen_for_cancels())
+
+    async def _stop_backend(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        if self._writer is not None:
+            # Store the final states of tasks cancelled by the shutdown
+            self._writes.put_nowait(None)
+            await asyncio.gather(self._writer, return_exceptions=True)
+            self._writer = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+            self._store = None
+
+    # Shared state
+
+    async def submit(self, task: QueuedTask) -> QueuedTask:
+        task = await super().submit(task)
+        if self._writer is not None:
+            # Stored before the caller hears of the task, so any process can look it up
+            flushed = asyncio.get_running_loop().create_future()
+            self._writes.put_nowait(flushed)
+            await flushed
+        return task
+
+    async def get(self, task_id: str) -> Optional[QueuedTask]:
+        task = await super().get(task_id)
+        if task is None and self._store is not None:
+            task = await self._store.load(task_id)
+        return task
+
+    async def cancel(self, task_id: str) -> bool:
+        if task_id in self._records or self._store is None:
+            return await super().cancel(task_id)
+        return await self._store.request_cancel(task_id)
+
+    async def events(self, task_id: str) -> AsyncIterator[StreamEvent]:
+        if task_id in self._records or self._store is None:
+            async for event in super().events(task_id):
+                yield event
+            return
+        if await self._store.load(task_id) is None:
+            raise LookupError(f"Task not found: {task_id}")
+        async for event in self._store.events(task_id):
+            yield event
+
+    def _on_change(self, record: _TaskRecord) -> None:
+        if self._writer is not None:
+            self._writes.put_nowait(record.task.model_copy())
+
+    async def _write_loop(self) -> None:
+        while True:
+            item = await self._writes.get()
+            if item is None:
+                return
+            if isinstance(item, asyncio.Future):
+                if not item.done():
+                    item.set_result(None)
+                continue
+            try:
+                await self._store.save(item)
+            except Exception as e:
+                print(f"⚠️  Could not store task {item.task_id} in Redis: {e}")
+
+    async def _listen_for_cancels(self) -> None:
+        while True:
+            try:
+                async for task_id in self._store.cancel_requests():
+                    if task_id in self._records:
+                        await super().cancel(task_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️  Task cancel listener failed, reconnecting: {e}")
+                await asyncio.sleep(1.0)
+
+    # Execution
+
+    async def _execute(self, record: _TaskRecord) -> TaskOutcome:
+        task = record.task
+        await asyncio.to_thread(
+            celery_app.send_task,
+            RUN_TASK,
+            args=[task.model_dump_json()],
+            task_id=task.task_id,
+            priority=9 - task.priority,  # 0 is Celery's highest priority on Redis
+            time_limit=task.timeout + settings.task_queue_timeout_grace,
+        )
+        key = events_key(task.task_id)
+        last_id = "0-0"
+        while True:
+            response = await self._redis.xread({key: last_id}, count=100, block=1000)
+            for _, entries in response:
+                for entry_id, fields in entries:
+                    last_id = entry_id
+                    if b"outcome" in fields:
+                        return TaskOutcome.model_validate_json(fields[b"outcome"])
+                    self._publish(record, StreamEvent.model_validate_json(fields[b"event"]))
+
+    async def _abort(self, record: _TaskRecord) -> None:
+        await asyncio.to_thread(celery_app.control.revoke, record.task.task_id, terminate=True, signal="SIGKILL")
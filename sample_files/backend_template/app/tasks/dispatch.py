@@ -0,0 +1,39 @@
+"""
+Task queue selection.
+
+TASK_QUEUE_BACKEND picks where queued agent tasks and workflow runs
+execute: ``local`` in the API process, ``process`` in local worker
+processes, ``celery`` on Celery workers. All three share the same
+priorities, tenant fairness, timeouts and event streaming.
+"""
+
+from typing import Optional
+
+from app.core.config import settings
+from app.interfaces.task_queue import ITaskQueue
+
+
+def build_task_queue(backend: Optional[str] = None) -> ITaskQueue:
+    """
+    Create the task queue for a backend.
+
+    Args:
+        backend: local, process or celery; defaults to TASK_QUEUE_BACKEND
+
+    Returns:
+        ITaskQueue: Queue to start with the application
+    """
+    backend = backend or settings.task_queue_backend
+    if backend == "celery":
+        from app.tasks.celery_queue import CeleryTaskQueue
+
+        return CeleryTaskQueue()
+    from app.tasks.local import InProcessTaskQueue, ProcessTaskQueue
+
+    if backend == "process":
+        return ProcessTaskQueue()
+    return InProcessTaskQueue()
+
+
+# Global task queue instance
+task_queue = build_task_queue()
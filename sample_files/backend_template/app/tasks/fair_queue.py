@@ -0,0 +1,94 @@
+"""
+Priority queue with round-robin fairness between tenants.
+
+Items are taken from the highest priority level that has any; within a
+level, tenants take turns, one item each, so a tenant that submits a
+thousand tasks delays another tenant's task by at most one task per
+tenant rather than by the whole backlog. Order within a tenant is FIFO.
+"""
+
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, Hashable, Optional
+
+
+class FairQueue:
+    """
+    Strict-priority, tenant-fair FIFO queue.
+
+    Usage:
+        queue = FairQueue()
+        queue.push("task-1", priority=5, tenant="acme")
+        task_id = queue.pop(eligible=lambda tenant: running[tenant] < 2)
+    """
+
+    def __init__(self):
+        # priority -> tenant -> items, tenants in turn order
+        self._levels: Dict[int, "OrderedDict[str, Deque[Hashable]]"] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, item: Hashable, priority: int, tenant: str) -> None:
+        """Add an item behind the tenant's other items at this priority."""
+        tenants = self._levels.setdefault(priority, OrderedDict())
+        items = tenants.get(tenant)
+        if items is None:
+            items = tenants[tenant] = deque()
+        items.append(item)
+        self._size += 1
+
+    def pop(self, eligible: Optional[Callable[[str], bool]] = None) -> Optional[Hashable]:
+        """
+        Take the next item.
+
+        Args:
+            eligible: Returns False for tenants that must not be served now
+                (e.g. at their concurrency limit); their items are skipped
+                and keep their place in the turn order
+
+        Returns:
+            Optional[Hashable]: The item, or None if no eligible item is queued
+        """
+        for priority in sorted(self._levels, reverse=True):
+            tenants = self._levels[priority]
+            for tenant in tenants:
+                if eligible is not None and not eligible(tenant):
+                    continue
+                items = tenants[tenant]
+                item = items.popleft()
+                # The tenant's next item waits for every other tenant's turn
+                if items:
+                    tenants.move_to_end(tenant)
+                else:
+                    del tenants[tenant]
+                if not tenants:
+                    del self._levels[priority]
+                self._size -= 1
+                return item
+        return None
+
+    def remove(self, item: Hashable, priority: int, tenant: str) -> bool:
+        """Remove a queued item; returns False if it is not queued."""
+        tenants = self._levels.get(priority)
+        items = tenants.get(tenant) if tenants is not None else None
+        if items is None:
+            return False
+        try:
+            items.remove(item)
+        except ValueError:
+            return False
+        if not items:
+            del tenants[tenant]
+            if not tenants:
+                del self._levels[priority]
+        self._size -= 1
+        return True
+
+    def depth_by_tenant(self) -> Dict[str, int]:
+        """Number of queued items per tenant."""
+        depth: Dict[str, int] = {}
+        for tenants in self._levels.values():
+            for tenant, items in tenants.items():
+                depth[tenant] = depth.get(tenant, 0) + len(items)
+        return depth
@@ -0,0 +1,193 @@
+"""
+Local task queue backends: in the API process, or in worker processes.
+
+InProcessTaskQueue runs tasks on the API process's event loop and needs
+nothing else, which suits development and tests. ProcessTaskQueue runs
+each task in one of ``workers`` worker processes, one task per process
+at a time, so a task hogging the CPU cannot stall the API and a task
+overrunning its timeout can be killed with its process.
+
+Worker processes are forked by default and inherit the parent's agent and
+workflow registries. With TASK_QUEUE_START_METHOD=spawn they start fresh
+and TASK_WORKER_SETUP must register them (see app.tasks.runner).
+"""
+
+import asyncio
+import multiprocessing
+import queue
+import signal
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.serialization import dumps
+from app.interfaces.streaming import StreamEvent
+from app.interfaces.task_queue import QueuedTask, TaskOutcome
+from app.tasks.queue import DispatchingTaskQueue, _TaskRecord
+from app.tasks.runner import run_queued_task, setup_worker
+
+
+class InProcessTaskQueue(DispatchingTaskQueue):
+    """Runs tasks as asyncio tasks in the API process."""
+
+    backend = "local"
+
+    async def _execute(self, record: _TaskRecord) -> TaskOutcome:
+        return await run_queued_task(record.task, lambda event: self._publish(record, event))
+
+
+# Worker processes
+
+def _worker_main(inbox, outbox) -> None:
+    # Interrupts are for the parent, which stops workers through their inbox
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    asyncio.run(_worker_loop(inbox, outbox))
+
+
+async def _worker_loop(inbox, outbox) -> None:
+    await setup_worker()
+    loop = asyncio.get_running_loop()
+    while True:
+        raw = await loop.run_in_executor(None, inbox.get)
+        if raw is None:
+            return
+        task = QueuedTask.model_validate_json(raw)
+        task_id = task.task_id
+        outcome = await run_queued_task(task, lambda event: outbox.put(("event", task_id, dumps(event))))
+        outbox.put(("done", task_id, dumps(outcome)))
+
+
+class _WorkerProcess:
+    """A worker process, its task inbox and the task it is running."""
+
+    def __init__(self, process, inbox):
+        self.process = process
+        self.inbox = inbox
+        self.task_id: Optional[str] = None
+
+
+class ProcessTaskQueue(DispatchingTaskQueue):
+    """
+    Runs tasks in a pool of worker processes.
+
+    Events and outcomes return over a shared multiprocessing queue as JSON.
+    A worker that overruns its task's timeout, is cancelled or dies is
+    replaced by a new process.
+
+    Args:
+        start_method: multiprocessing start method; defaults to
+            TASK_QUEUE_START_METHOD or the platform default
+        **kwargs: DispatchingTaskQueue options
+    """
+
+    backend = "process"
+
+    def __init__(self, start_method: Optional[str] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.start_method = start_method or settings.task_queue_start_method
+        self._context = None
+        self._outbox = None
+        self._processes: List[_WorkerProcess] = []
+        self._waiting: Dict[str, asyncio.Future] = {}
+        self._reader: Optional[asyncio.Task] = None
+        self.restarts = 0
+
+    async def _start_backend(self) -> None:
+        self._context = multiprocessing.get_context(self.start_method)
+        self._outbox = self._context.Queue()
+        # Fork from an executor thread: a child forked from the event loop's
+        # thread would believe the parent's loop is still running in it
+        loop = asyncio.get_running_loop()
+        for _ in range(self.workers):
+            self._processes.append(await loop.run_in_executor(None, self._spawn))
+        self._reader = asyncio.create_task(self._read_outbox())
+
+    async def _stop_backend(self) -> None:
+        loop = asyncio.get_running_loop()
+        workers = list(self._processes)
+        for worker in workers:
+            worker.inbox.put(None)
+        for worker in workers:
+            await loop.run_in_executor(None, worker.process.join, settings.task_queue_timeout_grace)
+            if worker.process.is_alive():
+                worker.process.kill()
+        self._processes = []
+        if self._reader is not None:
+            self._outbox.put(None)
+            await asyncio.gather(self._reader, return_exceptions=True)
+            self._reader = None
+
+    def _spawn(self) -> _WorkerProcess:
+        inbox = self._context.Queue()
+        process = self._context.Process(target=_worker_main, args=(inbox, self._outbox), name="task-worker", daemon=True)
+        process.start()
+        return _WorkerProcess(process, inbox)
+
+    async def _replace(self, worker: _WorkerProcess) -> None:
+        """Kill a worker and start a new process in its place."""
+        loop = asyncio.get_running_loop()
+        if worker.process.is_alive():
+            worker.process.kill()
+        await loop.run_in_executor(None, worker.process.join)
+        if worker.task_id is not None:
+            future = self._waiting.pop(worker.task_id, None)
+            if future is not None and not future.done():
+                future.set_exception(RuntimeError(f"Task worker exited with code {worker.process.exitcode}"))
+        if worker not in self._processes:
+            return
+        if self._stopping:
+            self._processes.remove(worker)
+        else:
+            self._processes[self._processes.index(worker)] = await loop.run_in_executor(None, self._spawn)
+            self.restarts += 1
+
+    async def _execute(self, record: _TaskRecord) -> TaskOutcome:
+        worker = next((w for w in self._processes if w.task_id is None), None)
+        if worker is None:
+            raise RuntimeError("No idle task worker")
+        task_id = record.task.task_id
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[task_id] = future
+        worker.task_id = task_id
+        worker.inbox.put(record.task.model_dump_json())
+        try:
+            outcome = await future
+        finally:
+            self._waiting.pop(task_id, None)
+        # Left busy if cancelled; _abort replaces the process
+        worker.task_id = None
+        return outcome
+
+    async def _abort(self, record: _TaskRecord) -> None:
+        worker = next((w for w in self._processes if w.task_id == record.task.task_id), None)
+        if worker is not None:
+            await self._replace(worker)
+
+    async def _read_outbox(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                message = await loop.run_in_executor(None, self._outbox.get, True, 1.0)
+            except queue.Empty:
+                for worker in list(self._processes):
+                    if not worker.process.is_alive():
+                        print(f"⚠️  Task worker {worker.process.pid} exited with code {worker.process.exitcode}; restarting")
+                        await self._replace(worker)
+                continue
+            if message is None:
+                return
+            kind, task_id, payload = message
+            if kind == "event":
+                record = self._records.get(task_id)
+                if record is not None:
+                    self._publish(record, StreamEvent.model_validate_json(payload))
+            else:
+                future = self._waiting.get(task_id)
+                if future is not None and not future.done():
+                    future.set_result(TaskOutcome.model_validate_json(payload))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **super().get_stats(),
+            "processes": sum(1 for worker in self._processes if worker.process.is_alive()),
+            "restarts": self.restarts,
+        }
@@ -0,0 +1,351 @@
+"""
+Dispatching task queue shared by all backends.
+
+Submitted tasks wait in a FairQueue (strict priority, round-robin between
+tenants) in the API process and are handed to the backend's workers only
+when one of ``workers`` slots is free, so the fairness decision is made at
+the last moment and a backlog never piles up inside a backend queue where
+it could no longer be reordered. Backends differ only in where a task
+runs (``_execute``) and how a stuck run is stopped (``_abort``).
+
+Each task keeps a bounded log of its events, so subscribers can join at
+any time and first receive the events still buffered. Finished tasks are
+kept for TASK_QUEUE_RESULT_TTL seconds.
+
+Task state lives in the process that accepted the submission. Backends
+without ``shared_state`` therefore refuse to start in a server running
+several API processes, where a later request for the task could land on
+a process that has never seen it.
+"""
+
+import asyncio
+import time
+from abc import abstractmethod
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+from app.core.config import require_single_worker, settings
+from app.interfaces.streaming import StreamEvent, StreamEventType
+from app.interfaces.task_queue import (
+    FINISHED_STATES,
+    ITaskQueue,
+    QueuedTask,
+    QueueFullError,
+    TaskOutcome,
+    TaskState,
+)
+from app.tasks.fair_queue import FairQueue
+from app.tasks.runner import default_timeout
+
+
+class _TaskRecord:
+    """A task with its buffered events and the run executing it."""
+
+    __slots__ = ("task", "events", "first", "changed", "handle", "cancel_requested", "holds_slot")
+
+    def __init__(self, task: QueuedTask, max_events: int):
+        self.task = task
+        self.events: Deque[StreamEvent] = deque(maxlen=max_events)
+        self.first = 0  # position of events[0] in the task's full event sequence
+        self.changed = asyncio.Event()
+        self.handle: Optional[asyncio.Task] = None
+        self.cancel_requested = False
+        self.holds_slot = False  # counted in the queue's running totals
+
+    @property
+    def finished(self) -> bool:
+        return self.task.state in FINISHED_STATES
+
+    def append(self, event: StreamEvent) -> None:
+        if len(self.events) == self.events.maxlen:
+            self.first += 1
+        self.events.append(event)
+        self.notify()
+
+    def notify(self) -> None:
+        # Wake current subscribers; later ones wait on a fresh event
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+
+def final_event(outcome: TaskOutcome, last: Optional[StreamEvent]) -> Optional[StreamEvent]:
+    """
+    Event telling subscribers how a task ended.
+
+    Args:
+        outcome: How the task ended
+        last: The task's last published event, if any
+
+    Returns:
+        Optional[StreamEvent]: RESULT or ERROR event, or None if ``last``
+            already reports the outcome
+    """
+    if outcome.state == TaskState.COMPLETED:
+        if last is None or last.type != StreamEventType.RESULT:
+            return StreamEvent(type=StreamEventType.RESULT, data=outcome.result)
+    elif last is None or last.type != StreamEventType.ERROR:
+        return StreamEvent(type=StreamEventType.ERROR, data={"state": outcome.state.value, "error": outcome.error})
+    return None
+
+
+class DispatchingTaskQueue(ITaskQueue):
+    """
+    Base class for queue backends dispatching from a fair in-process queue.
+
+    Args:
+        workers: Tasks run at once; defaults to TASK_QUEUE_WORKERS or
+            MAX_CONCURRENT_AGENTS
+        tenant_max_running: Running tasks allowed per tenant, 0 for no limit
+        max_pending: Queued tasks before submissions are rejected
+        max_events: Events buffered per task for subscribers
+        result_ttl: Seconds finished tasks are kept
+    """
+
+    backend = "base"
+    shared_state = False  # tasks can be looked up from any API process
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        tenant_max_running: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        max_events: Optional[int] = None,
+        result_ttl: Optional[float] = None,
+    ):
+        self.workers = workers or settings.task_queue_workers or settings.max_concurrent_agents
+        self.tenant_max_running = (
+            settings.task_queue_tenant_max_running if tenant_max_running is None else tenant_max_running
+        )
+        self.max_pending = max_pending or settings.task_queue_max_pending
+        self.max_events = max_events or settings.task_queue_max_events
+        self.result_ttl = settings.task_queue_result_ttl if result_ttl is None else result_ttl
+
+        self._pending = FairQueue()
+        self._records: Dict[str, _TaskRecord] = {}
+        self._finished: "OrderedDict[str, float]" = OrderedDict()  # task_id -> monotonic finish time
+        self._running_by_tenant: Dict[str, int] = {}
+        self._running = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._stopping = False
+        self._counts: Dict[str, int] = {state.value: 0 for state in FINISHED_STATES}
+        self.submitted = 0
+        self.rejected = 0
+
+    # Backend hooks
+
+    async def _start_backend(self) -> None:
+        """Start the backend's workers."""
+
+    async def _stop_backend(self) -> None:
+        """Stop the backend's workers."""
+
+    @abstractmethod
+    async def _execute(self, record: _TaskRecord) -> TaskOutcome:
+        """
+        Run a task on a worker, calling ``self._publish`` for each event.
+
+        Cancelling the coroutine must stop the task from being waited on;
+        ``_abort`` is called afterwards to stop the worker side.
+        """
+        pass
+
+    async def _abort(self, record: _TaskRecord) -> None:
+        """Stop a task that was cancelled or overran its timeout on its worker."""
+
+    def _on_change(self, record: _TaskRecord) -> None:
+        """Called when a task is queued, starts running or finishes."""
+
+    # ITaskQueue
+
+    async def start(self) -> None:
+        if self._dispatcher is not None:
+            return
+        if not self.shared_state:
+            require_single_worker(f"The {self.backend} task queue backend")
+        await self._start_backend()
+        self._wakeup = asyncio.Event()
+        self._dispatcher = asyncio.create_task(self._dispatch_loop())
+        print(f"✅ Task queue started ({self.backend} backend, {self.workers} workers)")
+
+    async def stop(self) -> None:
+        if self._dispatcher is None:
+            return
+        self._stopping = True
+        self._dispatcher.cancel()
+        handles = [record.handle for record in self._records.values() if record.handle is not None]
+        for handle in handles:
+            handle.cancel()
+        await asyncio.gather(self._dispatcher, *handles, return_exceptions=True)
+        self._dispatcher = None
+        for record in self._records.values():
+            if record.task.state == TaskState.QUEUED:
+                self._finish(record, TaskOutcome(state=TaskState.CANCELLED, error="Task queue stopped"))
+        await self._stop_backend()
+        self._stopping = False
+
+    async def submit(self, task: QueuedTask) -> QueuedTask:
+        if len(self._pending) >= self.max_pending:
+            self.rejected += 1
+            raise QueueFullError(f"Task queue is full ({self.max_pending} tasks waiting)")
+        limit = default_timeout(task.kind)
+        task.timeout = min(task.timeout, limit) if task.timeout else limit
+        task.state = TaskState.QUEUED
+        self._purge()
+        self._records[task.task_id] = _TaskRecord(task, self.max_events)
+        self._pending.push(task.task_id, task.priority, task.tenant)
+        self._on_change(self._records[task.task_id])
+        self.submitted += 1
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return task
+
+    async def get(self, task_id: str) -> Optional[QueuedTask]:
+        record = self._records.get(task_id)
+        return record.task if record is not None else None
+
+    async def cancel(self, task_id: str) -> bool:
+        record = self._records.get(task_id)
+        if record is None or record.finished:
+            return False
+        task = record.task
+        if task.state == TaskState.QUEUED:
+            self._pending.remove(task_id, task.priority, task.tenant)
+            self._finish(record, TaskOutcome(state=TaskState.CANCELLED, error="Task cancelled"))
+            return True
+        record.cancel_requested = True
+        if record.handle is not None:
+            record.handle.cancel()
+        return True
+
+    async def events(self, task_id: str) -> AsyncIterator[StreamEvent]:
+        record = self._records.get(task_id)
+        if record is None:
+            raise LookupError(f"Task not found: {task_id}")
+        position = record.first
+        while True:
+            waiter = record.changed
+            while position < record.first + len(record.events):
+                # Events dropped from a full buffer are skipped
+                position = max(position, record.first)
+                event = record.events[position - record.first]
+                position += 1
+                yield event
+            if record.finished:
+                return
+            await waiter.wait()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "workers": self.workers,
+            "running": self._running,
+            "pending": len(self._pending),
+            "pending_by_tenant": self._pending.depth_by_tenant(),
+            "running_by_tenant": {tenant: count for tenant, count in self._running_by_tenant.items() if count},
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            **self._counts,
+        }
+
+    # Dispatch
+
+    def _eligible(self, tenant: str) -> bool:
+        return not self.tenant_max_running or self._running_by_tenant.get(tenant, 0) < self.tenant_max_running
+
+    async def _dispatch_loop(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._running < self.workers:
+                task_id = self._pending.pop(self._eligible)
+                if task_id is None:
+                    break
+                record = self._records[task_id]
+                task = record.task
+                # Marked running before the run is scheduled, so a cancel in
+                # between goes through the handle rather than the pending queue
+                task.state = TaskState.RUNNING
+                task.started_at = datetime.utcnow().isoformat()
+                record.notify()
+                self._on_change(record)
+                self._running += 1
+                self._running_by_tenant[task.tenant] = self._running_by_tenant.get(task.tenant, 0) + 1
+                record.holds_slot = True
+                record.handle = asyncio.create_task(self._run(record))
+                # A run cancelled before it starts never reaches its finally
+                record.handle.add_done_callback(lambda handle, record=record: self._release(record))
+
+    def _release(self, record: _TaskRecord) -> None:
+        """Free a task's slot once its run has ended or was cancelled."""
+        record.handle = None
+        if not record.finished:
+            self._finish(record, TaskOutcome(state=TaskState.CANCELLED, error="Task cancelled"))
+        if not record.holds_slot:
+            return
+        record.holds_slot = False
+        self._running -= 1
+        self._running_by_tenant[record.task.tenant] -= 1
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self, record: _TaskRecord) -> None:
+        if record.finished:
+            return
+        try:
+            await self._run_task(record)
+        finally:
+            self._release(record)
+
+    async def _run_task(self, record: _TaskRecord) -> None:
+        task = record.task
+        # Workers enforce the timeout themselves; the grace period covers
+        # workers too busy or stuck to do so
+        deadline = task.timeout + settings.task_queue_timeout_grace
+        try:
+            outcome = await asyncio.wait_for(self._execute(record), deadline)
+        except asyncio.TimeoutError:
+            outcome = TaskOutcome(state=TaskState.TIMED_OUT, error=f"Task exceeded its {task.timeout:g}s timeout")
+            await self._abort(record)
+        except asyncio.CancelledError:
+            self._finish(record, TaskOutcome(state=TaskState.CANCELLED, error="Task cancelled"))
+            await asyncio.shield(self._abort(record))
+            if not record.cancel_requested:
+                raise
+            return
+        except Exception as e:
+            outcome = TaskOutcome(state=TaskState.FAILED, error=str(e) or type(e).__name__)
+        self._finish(record, outcome)
+
+    def _publish(self, record: _TaskRecord, event: StreamEvent) -> None:
+        """Add an event produced by a task's run to its log."""
+        if not record.finished:
+            record.append(event)
+
+    def _finish(self, record: _TaskRecord, outcome: TaskOutcome) -> None:
+        task = record.task
+        if record.finished:
+            return
+        task.state = outcome.state
+        task.result = outcome.result
+        task.error = outcome.error
+        task.finished_at = datetime.utcnow().isoformat()
+        # Subscribers always see how the task ended
+        event = final_event(outcome, record.events[-1] if record.events else None)
+        if event is not None:
+            record.append(event)
+        record.notify()
+        self._on_change(record)
+        self._counts[outcome.state.value] += 1
+        self._finished[task.task_id] = time.monotonic()
+
+    def _purge(self) -> None:
+        """Forget finished tasks older than the result TTL."""
+        cutoff = time.monotonic() - self.result_ttl
+        while self._finished:
+            task_id, finished = next(iter(self._finished.items()))
+            if finished > cutoff:
+                break
+            del self._finished[task_id]
+            self._records.pop(task_id, None)
@@ -0,0 +1,120 @@
+"""
+Worker-side execution of queued tasks.
+
+Every queue backend runs tasks through ``run_queued_task``, whether in the
+API process, in a worker process or in a Celery worker, so tasks behave
+the same everywhere: agent tasks are routed through the agent registry,
+workflow runs through the workflow registry, events are published as they
+are produced, and the task's timeout is enforced.
+"""
+
+import asyncio
+import inspect
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Callable, Optional
+
+from app.agents.registry import agent_registry
+from app.core.config import settings
+from app.interfaces.streaming import StreamEvent, StreamEventType
+from app.interfaces.task_queue import QueuedTask, TaskKind, TaskOutcome, TaskState
+from app.workflows.registry import workflow_registry
+
+
+def default_timeout(kind: TaskKind) -> float:
+    """Maximum run time in seconds for a kind of task."""
+    return float(settings.agent_timeout if kind == TaskKind.AGENT else settings.max_workflow_duration)
+
+
+async def task_events(task: QueuedTask) -> AsyncIterator[StreamEvent]:
+    """
+    Run a task and yield its events.
+
+    Raises:
+        LookupError: If no agent or workflow can run the task
+        ValueError: If the workflow rejects its input
+    """
+    if task.kind == TaskKind.AGENT:
+        if task.target:
+            agent = agent_registry.get_agent(task.target)
+        else:
+            agent = agent_registry.select_agent(task.payload.get("type"))
+        if agent is None:
+            raise LookupError(f"No available agent for task type: {task.payload.get('type')}")
+        events = agent_registry.stream(agent, task.payload)
+    else:
+        workflow = workflow_registry.get_workflow(task.target)
+        if workflow is None:
+            raise LookupError(f"Workflow not found: {task.target}")
+        if not await workflow.validate_input(task.payload):
+            raise ValueError("Invalid workflow input")
+        events = workflow.stream(task.payload)
+
+    async with aclosing(events) as stream:
+        async for event in stream:
+            yield event
+
+
+def _failure(data: Any) -> Optional[str]:
+    """Error message of a failed result, or None if it succeeded."""
+    if isinstance(data, dict):
+        if data.get("status") in ("error", "failed"):
+            return str(data.get("error") or f"Task {data['status']}")
+        return None
+    error = getattr(data, "error", None)
+    return str(error) if error else None
+
+
+async def run_queued_task(task: QueuedTask, publish: Callable[[StreamEvent], Any]) -> TaskOutcome:
+    """
+    Run a task to completion within its timeout.
+
+    Args:
+        task: Task with its timeout resolved
+        publish: Called with each event as it is produced
+
+    Returns:
+        TaskOutcome: Final state with the RESULT event's data or the error
+    """
+    result = None
+    try:
+        async with asyncio.timeout(task.timeout):
+            async with aclosing(task_events(task)) as events:
+                async for event in events:
+                    publish(event)
+                    if event.type == StreamEventType.RESULT:
+                        result = event.data
+                    elif event.type == StreamEventType.ERROR:
+                        return TaskOutcome(state=TaskState.FAILED, result=event.data, error=_failure(event.data) or "Task failed")
+    except TimeoutError:
+        return TaskOutcome(state=TaskState.TIMED_OUT, error=f"Task exceeded its {task.timeout:g}s timeout")
+    except Exception as e:
+        return TaskOutcome(state=TaskState.FAILED, error=str(e) or type(e).__name__)
+
+    error = _failure(result)
+    if error is not None:
+        return TaskOutcome(state=TaskState.FAILED, result=result, error=error)
+    return TaskOutcome(state=TaskState.COMPLETED, result=result)
+
+
+_worker_ready = False
+
+
+async def setup_worker() -> None:
+    """
+    Prepare a worker process to run tasks, once per process.
+
+    Calls the TASK_WORKER_SETUP function (``"module:function"``, sync or
+    async) that registers the agents and workflows tasks are routed to.
+    Forked workers inherit the parent's registries and need no setup.
+    """
+    global _worker_ready
+    if _worker_ready:
+        return
+    _worker_ready = True
+    if not settings.task_worker_setup:
+        return
+    from uvicorn.importer import import_from_string
+
+    result = import_from_string(settings.task_worker_setup)()
+    if inspect.isawaitable(result):
+        await result
@@ -0,0 +1,123 @@
+"""
+Task state shared between API processes through Redis.
+
+With several API processes behind one socket, the process answering a
+request for a task is usually not the one that accepted it. The Celery
+backend therefore mirrors each task into Redis as it changes: the task
+itself under ``tasks:<id>``, its events (published by the Celery worker)
+and final outcome in the ``tasks:<id>:events`` stream. Any process can
+then serve get and events, and cancel requests are published on a channel
+that the owning process, which holds the task's queue slot, acts on.
+"""
+
+from typing import AsyncIterator, Optional
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.core.serialization import dumps
+from app.interfaces.streaming import StreamEvent
+from app.interfaces.task_queue import FINISHED_STATES, QueuedTask, TaskOutcome
+from app.tasks.queue import final_event
+
+
+CANCEL_CHANNEL = "tasks:cancel"
+
+
+def task_key(task_id: str) -> str:
+    """Redis key holding a task's current state."""
+    return f"tasks:{task_id}"
+
+
+def events_key(task_id: str) -> str:
+    """Redis stream holding a task's events."""
+    return f"tasks:{task_id}:events"
+
+
+class RedisTaskStore:
+    """
+    Task state, events and cancel requests in Redis.
+
+    Args:
+        client: Redis client
+        result_ttl: Seconds finished tasks are kept; defaults to TASK_QUEUE_RESULT_TTL
+    """
+
+    def __init__(self, client: aioredis.Redis, result_ttl: Optional[int] = None):
+        self.client = client
+        self.result_ttl = settings.task_queue_result_ttl if result_ttl is None else result_ttl
+
+    async def save(self, task: QueuedTask) -> None:
+        """Store a task's state; a finished task's outcome is also added to its event stream."""
+        if task.state in FINISHED_STATES:
+            # The outcome goes first, so a reader seeing the task finished has
+            # every event up to it in the stream
+            outcome = TaskOutcome(state=task.state, result=task.result, error=task.error)
+            key = events_key(task.task_id)
+            await self.client.xadd(key, {"outcome": dumps(outcome)})
+            await self.client.expire(key, self.result_ttl)
+            ttl = self.result_ttl
+        else:
+            # Kept past the longest the task can still take, in case its
+            # owning process dies without finishing it
+            ttl = self.result_ttl + int(task.timeout or 0) + int(settings.task_queue_timeout_grace)
+        await self.client.set(task_key(task.task_id), task.model_dump_json(), ex=ttl)
+
+    async def load(self, task_id: str) -> Optional[QueuedTask]:
+        """A task's last stored state, or None if unknown or expired."""
+        raw = await self.client.get(task_key(task_id))
+        return QueuedTask.model_validate_json(raw) if raw is not None else None
+
+    async def events(self, task_id: str) -> AsyncIterator[StreamEvent]:
+        """Stream a task's events from the start until it finishes."""
+        key = events_key(task_id)
+        last_id = "0-0"
+        last: Optional[StreamEvent] = None
+        while True:
+            response = await self.client.xread({key: last_id}, count=100, block=1000)
+            if not response:
+                # No outcome in the stream (expired, or its owner died): fall
+                # back to the stored state
+                task = await self.load(task_id)
+                if task is None:
+                    return
+                if task.state in FINISHED_STATES:
+                    event = final_event(TaskOutcome(state=task.state, result=task.result, error=task.error), last)
+                    if event is not None:
+                        yield event
+                    return
+                continue
+            for _, entries in response:
+                for entry_id, fields in entries:
+                    last_id = entry_id
+                    if b"outcome" in fields:
+                        event = final_event(TaskOutcome.model_validate_json(fields[b"outcome"]), last)
+                        if event is not None:
+                            yield event
+                        return
+                    last = StreamEvent.model_validate_json(fields[b"event"])
+                    yield last
+
+    async def request_cancel(self, task_id: str) -> bool:
+        """
+        Ask the process owning a task to cancel it.
+
+        Returns:
+            bool: True if the task is queued or running, False if unknown or finished
+        """
+        task = await self.load(task_id)
+        if task is None or task.state in FINISHED_STATES:
+            return False
+        await self.client.publish(CANCEL_CHANNEL, task_id)
+        return True
+
+    async def cancel_requests(self) -> AsyncIterator[str]:
+        """Yield the IDs of tasks any process was asked to cancel."""
+        pubsub = self.client.pubsub()
+        await pubsub.subscribe(CANCEL_CHANNEL)
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    yield message["data"].decode()
+        finally:
+            await pubsub.aclose()
@@ -0,0 +1,259 @@
+"""
+Result caching for deterministic tools.
+
+Provides an opt-in caching layer around ITool.execute keyed on the tool ID
+and canonicalised parameters, with an in-process LRU tier and an optional
+Redis tier shared across processes.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional
+
+from pydantic import ValidationError
+
+from app.core.config import settings
+from app.core.ttl_cache import TTLCache
+from app.interfaces.tool import ITool, ToolCategory, ToolParameter, ToolResult
+
+
+def make_cache_key(tool: ITool, params: Dict[str, Any]) -> str:
+    """
+    Build a cache key from a tool ID and its parameters.
+
+    Missing optional parameters are filled with their declared defaults and
+    the result is serialised with sorted keys, so equivalent calls map to
+    the same key regardless of argument order.
+
+    Args:
+        tool: Tool being executed
+        params: Parameters passed to the tool
+
+    Returns:
+        str: Cache key
+    """
+    canonical = {p.name: p.default for p in tool.parameters if not p.required}
+    canonical.update(params)
+    payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"), default=str)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"tool:{tool.tool_id}:{digest}"
+
+
+class RedisResultCache:
+    """Redis-backed result cache shared across processes."""
+
+    def __init__(self, redis_url: str, ttl: float):
+        import redis.asyncio as redis
+
+        self.ttl = ttl
+        self._client = redis.from_url(redis_url, max_connections=settings.redis_max_connections)
+
+    async def get(self, key: str) -> Optional[ToolResult]:
+        """Return a cached result, or None if missing, unreadable or Redis is unavailable."""
+        try:
+            raw = await self._client.get(key)
+        except Exception as e:
+            print(f"Tool cache Redis get failed: {e}")
+            return None
+        if raw is None:
+            return None
+        try:
+            return ToolResult.model_validate_json(raw)
+        except ValidationError as e:
+            # Written by an incompatible version, or corrupted
+            print(f"Tool cache Redis entry {key} is invalid: {e}")
+            return None
+
+    async def set(self, key: str, result: ToolResult, ttl: Optional[float] = None) -> None:
+        """Store a result; non-JSON-serialisable results are skipped."""
+        try:
+            payload = result.model_dump_json()
+        except Exception:
+            return
+        try:
+            await self._client.set(key, payload, ex=max(1, int(self.ttl if ttl is None else ttl)))
+        except Exception as e:
+            print(f"Tool cache Redis set failed: {e}")
+
+    async def delete(self, key: str) -> None:
+        """Remove a single entry."""
+        try:
+            await self._client.delete(key)
+        except Exception as e:
+            print(f"Tool cache Redis delete failed: {e}")
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        await self._client.aclose()
+
+
+class ToolResultCache:
+    """
+    Two-tier tool result cache.
+
+    Lookups check the in-process tier first, then Redis (if enabled),
+    promoting Redis hits into the in-process tier. Hits and misses are
+    counted per tool as well as in total. A TTL of 0 disables storing.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+        use_redis: Optional[bool] = None,
+    ):
+        self.ttl = settings.tool_cache_ttl if ttl is None else ttl
+        self.memory = TTLCache(max_entries or settings.tool_cache_max_entries, self.ttl)
+        if use_redis is None:
+            use_redis = settings.tool_cache_redis_enabled
+        self.redis = RedisResultCache(settings.redis_url, self.ttl) if use_redis else None
+        self.hits = 0
+        self.misses = 0
+        self.tool_counts: Dict[str, Dict[str, int]] = {}
+
+    async def get(self, key: str, tool_id: Optional[str] = None) -> Optional[ToolResult]:
+        """
+        Look up a cached result in all tiers.
+
+        Args:
+            key: Cache key from make_cache_key
+            tool_id: Tool the lookup is counted for
+
+        Returns:
+            Optional[ToolResult]: Cached result, or None on a miss
+        """
+        result = self.memory.get(key)
+        if result is None and self.redis is not None:
+            result = await self.redis.get(key)
+            if result is not None:
+                self.memory.set(key, result)
+
+        if result is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        if tool_id is not None:
+            counts = self.tool_counts.setdefault(tool_id, {"hits": 0, "misses": 0})
+            counts["misses" if result is None else "hits"] += 1
+        return result
+
+    async def set(self, key: str, result: ToolResult, ttl: Optional[float] = None) -> None:
+        """
+        Store a result in all tiers.
+
+        Args:
+            key: Cache key from make_cache_key
+            result: Result to cache
+            ttl: Optional TTL in seconds, overrides the cache default
+        """
+        if ttl is None:
+            ttl = self.ttl
+        if ttl <= 0:
+            return
+        self.memory.set(key, result, ttl)
+        if self.redis is not None:
+            await self.redis.set(key, result, ttl)
+
+    async def invalidate(self, key: str) -> None:
+        """Remove a key from all tiers."""
+        self.memory.delete(key)
+        if self.redis is not None:
+            await self.redis.delete(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": len(self.memory),
+            "tools": {tool_id: dict(counts) for tool_id, counts in self.tool_counts.items()},
+        }
+
+
+class CachedTool(ITool):
+    """
+    Caching wrapper around a deterministic tool.
+
+    Only successful results are cached. Cache status and this tool's hit/miss
+    counts are recorded in ``ToolResult.metadata``. The TTL can be set per
+    tool with ``cache_ttl`` in the wrapped tool's config.
+    """
+
+    def __init__(self, tool: ITool, cache: Optional[ToolResultCache] = None):
+        super().__init__(tool.tool_id, tool.config)
+        self.tool = tool
+        self.cache = cache or ToolResultCache()
+        self.ttl = tool.config.get("cache_ttl")
+
+    @property
+    def name(self) -> str:
+        return self.tool.name
+
+    @property
+    def description(self) -> str:
+        return self.tool.description
+
+    @property
+    def category(self) -> ToolCategory:
+        return self.tool.category
+
+    @property
+    def parameters(self) -> List[ToolParameter]:
+        return self.tool.parameters
+
+    async def validate_parameters(self, **kwargs) -> bool:
+        return await self.tool.validate_parameters(**kwargs)
+
+    async def health_check(self) -> bool:
+        return await self.tool.health_check()
+
+    async def execute(self, **kwargs) -> ToolResult:
+        """
+        Return a cached result if available, otherwise execute the tool.
+
+        Args:
+            **kwargs: Tool parameters
+
+        Returns:
+            ToolResult: Cached or freshly computed result
+        """
+        key = make_cache_key(self.tool, kwargs)
+        cached = await self.cache.get(key, self.tool_id)
+        if cached is not None:
+            result = cached.model_copy(deep=True)
+            result.metadata = {**result.metadata, **self._cache_metadata("hit")}
+            return result
+
+        result = await self.tool.execute(**kwargs)
+        if result.success:
+            await self.cache.set(key, result.model_copy(deep=True), self.ttl)
+        result.metadata = {**result.metadata, **self._cache_metadata("miss")}
+        return result
+
+    def _cache_metadata(self, status: str) -> Dict[str, Any]:
+        counts = self.cache.tool_counts.get(self.tool_id, {})
+        return {
+            "cache": status,
+            "cache_hits": counts.get("hits", 0),
+            "cache_misses": counts.get("misses", 0),
+        }
+
+
+def cached(tool: ITool, cache: Optional[ToolResultCache] = None) -> ITool:
+    """
+    Wrap a tool with result caching if it opts in.
+
+    Tools opt in by setting ``cacheable: True`` in their config.
+
+    Args:
+        tool: Tool to wrap
+        cache: Shared cache instance, a new one is created if omitted
+
+    Returns:
+        ITool: CachedTool wrapper, or the original tool if not cacheable
+    """
+    if not tool.config.get("cacheable", False):
+        return tool
+    return CachedTool(tool, cache)
@@ -0,0 +1,154 @@
+"""
+Concurrent tool execution engine.
+
+Runs batches of tool calls with bounded parallelism so agents can fan out
+to many tools per turn without hand-rolling asyncio.gather or overloading
+downstream APIs.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.interfaces.tool import ITool, ToolResult
+
+
+class ToolCall(BaseModel):
+    """A single tool invocation within a batch."""
+    tool_id: str
+    parameters: Dict[str, Any] = {}
+    timeout: Optional[float] = None  # seconds, overrides executor default
+
+
+class ToolExecutor:
+    """
+    Executes tool calls concurrently with per-tool and global limits.
+
+    The global limit caps the total number of in-flight tool calls across
+    all agents (``max_concurrent_agents * max_concurrent_tools_per_agent``
+    by default). The per-tool limit caps in-flight calls for a single
+    ``tool_id`` and can be overridden with ``max_concurrency`` in the
+    tool's config.
+    """
+
+    def __init__(
+        self,
+        tools: Optional[List[ITool]] = None,
+        max_concurrency: Optional[int] = None,
+        per_tool_concurrency: Optional[int] = None,
+        default_timeout: Optional[float] = None,
+    ):
+        self.max_concurrency = max_concurrency or (
+            settings.max_concurrent_agents * settings.max_concurrent_tools_per_agent
+        )
+        self.per_tool_concurrency = per_tool_concurrency or settings.tool_max_concurrency
+        self.default_timeout = default_timeout if default_timeout is not None else settings.tool_timeout
+
+        self._tools: Dict[str, ITool] = {}
+        self._global_semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._tool_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+        for tool in tools or []:
+            self.register_tool(tool)
+
+    def register_tool(self, tool: ITool) -> None:
+        """
+        Register a tool so it can be referenced by ``tool_id`` in calls.
+
+        Args:
+            tool: Tool instance to register
+        """
+        self._tools[tool.tool_id] = tool
+        limit = tool.config.get("max_concurrency", self.per_tool_concurrency)
+        self._tool_semaphores[tool.tool_id] = asyncio.Semaphore(limit)
+
+    def unregister_tool(self, tool_id: str) -> bool:
+        """
+        Remove a tool from the executor.
+
+        Args:
+            tool_id: ID of the tool to remove
+
+        Returns:
+            bool: True if the tool was registered, False otherwise
+        """
+        self._tool_semaphores.pop(tool_id, None)
+        return self._tools.pop(tool_id, None) is not None
+
+    def get_tool(self, tool_id: str) -> Optional[ITool]:
+        """Get a registered tool by ID."""
+        return self._tools.get(tool_id)
+
+    async def execute(self, tool_id: str, timeout: Optional[float] = None, **kwargs) -> ToolResult:
+        """
+        Execute a single tool call under the executor's limits.
+
+        Args:
+            tool_id: ID of the tool to execute
+            timeout: Optional timeout in seconds, overrides the default
+            **kwargs: Tool parameters
+
+        Returns:
+            ToolResult: Result of tool execution
+        """
+        return await self._run(ToolCall(tool_id=tool_id, parameters=kwargs, timeout=timeout))
+
+    async def execute_batch(self, calls: List[ToolCall]) -> List[ToolResult]:
+        """
+        Execute a batch of tool calls concurrently.
+
+        Failures, timeouts and invalid parameters are reported as
+        unsuccessful results rather than raised, so one bad call never
+        cancels the rest of the batch.
+
+        Args:
+            calls: Tool calls to execute
+
+        Returns:
+            List[ToolResult]: Results in the same order as ``calls``
+        """
+        return list(await asyncio.gather(*(self._run(call) for call in calls)))
+
+    async def _run(self, call: ToolCall) -> ToolResult:
+        """Run one call: validate, wait for slots, execute with timeout."""
+        # Looked up together: the tool may be unregistered while this call waits
+        tool = self._tools.get(call.tool_id)
+        tool_semaphore = self._tool_semaphores.get(call.tool_id)
+        if tool is None or tool_semaphore is None:
+            return ToolResult(success=False, error=f"Unknown tool: {call.tool_id}")
+
+        try:
+            valid = await tool.validate_parameters(**call.parameters)
+        except Exception as e:
+            return ToolResult(success=False, error=f"Invalid parameters for tool {call.tool_id}: {e}")
+        if not valid:
+            return ToolResult(success=False, error=f"Invalid parameters for tool: {call.tool_id}")
+
+        timeout = call.timeout if call.timeout is not None else self.default_timeout
+        queued_at = time.monotonic()
+
+        # Take the per-tool slot first so a saturated tool never holds global slots
+        async with tool_semaphore:
+            async with self._global_semaphore:
+                started_at = time.monotonic()
+                try:
+                    result = await asyncio.wait_for(tool.execute(**call.parameters), timeout=timeout)
+                    if not isinstance(result, ToolResult):
+                        result = ToolResult(
+                            success=False,
+                            error=f"Tool {call.tool_id} returned {type(result).__name__}, not a ToolResult",
+                        )
+                except asyncio.TimeoutError:
+                    result = ToolResult(
+                        success=False,
+                        error=f"Tool {call.tool_id} timed out after {timeout}s",
+                    )
+                except Exception as e:
+                    result = ToolResult(success=False, error=str(e))
+                finished_at = time.monotonic()
+
+        result.execution_time = finished_at - started_at
+        result.metadata = {**result.metadata, "queue_time": started_at - queued_at}
+        return result
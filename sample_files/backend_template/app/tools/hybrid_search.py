@@ -0,0 +1,78 @@
+"""
+Hybrid keyword + vector product search tool.
+"""
+
+import time
+from typing import List
+
+from app.interfaces.tool import ITool, ToolCategory, ToolParameter, ToolResult
+from app.retrieval.hybrid import HybridRetriever
+
+
+class HybridSearchTool(ITool):
+    """
+    Product and document search combining BM25 and vector similarity.
+
+    Suited to e-commerce lookups where queries mix SKUs or exact product
+    names with free-text descriptions. The index is chosen with ``index``
+    in the tool config.
+    """
+
+    def __init__(self, tool_id: str = "hybrid_search", config: dict = None, retriever: HybridRetriever = None):
+        super().__init__(tool_id, config)
+        self.retriever = retriever or HybridRetriever(self.config.get("index", "default"))
+
+    @property
+    def name(self) -> str:
+        return "Hybrid Search"
+
+    @property
+    def description(self) -> str:
+        return "Search products and documents by keywords, SKUs and meaning"
+
+    @property
+    def category(self) -> ToolCategory:
+        return ToolCategory.ECOMMERCE
+
+    @property
+    def parameters(self) -> List[ToolParameter]:
+        return [
+            ToolParameter(name="query", type="str", description="Search text"),
+            ToolParameter(name="k", type="int", description="Number of results", required=False, default=10),
+            ToolParameter(
+                name="weights",
+                type="dict",
+                description="Fusion weights for 'vector' and 'keyword' rankings",
+                required=False,
+            ),
+        ]
+
+    async def execute(self, **kwargs) -> ToolResult:
+        """
+        Search the hybrid index.
+
+        Returns:
+            ToolResult: ``data`` is a list of {id, score, vector_rank,
+            keyword_rank, metadata}, best first
+        """
+        if not await self.validate_parameters(**kwargs):
+            return ToolResult(success=False, error="query is required")
+
+        started = time.perf_counter()
+        try:
+            hits = await self.retriever.search(
+                kwargs["query"],
+                k=kwargs.get("k", 10),
+                weights=kwargs.get("weights"),
+            )
+        except ValueError as e:
+            return ToolResult(success=False, error=str(e))
+
+        return ToolResult(
+            success=True,
+            data=[hit.model_dump() for hit in hits],
+            metadata={
+                "search_ms": (time.perf_counter() - started) * 1000,
+                "index_size": len(self.retriever.keyword_index),
+            },
+        )
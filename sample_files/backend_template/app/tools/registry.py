@@ -0,0 +1,57 @@
+"""
+Registry of available tools.
+"""
+
+from typing import Dict, List, Optional
+
+from app.interfaces.tool import ITool
+
+
+class ToolRegistry:
+    """
+    Registry of tools keyed by tool_id.
+
+    ``version`` increases on every change, so snapshots of the registry
+    (see app.api.catalog) know when to rebuild.
+    """
+
+    def __init__(self):
+        self._tools: Dict[str, ITool] = {}
+        self.version = 0
+
+    def register(self, tool: ITool) -> None:
+        """
+        Register a tool, replacing any with the same ID.
+
+        Args:
+            tool: Tool to register
+        """
+        self._tools[tool.tool_id] = tool
+        self.version += 1
+
+    def unregister(self, tool_id: str) -> Optional[ITool]:
+        """
+        Remove a tool from the registry.
+
+        Args:
+            tool_id: ID of tool to remove
+
+        Returns:
+            Optional[ITool]: The removed tool, or None if not registered
+        """
+        tool = self._tools.pop(tool_id, None)
+        if tool is not None:
+            self.version += 1
+        return tool
+
+    def get_tool(self, tool_id: str) -> Optional[ITool]:
+        """Get a registered tool by ID."""
+        return self._tools.get(tool_id)
+
+    def list_tools(self) -> List[ITool]:
+        """List all registered tools."""
+        return list(self._tools.values())
+
+
+# Global tool registry instance
+tool_registry = ToolRegistry()
@@ -0,0 +1,73 @@
+"""
+Vector similarity search tool over the in-process vector index.
+"""
+
+import time
+from typing import List
+
+from app.interfaces.tool import ITool, ToolCategory, ToolParameter, ToolResult
+from app.llm.embeddings import embedding_service
+from app.retrieval.vector_index import VectorIndex, get_vector_index
+
+
+class VectorSearchTool(ITool):
+    """
+    Nearest-neighbour search for products and knowledge documents.
+
+    Queries are given as text (embedded through the embedding service) or
+    as a raw vector. The index is chosen with ``index`` in the tool config.
+    """
+
+    def __init__(self, tool_id: str = "vector_search", config: dict = None, index: VectorIndex = None):
+        super().__init__(tool_id, config)
+        self.index = index or get_vector_index(self.config.get("index", "default"))
+
+    @property
+    def name(self) -> str:
+        return "Vector Search"
+
+    @property
+    def description(self) -> str:
+        return "Find the products or documents most similar to a query"
+
+    @property
+    def category(self) -> ToolCategory:
+        return ToolCategory.ECOMMERCE
+
+    @property
+    def parameters(self) -> List[ToolParameter]:
+        return [
+            ToolParameter(name="query", type="str", description="Search text", required=False),
+            ToolParameter(name="vector", type="list", description="Query embedding, used instead of query", required=False),
+            ToolParameter(name="k", type="int", description="Number of results", required=False, default=10),
+        ]
+
+    async def validate_parameters(self, **kwargs) -> bool:
+        return bool(kwargs.get("query")) or kwargs.get("vector") is not None
+
+    async def execute(self, **kwargs) -> ToolResult:
+        """
+        Search the index.
+
+        Returns:
+            ToolResult: ``data`` is a list of {id, score, metadata}, best first
+        """
+        if not await self.validate_parameters(**kwargs):
+            return ToolResult(success=False, error="Either query or vector is required")
+
+        vector = kwargs.get("vector")
+        if vector is None:
+            vector = await embedding_service.embed(kwargs["query"])
+
+        started = time.perf_counter()
+        try:
+            hits = self.index.search(vector, k=kwargs.get("k", 10))[0]
+        except ValueError as e:
+            return ToolResult(success=False, error=str(e))
+        search_time = time.perf_counter() - started
+
+        return ToolResult(
+            success=True,
+            data=[{"id": doc_id, "score": score, "metadata": metadata} for doc_id, score, metadata in hits],
+            metadata={"search_ms": search_time * 1000, "index_size": len(self.index)},
+        )
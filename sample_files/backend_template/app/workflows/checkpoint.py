@@ -0,0 +1,361 @@
+"""
+Checkpoint store for workflow executions.
+
+Persists WorkflowExecution state and per-node outputs as append-only,
+delta-encoded records so an interrupted execution can resume from its last
+completed node instead of recomputing the whole workflow.
+"""
+
+import asyncio
+import json
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote
+
+from pydantic import BaseModel
+from sqlalchemy import JSON, Column, DateTime, Integer, String, delete, select
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, Base
+from app.interfaces.workflow import WorkflowExecution, WorkflowNode
+
+
+class CheckpointRecord(BaseModel):
+    """
+    A single append-only checkpoint record.
+
+    ``execution`` records carry only the WorkflowExecution fields that
+    changed since the previous record; ``node`` records carry the output of
+    one completed node.
+    """
+    execution_id: str
+    sequence: int  # per process and since the last compaction; storage order is authoritative
+    record_type: str  # execution, node
+    node_id: Optional[str] = None
+    delta: Dict[str, Any] = {}
+    timestamp: str
+
+
+class CheckpointState(BaseModel):
+    """Execution state reconstructed by replaying checkpoint records."""
+    execution: WorkflowExecution
+    node_outputs: Dict[str, Any] = {}
+    completed_nodes: List[str] = []
+
+    def remaining_nodes(self, nodes: List[WorkflowNode]) -> List[WorkflowNode]:
+        """
+        Get the nodes that still need to run on resume.
+
+        Args:
+            nodes: All nodes of the workflow
+
+        Returns:
+            List[WorkflowNode]: Nodes without a checkpointed output
+        """
+        completed = set(self.completed_nodes)
+        return [node for node in nodes if node.node_id not in completed]
+
+
+class CheckpointStore(ABC):
+    """
+    Base class for checkpoint stores.
+
+    Subclasses only implement raw record persistence; delta encoding and
+    replay are handled here.
+    """
+
+    def __init__(self):
+        self._last_state: Dict[str, Dict[str, Any]] = {}
+        self._sequence: Dict[str, int] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    @abstractmethod
+    async def _append(self, record: CheckpointRecord) -> None:
+        """Persist a single record."""
+        pass
+
+    @abstractmethod
+    async def _read(self, execution_id: str) -> List[CheckpointRecord]:
+        """Read all records for an execution in the order they were written."""
+        pass
+
+    @abstractmethod
+    async def _replace(self, execution_id: str, records: List[CheckpointRecord]) -> None:
+        """Atomically replace all records for an execution."""
+        pass
+
+    @abstractmethod
+    async def delete(self, execution_id: str) -> None:
+        """Delete all checkpoints for an execution."""
+        pass
+
+    async def save_execution(self, execution: WorkflowExecution) -> bool:
+        """
+        Checkpoint the execution state, writing only changed fields.
+
+        Args:
+            execution: Current execution state
+
+        Returns:
+            bool: True if a record was written, False if nothing changed
+        """
+        execution_id = execution.execution_id
+        async with self._lock(execution_id):
+            state = execution.model_dump(mode="json")
+            last = self._last_state.get(execution_id, {})
+            delta = {key: value for key, value in state.items() if last.get(key) != value}
+            if not delta:
+                return False
+            await self._append(self._record(execution_id, "execution", delta=delta))
+            self._last_state[execution_id] = state
+            return True
+
+    async def save_node_output(self, execution_id: str, node_id: str, output: Any) -> None:
+        """
+        Checkpoint the output of a completed node.
+
+        Args:
+            execution_id: ID of the execution the node belongs to
+            node_id: ID of the completed node
+            output: JSON-serialisable node output
+        """
+        async with self._lock(execution_id):
+            await self._append(self._record(execution_id, "node", node_id=node_id, delta={"output": output}))
+
+    async def load(self, execution_id: str) -> Optional[CheckpointState]:
+        """
+        Rebuild execution state by replaying checkpoint records.
+
+        Args:
+            execution_id: ID of execution to load
+
+        Returns:
+            Optional[CheckpointState]: Reconstructed state, or None if no checkpoint exists
+        """
+        async with self._lock(execution_id):
+            return await self._load(execution_id)
+
+    async def _load(self, execution_id: str) -> Optional[CheckpointState]:
+        # Callers hold the execution's lock
+        records = await self._read(execution_id)
+        if not records:
+            return None
+
+        state: Dict[str, Any] = {}
+        node_outputs: Dict[str, Any] = {}
+        for record in records:
+            if record.record_type == "execution":
+                state.update(record.delta)
+            else:
+                node_outputs[record.node_id] = record.delta.get("output")
+
+        if not state:
+            return None
+
+        self._last_state[execution_id] = state
+        self._sequence[execution_id] = records[-1].sequence
+        return CheckpointState(
+            execution=WorkflowExecution(**state),
+            node_outputs=node_outputs,
+            completed_nodes=list(node_outputs),
+        )
+
+    async def compact(self, execution_id: str) -> None:
+        """
+        Collapse an execution's records into one snapshot per execution/node.
+
+        Args:
+            execution_id: ID of execution to compact
+        """
+        async with self._lock(execution_id):
+            # Loaded under the lock so no record appended meanwhile is dropped
+            state = await self._load(execution_id)
+            if state is None:
+                return
+            self._sequence[execution_id] = 0
+            records = [self._record(execution_id, "execution", delta=state.execution.model_dump(mode="json"))]
+            records.extend(
+                self._record(execution_id, "node", node_id=node_id, delta={"output": output})
+                for node_id, output in state.node_outputs.items()
+            )
+            await self._replace(execution_id, records)
+
+    def forget(self, execution_id: str) -> None:
+        """Drop in-memory delta state for a finished execution."""
+        self._last_state.pop(execution_id, None)
+        self._sequence.pop(execution_id, None)
+        self._locks.pop(execution_id, None)
+
+    def _record(self, execution_id: str, record_type: str, **kwargs) -> CheckpointRecord:
+        sequence = self._sequence.get(execution_id, 0) + 1
+        self._sequence[execution_id] = sequence
+        return CheckpointRecord(
+            execution_id=execution_id,
+            sequence=sequence,
+            record_type=record_type,
+            timestamp=datetime.utcnow().isoformat(),
+            **kwargs,
+        )
+
+    def _lock(self, execution_id: str) -> asyncio.Lock:
+        if execution_id not in self._locks:
+            self._locks[execution_id] = asyncio.Lock()
+        return self._locks[execution_id]
+
+
+class FileCheckpointStore(CheckpointStore):
+    """
+    Checkpoint store writing one append-only JSON-lines file per execution.
+    """
+
+    def __init__(self, checkpoint_dir: Optional[str] = None, fsync: Optional[bool] = None):
+        super().__init__()
+        self.checkpoint_dir = checkpoint_dir or settings.workflow_checkpoint_dir
+        self.fsync = settings.workflow_checkpoint_fsync if fsync is None else fsync
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+
+    def _path(self, execution_id: str) -> str:
+        # Encoded so an ID containing path separators cannot leave the directory
+        return os.path.join(self.checkpoint_dir, f"{quote(execution_id, safe='-_.')}.jsonl")
+
+    async def _append(self, record: CheckpointRecord) -> None:
+        line = record.model_dump_json(exclude_none=True) + "\n"
+        await asyncio.to_thread(self._write_lines, self._path(record.execution_id), [line], "a")
+
+    async def _read(self, execution_id: str) -> List[CheckpointRecord]:
+        return await asyncio.to_thread(self._read_file, self._path(execution_id))
+
+    async def _replace(self, execution_id: str, records: List[CheckpointRecord]) -> None:
+        path = self._path(execution_id)
+        lines = [record.model_dump_json(exclude_none=True) + "\n" for record in records]
+        await asyncio.to_thread(self._write_lines, path + ".tmp", lines, "w")
+        await asyncio.to_thread(os.replace, path + ".tmp", path)
+
+    async def delete(self, execution_id: str) -> None:
+        try:
+            await asyncio.to_thread(os.remove, self._path(execution_id))
+        except FileNotFoundError:
+            pass
+        self.forget(execution_id)
+
+    def _write_lines(self, path: str, lines: List[str], mode: str) -> None:
+        if mode == "a" and self._torn(path):
+            # Start on a fresh line rather than continuing a torn record
+            lines = ["\n"] + lines
+        with open(path, mode, encoding="utf-8") as f:
+            f.writelines(lines)
+            if self.fsync:
+                f.flush()
+                os.fsync(f.fileno())
+
+    @staticmethod
+    def _torn(path: str) -> bool:
+        """Whether a file's last record was cut off before its newline."""
+        try:
+            with open(path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return False
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) != b"\n"
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _read_file(path: str) -> List[CheckpointRecord]:
+        if not os.path.exists(path):
+            return []
+        records = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(CheckpointRecord(**json.loads(line)))
+                except ValueError:
+                    # Lines torn by a crash mid-write are skipped; records
+                    # appended after them are still valid
+                    continue
+        return records
+
+
+class WorkflowCheckpointModel(Base):
+    """Database table holding checkpoint records."""
+    __tablename__ = "workflow_checkpoints"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    execution_id = Column(String, index=True, nullable=False)
+    sequence = Column(Integer, nullable=False)
+    record_type = Column(String(16), nullable=False)
+    node_id = Column(String, nullable=True)
+    delta = Column(JSON, nullable=False, default=dict)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+class DatabaseCheckpointStore(CheckpointStore):
+    """
+    Checkpoint store writing records to the application database.
+    """
+
+    def __init__(self, session_factory=AsyncSessionLocal):
+        super().__init__()
+        self.session_factory = session_factory
+
+    async def _append(self, record: CheckpointRecord) -> None:
+        async with self.session_factory() as session:
+            session.add(self._to_model(record))
+            await session.commit()
+
+    async def _read(self, execution_id: str) -> List[CheckpointRecord]:
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(WorkflowCheckpointModel)
+                .where(WorkflowCheckpointModel.execution_id == execution_id)
+                # Insertion order; sequence numbers restart in a new process
+                .order_by(WorkflowCheckpointModel.id)
+            )
+            return [
+                CheckpointRecord(
+                    execution_id=row.execution_id,
+                    sequence=row.sequence,
+                    record_type=row.record_type,
+                    node_id=row.node_id,
+                    delta=row.delta,
+                    timestamp=row.created_at.isoformat(),
+                )
+                for row in result.scalars()
+            ]
+
+    async def _replace(self, execution_id: str, records: List[CheckpointRecord]) -> None:
+        async with self.session_factory() as session:
+            async with session.begin():
+                await session.execute(
+                    delete(WorkflowCheckpointModel).where(WorkflowCheckpointModel.execution_id == execution_id)
+                )
+                session.add_all(self._to_model(record) for record in records)
+
+    async def delete(self, execution_id: str) -> None:
+        async with self.session_factory() as session:
+            await session.execute(
+                delete(WorkflowCheckpointModel).where(WorkflowCheckpointModel.execution_id == execution_id)
+            )
+            await session.commit()
+        self.forget(execution_id)
+
+    @staticmethod
+    def _to_model(record: CheckpointRecord) -> WorkflowCheckpointModel:
+        return WorkflowCheckpointModel(
+            execution_id=record.execution_id,
+            sequence=record.sequence,
+            record_type=record.record_type,
+            node_id=record.node_id,
+            delta=record.delta,
+            created_at=datetime.fromisoformat(record.timestamp),
+        )
+
+
+def get_checkpoint_store() -> CheckpointStore:
+    """Create the checkpoint store selected by WORKFLOW_CHECKPOINT_BACKEND."""
+    if settings.workflow_checkpoint_backend == "database":
+        return DatabaseCheckpointStore()
+    return FileCheckpointStore()
@@ -0,0 +1,57 @@
+"""
+Registry of available workflows.
+"""
+
+from typing import Dict, List, Optional
+
+from app.interfaces.workflow import IWorkflow
+
+
+class WorkflowRegistry:
+    """
+    Registry of workflows keyed by workflow_id.
+
+    ``version`` increases on every change, so snapshots of the registry
+    (see app.api.catalog) know when to rebuild.
+    """
+
+    def __init__(self):
+        self._workflows: Dict[str, IWorkflow] = {}
+        self.version = 0
+
+    def register(self, workflow: IWorkflow) -> None:
+        """
+        Register a workflow, replacing any with the same ID.
+
+        Args:
+            workflow: Workflow to register
+        """
+        self._workflows[workflow.workflow_id] = workflow
+        self.version += 1
+
+    def unregister(self, workflow_id: str) -> Optional[IWorkflow]:
+        """
+        Remove a workflow from the registry.
+
+        Args:
+            workflow_id: ID of workflow to remove
+
+        Returns:
+            Optional[IWorkflow]: The removed workflow, or None if not registered
+        """
+        workflow = self._workflows.pop(workflow_id, None)
+        if workflow is not None:
+            self.version += 1
+        return workflow
+
+    def get_workflow(self, workflow_id: str) -> Optional[IWorkflow]:
+        """Get a registered workflow by ID."""
+        return self._workflows.get(workflow_id)
+
+    def list_workflows(self) -> List[IWorkflow]:
+        """List all registered workflows."""
+        return list(self._workflows.values())
+
+
+# Global workflow registry instance
+workflow_registry = WorkflowRegistry()
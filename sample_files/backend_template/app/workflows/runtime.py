@@ -0,0 +1,410 @@
+"""
+Parallel DAG runtime for workflows.
+
+Schedules workflow nodes in dependency order, running every node whose
+dependencies have completed concurrently up to a configurable cap, and
+keeps the WorkflowExecution progress and current node up to date.
+
+Finished executions are moved to a bounded TTL cache (WORKFLOW_FINISHED_TTL
+and WORKFLOW_FINISHED_MAX_ENTRIES), so their status stays available for a
+while without the runtime growing with every execution it has run.
+"""
+
+import asyncio
+import uuid
+from collections import deque
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.ttl_cache import TTLCache
+from app.interfaces.streaming import StreamEvent, StreamEventType
+from app.interfaces.workflow import FINISHED_STATUSES, IWorkflow, WorkflowExecution, WorkflowNode, WorkflowStatus
+from app.workflows.checkpoint import CheckpointStore
+
+
+# Node ID under which the execution's input data is checkpointed
+INPUT_KEY = "__input__"
+
+
+class NodeExecutionError(Exception):
+    """Raised when a workflow node fails."""
+
+    def __init__(self, node_id: str, error: BaseException):
+        super().__init__(f"Node {node_id} failed: {error}")
+        self.node_id = node_id
+        self.error = error
+
+
+def resolve_dependencies(nodes: List[WorkflowNode]) -> Dict[str, List[str]]:
+    """
+    Read and validate node dependencies from ``node.config["depends_on"]``.
+
+    Args:
+        nodes: Workflow nodes
+
+    Returns:
+        Dict mapping each node_id to the node_ids it depends on
+
+    Raises:
+        ValueError: If a dependency is unknown or the graph has a cycle
+    """
+    dependencies: Dict[str, List[str]] = {}
+    for node in nodes:
+        depends_on = node.config.get("depends_on", [])
+        if isinstance(depends_on, str):
+            depends_on = [depends_on]
+        dependencies[node.node_id] = list(depends_on)
+
+    for node_id, deps in dependencies.items():
+        for dep in deps:
+            if dep not in dependencies:
+                raise ValueError(f"Node {node_id} depends on unknown node {dep}")
+
+    # Kahn's algorithm; any node left unvisited is part of a cycle
+    remaining = {node_id: len(deps) for node_id, deps in dependencies.items()}
+    dependents: Dict[str, List[str]] = {node_id: [] for node_id in dependencies}
+    for node_id, deps in dependencies.items():
+        for dep in deps:
+            dependents[dep].append(node_id)
+    ready = deque(node_id for node_id, count in remaining.items() if count == 0)
+    visited = 0
+    while ready:
+        node_id = ready.popleft()
+        visited += 1
+        for dependent in dependents[node_id]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+    if visited != len(dependencies):
+        cyclic = sorted(node_id for node_id, count in remaining.items() if count > 0)
+        raise ValueError(f"Workflow has a dependency cycle involving: {cyclic}")
+
+    return dependencies
+
+
+class WorkflowRuntime:
+    """
+    Executes a workflow's nodes as a DAG on an asyncio worker pool.
+
+    Nodes are executed through ``IWorkflow.execute_node``. When a checkpoint
+    store is given, each completed node is checkpointed so a paused or
+    interrupted execution resumes from where it stopped. Without one, a
+    failed execution can be resumed only while it is still cached.
+    """
+
+    def __init__(
+        self,
+        workflow: IWorkflow,
+        max_concurrency: Optional[int] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
+    ):
+        if type(workflow).execute_node is IWorkflow.execute_node:
+            raise TypeError(
+                f"Workflow {workflow.workflow_id} ({type(workflow).__name__}) must implement "
+                "execute_node to run on WorkflowRuntime"
+            )
+        self.workflow = workflow
+        self.max_concurrency = max_concurrency or settings.workflow_max_concurrency
+        self.checkpoint_store = checkpoint_store
+        self._executions: Dict[str, WorkflowExecution] = {}
+        self._inputs: Dict[str, Dict[str, Any]] = {}
+        self._outputs: Dict[str, Dict[str, Any]] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._stop_status: Dict[str, WorkflowStatus] = {}
+        self._subscribers: Dict[str, List[asyncio.Queue]] = {}
+        # (execution, input data, node outputs) of completed, failed and cancelled executions
+        self._finished = TTLCache(settings.workflow_finished_max_entries, settings.workflow_finished_ttl)
+
+    async def execute(self, input_data: Dict[str, Any], execution_id: Optional[str] = None) -> WorkflowExecution:
+        """
+        Execute the workflow from the start.
+
+        Args:
+            input_data: Initial data for workflow execution
+            execution_id: Optional execution ID, generated if omitted
+
+        Returns:
+            WorkflowExecution: Final execution state
+        """
+        resolve_dependencies(self.workflow.nodes)
+        execution = WorkflowExecution(
+            workflow_id=self.workflow.workflow_id,
+            execution_id=execution_id or str(uuid.uuid4()),
+            status=WorkflowStatus.RUNNING,
+            start_time=datetime.utcnow().isoformat(),
+        )
+        self._executions[execution.execution_id] = execution
+        self._inputs[execution.execution_id] = input_data
+        self._outputs[execution.execution_id] = {}
+
+        if self.checkpoint_store is not None:
+            await self.checkpoint_store.save_node_output(execution.execution_id, INPUT_KEY, input_data)
+            await self.checkpoint_store.save_execution(execution)
+
+        return await self._run(execution)
+
+    async def stream(
+        self,
+        input_data: Dict[str, Any],
+        execution_id: Optional[str] = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        Execute the workflow, yielding each node's output as it completes.
+
+        Closing the generator early cancels the execution.
+
+        Args:
+            input_data: Initial data for workflow execution
+            execution_id: Optional execution ID, generated if omitted
+
+        Yields:
+            StreamEvent: NODE_COMPLETED events, then a RESULT or ERROR event
+        """
+        execution_id = execution_id or str(uuid.uuid4())
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.setdefault(execution_id, []).append(queue)
+        task = asyncio.create_task(self.execute(input_data, execution_id=execution_id))
+        try:
+            while True:
+                getter = asyncio.ensure_future(queue.get())
+                done, _ = await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+                if getter in done:
+                    yield getter.result()
+                    continue
+                getter.cancel()
+                while not queue.empty():
+                    yield queue.get_nowait()
+                break
+
+            execution = task.result()
+            if execution.status == WorkflowStatus.COMPLETED:
+                yield StreamEvent(type=StreamEventType.RESULT, data=execution)
+            else:
+                yield StreamEvent(type=StreamEventType.ERROR, data=execution)
+        finally:
+            self._subscribers.pop(execution_id, None)
+            if not task.done() and not await self.cancel(execution_id):
+                task.cancel()
+
+    async def resume(self, execution_id: str) -> Optional[WorkflowExecution]:
+        """
+        Resume a paused or interrupted execution from its last completed node.
+
+        In-memory state is used if this runtime ran the execution; otherwise
+        state is loaded from the checkpoint store.
+
+        Args:
+            execution_id: ID of execution to resume
+
+        Returns:
+            Optional[WorkflowExecution]: Final execution state, or None if unknown
+        """
+        if execution_id in self._tasks:
+            return self._executions[execution_id]
+
+        finished = self._finished.get(execution_id)
+        if finished is not None:
+            execution, input_data, outputs = finished
+        elif execution_id in self._executions:
+            execution = self._executions[execution_id]
+            input_data, outputs = self._inputs[execution_id], self._outputs[execution_id]
+        else:
+            if self.checkpoint_store is None:
+                return None
+            state = await self.checkpoint_store.load(execution_id)
+            if state is None:
+                return None
+            execution = state.execution
+            outputs = dict(state.node_outputs)
+            input_data = outputs.pop(INPUT_KEY, {})
+            if execution.status in FINISHED_STATUSES:
+                self.checkpoint_store.forget(execution_id)
+
+        if execution.status in (WorkflowStatus.COMPLETED, WorkflowStatus.CANCELLED):
+            return execution
+
+        self._finished.delete(execution_id)
+        self._executions[execution_id] = execution
+        self._inputs[execution_id] = input_data
+        self._outputs[execution_id] = outputs
+        execution.status = WorkflowStatus.RUNNING
+        execution.error = None
+        return await self._run(execution)
+
+    async def pause(self, execution_id: str) -> bool:
+        """
+        Pause a running execution, keeping the outputs of completed nodes.
+
+        Args:
+            execution_id: ID of execution to pause
+
+        Returns:
+            bool: True if the execution was running and is now paused
+        """
+        return await self._stop(execution_id, WorkflowStatus.PAUSED)
+
+    async def cancel(self, execution_id: str) -> bool:
+        """
+        Cancel a running execution.
+
+        Args:
+            execution_id: ID of execution to cancel
+
+        Returns:
+            bool: True if the execution was running and is now cancelled
+        """
+        return await self._stop(execution_id, WorkflowStatus.CANCELLED)
+
+    def get_status(self, execution_id: str) -> Optional[WorkflowExecution]:
+        """
+        Get the live state of an execution run by this runtime.
+
+        Args:
+            execution_id: ID of execution to check
+
+        Returns:
+            Optional[WorkflowExecution]: Current execution state, or None if
+                unknown or finished longer ago than WORKFLOW_FINISHED_TTL
+        """
+        execution = self._executions.get(execution_id)
+        if execution is None:
+            finished = self._finished.get(execution_id)
+            execution = finished[0] if finished is not None else None
+        return execution
+
+    async def _stop(self, execution_id: str, status: WorkflowStatus) -> bool:
+        task = self._tasks.get(execution_id)
+        if task is None:
+            return False
+        self._stop_status[execution_id] = status
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        return True
+
+    async def _run(self, execution: WorkflowExecution) -> WorkflowExecution:
+        execution_id = execution.execution_id
+        task = asyncio.create_task(
+            asyncio.wait_for(self._schedule(execution), timeout=settings.max_workflow_duration)
+        )
+        self._tasks[execution_id] = task
+        try:
+            await task
+            execution.status = WorkflowStatus.COMPLETED
+            execution.current_node = None
+            execution.result = self._collect_result(execution_id)
+        except asyncio.CancelledError:
+            stop_status = self._stop_status.pop(execution_id, None)
+            if stop_status is None:
+                # The caller was cancelled, not the execution
+                raise
+            execution.status = stop_status
+        except asyncio.TimeoutError:
+            execution.status = WorkflowStatus.FAILED
+            execution.error = f"Workflow exceeded max duration of {settings.max_workflow_duration}s"
+        except NodeExecutionError as e:
+            execution.status = WorkflowStatus.FAILED
+            execution.current_node = e.node_id
+            execution.error = str(e)
+        except Exception as e:
+            # E.g. a checkpoint write failing mid-run
+            execution.status = WorkflowStatus.FAILED
+            execution.error = f"{type(e).__name__}: {e}"
+        finally:
+            self._tasks.pop(execution_id, None)
+
+        if execution.status != WorkflowStatus.PAUSED:
+            execution.end_time = datetime.utcnow().isoformat()
+        try:
+            if self.checkpoint_store is not None:
+                await self.checkpoint_store.save_execution(execution)
+                if execution.status in FINISHED_STATUSES:
+                    # Collapse the deltas into one snapshot and drop the store's
+                    # in-memory state; a later resume reloads it
+                    await self.checkpoint_store.compact(execution_id)
+                    self.checkpoint_store.forget(execution_id)
+        finally:
+            if execution.status in FINISHED_STATUSES:
+                self._retire(execution_id)
+        return execution
+
+    def _retire(self, execution_id: str) -> None:
+        """Move a finished execution from the live maps to the finished cache."""
+        self._finished.set(execution_id, (
+            self._executions.pop(execution_id),
+            self._inputs.pop(execution_id),
+            self._outputs.pop(execution_id),
+        ))
+
+    async def _schedule(self, execution: WorkflowExecution) -> None:
+        """Run all outstanding nodes in dependency order."""
+        execution_id = execution.execution_id
+        input_data = self._inputs[execution_id]
+        outputs = self._outputs[execution_id]
+        nodes = {node.node_id: node for node in self.workflow.nodes}
+        dependencies = resolve_dependencies(list(nodes.values()))
+
+        remaining: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = {node_id: [] for node_id in nodes}
+        for node_id, deps in dependencies.items():
+            if node_id in outputs:
+                continue
+            pending = [dep for dep in deps if dep not in outputs]
+            remaining[node_id] = len(pending)
+            for dep in pending:
+                dependents[dep].append(node_id)
+
+        ready = deque(node_id for node_id, count in remaining.items() if count == 0)
+        running: Dict[asyncio.Task, str] = {}
+        try:
+            while ready or running:
+                while ready and len(running) < self.max_concurrency:
+                    node_id = ready.popleft()
+                    inputs = {dep: outputs[dep] for dep in dependencies[node_id]}
+                    node_task = asyncio.create_task(
+                        self.workflow.execute_node(nodes[node_id], inputs, input_data)
+                    )
+                    running[node_task] = node_id
+                    execution.current_node = node_id
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for node_task in done:
+                    node_id = running.pop(node_task)
+                    if node_task.exception() is not None:
+                        raise NodeExecutionError(node_id, node_task.exception())
+
+                    outputs[node_id] = node_task.result()
+                    execution.progress = len(outputs) / len(nodes)
+                    if self.checkpoint_store is not None:
+                        await self.checkpoint_store.save_node_output(execution_id, node_id, outputs[node_id])
+                        await self.checkpoint_store.save_execution(execution)
+
+                    self._publish(execution_id, StreamEvent(
+                        type=StreamEventType.NODE_COMPLETED,
+                        node_id=node_id,
+                        data={"output": outputs[node_id], "progress": execution.progress},
+                    ))
+
+                    for dependent in dependents[node_id]:
+                        remaining[dependent] -= 1
+                        if remaining[dependent] == 0:
+                            ready.append(dependent)
+        finally:
+            for node_task in running:
+                node_task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+    def _publish(self, execution_id: str, event: StreamEvent) -> None:
+        for queue in self._subscribers.get(execution_id, ()):
+            queue.put_nowait(event)
+
+    def _collect_result(self, execution_id: str) -> Dict[str, Any]:
+        """Outputs of the sink nodes, i.e. nodes nothing else depends on."""
+        outputs = self._outputs[execution_id]
+        dependencies = resolve_dependencies(self.workflow.nodes)
+        depended_on = {dep for deps in dependencies.values() for dep in deps}
+        return {node_id: outputs[node_id] for node_id in dependencies if node_id not in depended_on}
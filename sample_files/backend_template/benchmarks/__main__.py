@@ -0,0 +1,62 @@
+"""
+Run the benchmark suite.
+
+Usage:
+    python -m benchmarks                          # all suites, table output
+    python -m benchmarks --suite micro --json     # JSON to stdout
+    python -m benchmarks --suite serialization    # response encoding paths
+    python -m benchmarks --output base.json       # save results
+    python -m benchmarks --compare base.json      # show p50 change against saved results
+
+Compare results from the same machine only; absolute numbers vary widely
+between hosts.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+from benchmarks import api, micro, serialization
+from benchmarks.common import environment, load_results, print_table
+
+
+SUITES = ("micro", "serialization", "api")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the API and interface benchmarks")
+    parser.add_argument("--suite", default=",".join(SUITES), help=f"Comma-separated suites: {', '.join(SUITES)}")
+    parser.add_argument("--iterations", type=int, default=20000, help="Iterations per micro-benchmark")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per API scenario")
+    parser.add_argument("--concurrency", type=int, default=1, help="Concurrent requests per API scenario")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--compare", help="Results file to compare against")
+    args = parser.parse_args()
+
+    # Benchmarks import the app from the project root
+    sys.path.insert(0, os.getcwd())
+
+    results = []
+    suites = args.suite.split(",")
+    if "micro" in suites:
+        results += micro.run(args.iterations)
+    if "serialization" in suites:
+        results += serialization.run(args.iterations)
+    if "api" in suites:
+        results += asyncio.run(api.run(args.requests, args.concurrency))
+
+    report = {"environment": environment(), "results": [result.model_dump() for result in results]}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_table(results, load_results(args.compare) if args.compare else None)
+
+
+if __name__ == "__main__":
+    main()
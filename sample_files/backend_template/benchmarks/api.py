@@ -0,0 +1,81 @@
+"""
+End-to-end API benchmarks against the ``main.py`` app, in-process.
+
+Requests go through httpx's ASGI transport, so no sockets or server are
+involved. The app runs its real lifespan with fake agents, a fake workflow
+and a fake LLM provider registered, on a throwaway SQLite database.
+"""
+
+import os
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+from benchmarks.common import BenchmarkResult, time_async
+
+
+# (name, method, path, JSON body)
+SCENARIOS: List[Tuple[str, str, str, Optional[Dict[str, Any]]]] = [
+    ("GET /", "GET", "/", None),
+    ("GET /health", "GET", "/health", None),
+    ("GET /health/detailed", "GET", "/health/detailed", None),
+    ("GET /health/ready", "GET", "/health/ready", None),
+    ("GET /openapi.json", "GET", "/openapi.json", None),
+    ("POST agent task stream (SSE)", "POST", "/api/v1/agents/tasks/stream",
+     {"agent_id": "bench-agent", "type": "task_1", "parameters": {"q": "shoes"}}),
+    ("POST workflow stream (SSE)", "POST", "/api/v1/workflows/bench-workflow/stream", {"q": "shoes"}),
+    ("POST /llm/complete (cached)", "POST", "/api/v1/llm/complete",
+     {"provider": "fake", "messages": [{"role": "user", "content": "Describe these shoes"}]}),
+    ("GET /llm/stats", "GET", "/api/v1/llm/stats", None),
+    ("GET /workflows (catalog)", "GET", "/api/v1/workflows", None),
+]
+
+
+def _configure(database_path: str) -> None:
+    """Point the app at a local SQLite database and keep it offline."""
+    from app.core.config import settings
+
+    # Engines are created on first use and main reads these on import, so
+    # overriding the loaded settings is enough as long as main is not imported yet
+    settings.database_url = f"sqlite+aiosqlite:///{database_path}"
+    settings.database_read_replica_url = None
+    if "TELEMETRY_ENABLED" not in os.environ:
+        settings.telemetry_enabled = False
+    settings.lazy_startup = False
+
+
+async def run(requests: int = 2000, concurrency: int = 1) -> List[BenchmarkResult]:
+    """Run every scenario against a freshly started app."""
+    with tempfile.TemporaryDirectory() as directory:
+        _configure(os.path.join(directory, "benchmark.db"))
+        return await _run(requests, concurrency)
+
+
+async def _run(requests: int, concurrency: int) -> List[BenchmarkResult]:
+    import httpx
+
+    from app.agents.registry import agent_registry
+    from app.core.database import close_database_connections, init_database
+    from app.llm.orchestrator import llm_orchestrator
+    from app.workflows.registry import workflow_registry
+    from benchmarks.fakes import FakeAgent, FakeLLMProvider, FakeWorkflow
+    from main import app
+
+    results = []
+    async with app.router.lifespan_context(app):
+        await init_database()
+        agent = FakeAgent("bench-agent")
+        await agent.initialize()
+        agent_registry.register(agent)
+        workflow_registry.register(FakeWorkflow("bench-workflow"))
+        llm_orchestrator.register_provider(FakeLLMProvider("fake"))
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            for name, method, path, body in SCENARIOS:
+                async def call(method=method, path=path, body=body):
+                    response = await client.request(method, path, json=body)
+                    response.raise_for_status()
+
+                results.append(await time_async(name, call, requests, concurrency=concurrency))
+        await close_database_connections()
+    return results
@@ -0,0 +1,125 @@
+"""
+Timing helpers and result reporting shared by the benchmarks.
+"""
+
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from pydantic import BaseModel
+
+
+class BenchmarkResult(BaseModel):
+    """Latency distribution and throughput of one benchmark."""
+    name: str
+    iterations: int
+    concurrency: int = 1
+    ops_per_second: float
+    mean_us: float
+    p50_us: float
+    p99_us: float
+    max_us: float
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of unsorted samples."""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+def summarize(name: str, latencies: List[float], elapsed: float, concurrency: int = 1) -> BenchmarkResult:
+    """Build a result from per-operation latencies and total wall time (seconds)."""
+    return BenchmarkResult(
+        name=name,
+        iterations=len(latencies),
+        concurrency=concurrency,
+        ops_per_second=len(latencies) / elapsed if elapsed > 0 else 0.0,
+        mean_us=statistics.fmean(latencies) * 1e6,
+        p50_us=percentile(latencies, 50) * 1e6,
+        p99_us=percentile(latencies, 99) * 1e6,
+        max_us=max(latencies) * 1e6,
+    )
+
+
+def time_sync(name: str, func: Callable[[], Any], iterations: int, warmup: int = 100) -> BenchmarkResult:
+    """Time a synchronous callable."""
+    for _ in range(warmup):
+        func()
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - call_started)
+    return summarize(name, latencies, time.perf_counter() - started)
+
+
+async def time_async(
+    name: str,
+    func: Callable[[], Awaitable[Any]],
+    iterations: int,
+    concurrency: int = 1,
+    warmup: int = 50,
+) -> BenchmarkResult:
+    """
+    Time a coroutine function, keeping ``concurrency`` calls in flight.
+
+    Throughput is iterations over wall time; latencies are per call.
+    """
+    for _ in range(warmup):
+        await func()
+
+    latencies: List[float] = []
+    remaining = iterations
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            call_started = time.perf_counter()
+            await func()
+            latencies.append(time.perf_counter() - call_started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(name, latencies, time.perf_counter() - started, concurrency)
+
+
+def environment() -> Dict[str, Any]:
+    """Commit and platform the results were measured on."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def print_table(results: Sequence[BenchmarkResult], baseline: Optional[Dict[str, Dict[str, Any]]] = None) -> None:
+    """Print results, with the p50 change against a baseline if given."""
+    header = f"{'benchmark':<36}{'ops/s':>12}{'p50 us':>11}{'p99 us':>11}"
+    print(header + (f"{'p50 vs base':>13}" if baseline else ""))
+    for result in results:
+        line = f"{result.name:<36}{result.ops_per_second:>12.0f}{result.p50_us:>11.1f}{result.p99_us:>11.1f}"
+        if baseline:
+            base = baseline.get(result.name)
+            change = f"{(result.p50_us / base['p50_us'] - 1) * 100:+.1f}%" if base else "new"
+            line += f"{change:>13}"
+        print(line)
+
+
+def load_results(path: str) -> Dict[str, Dict[str, Any]]:
+    """Read a JSON results file written by ``python -m benchmarks --output``."""
+    with open(path) as f:
+        return {result["name"]: result for result in json.load(f)["results"]}
@@ -0,0 +1,140 @@
+"""
+Local fake agents, tools, workflows and LLM providers for benchmarks.
+
+They do no I/O, so measurements reflect the framework's own overhead.
+"""
+
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List
+
+from app.interfaces.agent import AgentCapability, AgentStatus, IAgent
+from app.interfaces.llm import ILLMProvider, LLMRequest, LLMResponse
+from app.interfaces.tool import ITool, ToolCategory, ToolParameter, ToolResult
+from app.interfaces.workflow import IWorkflow, WorkflowExecution, WorkflowNode, WorkflowStatus
+
+
+class FakeTool(ITool):
+    """Tool with ``parameter_count`` parameters that echoes its input."""
+
+    def __init__(self, tool_id: str = "fake-tool", parameter_count: int = 10):
+        super().__init__(tool_id)
+        self._parameters = [
+            ToolParameter(name=f"param_{i}", type="str", description=f"Parameter {i}", required=i < 3)
+            for i in range(parameter_count)
+        ]
+
+    @property
+    def name(self) -> str:
+        return "Fake tool"
+
+    @property
+    def description(self) -> str:
+        return "Echoes its parameters"
+
+    @property
+    def category(self) -> ToolCategory:
+        return ToolCategory.UTILITY
+
+    @property
+    def parameters(self) -> List[ToolParameter]:
+        return self._parameters
+
+    async def execute(self, **kwargs) -> ToolResult:
+        return ToolResult(success=True, data=kwargs)
+
+
+class FakeAgent(IAgent):
+    """Agent with ``capability_count`` capabilities that echoes its task."""
+
+    def __init__(self, agent_id: str = "fake-agent", capability_count: int = 20):
+        super().__init__(agent_id, {})
+        self._capabilities = [
+            AgentCapability(name=f"task_{i}", description=f"Handles task_{i}") for i in range(capability_count)
+        ]
+
+    @property
+    def capabilities(self) -> List[AgentCapability]:
+        return self._capabilities
+
+    async def initialize(self) -> bool:
+        return True
+
+    async def execute_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        return {"status": "completed", "result": task.get("parameters", {})}
+
+    async def get_status(self) -> AgentStatus:
+        return AgentStatus(agent_id=self.agent_id, status=self._status, last_update=datetime.utcnow().isoformat())
+
+    async def stop(self) -> bool:
+        return True
+
+
+class FakeWorkflow(IWorkflow):
+    """Workflow of ``node_count`` chained nodes that completes immediately."""
+
+    def __init__(self, workflow_id: str = "fake-workflow", node_count: int = 20):
+        super().__init__(workflow_id)
+        self._nodes = [
+            WorkflowNode(
+                node_id=f"node_{i}",
+                name=f"Node {i}",
+                type="tool",
+                config={"depends_on": [f"node_{i - 1}"]} if i else {},
+            )
+            for i in range(node_count)
+        ]
+
+    @property
+    def name(self) -> str:
+        return "Fake workflow"
+
+    @property
+    def description(self) -> str:
+        return "Completes without doing any work"
+
+    @property
+    def nodes(self) -> List[WorkflowNode]:
+        return self._nodes
+
+    async def initialize(self) -> bool:
+        return True
+
+    async def execute(self, input_data: Dict[str, Any]) -> WorkflowExecution:
+        now = datetime.utcnow().isoformat()
+        return WorkflowExecution(
+            workflow_id=self.workflow_id,
+            execution_id=str(uuid.uuid4()),
+            status=WorkflowStatus.COMPLETED,
+            progress=1.0,
+            start_time=now,
+            end_time=now,
+            result=input_data,
+        )
+
+    async def pause(self, execution_id: str) -> bool:
+        return False
+
+    async def resume(self, execution_id: str) -> bool:
+        return False
+
+    async def cancel(self, execution_id: str) -> bool:
+        return False
+
+    async def get_status(self, execution_id: str) -> WorkflowExecution:
+        raise KeyError(execution_id)
+
+
+class FakeLLMProvider(ILLMProvider):
+    """LLM provider answering every request with the last message reversed."""
+
+    @property
+    def default_model(self) -> str:
+        return "fake-model"
+
+    async def complete(self, request: LLMRequest) -> LLMResponse:
+        return LLMResponse(
+            content=request.messages[-1].content[::-1],
+            provider=self.provider_id,
+            model=request.model or self.default_model,
+        )
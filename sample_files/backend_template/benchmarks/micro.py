@@ -0,0 +1,27 @@
+"""
+Micro-benchmarks for interface hot paths and settings loading.
+"""
+
+from typing import List
+
+from benchmarks.common import BenchmarkResult, time_sync
+
+
+def run(iterations: int = 20000) -> List[BenchmarkResult]:
+    """Run the micro-benchmarks."""
+    from app.core.config import Settings, load_settings
+    from benchmarks.fakes import FakeAgent, FakeTool, FakeWorkflow
+
+    tool = FakeTool()
+    agent = FakeAgent()
+    workflow = FakeWorkflow()
+
+    settings_iterations = max(1, iterations // 20)  # each load reads the environment and .env
+    return [
+        time_sync("tool.get_schema", tool.get_schema, iterations),
+        time_sync("agent.can_handle_task (hit)", lambda: agent.can_handle_task("task_7"), iterations),
+        time_sync("agent.can_handle_task (miss)", lambda: agent.can_handle_task("unknown"), iterations),
+        time_sync("workflow.get_schema", workflow.get_schema, iterations),
+        time_sync("Settings()", Settings, settings_iterations, warmup=10),
+        time_sync("load_settings()", load_settings, settings_iterations, warmup=10),
+    ]
@@ -0,0 +1,77 @@
+"""
+Benchmarks of response serialization for large result payloads.
+
+Compares FastAPI's default path (response model validation, or
+jsonable_encoder without a response model, then json.dumps) with
+app.core.serialization.dumps for a ToolResult and a WorkflowExecution
+carrying a product list.
+"""
+
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+from benchmarks.common import BenchmarkResult, time_sync
+
+
+def product_list(count: int) -> List[Dict[str, Any]]:
+    """Product records shaped like a catalog search result."""
+    return [
+        {
+            "id": f"sku-{i}",
+            "name": f"Product {i}",
+            "description": "Lightweight running shoe with a breathable mesh upper",
+            "price": round(19.99 + i * 0.5, 2),
+            "in_stock": i % 3 != 0,
+            "tags": ["shoes", "running", "mesh"],
+            "attributes": {"color": "red", "size": 40 + i % 8},
+            "score": 1.0 / (i + 1),
+        }
+        for i in range(count)
+    ]
+
+
+def _stdlib_render(content: Any) -> bytes:
+    # What starlette's JSONResponse.render does
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def run(iterations: int = 20000, products: int = 1000) -> List[BenchmarkResult]:
+    """Run the serialization benchmarks."""
+    from fastapi.encoders import jsonable_encoder
+    from pydantic import TypeAdapter
+
+    from app.core.serialization import dumps, json_backend
+    from app.interfaces.tool import ToolResult
+    from app.interfaces.workflow import WorkflowExecution, WorkflowStatus
+
+    items = product_list(products)
+    payloads = {
+        "ToolResult": ToolResult(success=True, data=items, metadata={"total": products}),
+        "WorkflowExecution": WorkflowExecution(
+            workflow_id="bench-workflow",
+            execution_id=str(uuid.uuid4()),
+            status=WorkflowStatus.COMPLETED,
+            progress=1.0,
+            start_time=datetime.utcnow().isoformat(),
+            result={"products": items},
+        ),
+    }
+
+    # Each call encodes a payload of `products` items, so scale iterations down
+    count = max(10, iterations // max(1, products // 10))
+    results = []
+    for name, payload in payloads.items():
+        adapter = TypeAdapter(type(payload))
+        cases: Dict[str, Callable[[], Any]] = {
+            "response_model": lambda: _stdlib_render(
+                adapter.dump_python(adapter.validate_python(payload), mode="json", by_alias=True)
+            ),
+            "jsonable_encoder": lambda: _stdlib_render(jsonable_encoder(payload)),
+            "model_dump_json": payload.model_dump_json,
+            f"dumps ({json_backend()})": lambda: dumps(payload),
+        }
+        for case, func in cases.items():
+            results.append(time_sync(f"{name}: {case}", func, count, warmup=5))
+    return results
@@ -0,0 +1,140 @@
+"""
+Per-request overhead of each tracing mode.
+
+Each mode runs in a fresh interpreter (a process has a single global tracer
+provider) configured through the same settings as the application, and
+drives an instrumented FastAPI route that executes a tool in-process.
+Spans go to an exporter that discards them, so the numbers are the cost of
+creating, sampling and batching spans rather than of the network.
+
+Usage:
+    python -m benchmarks.tracing_overhead [--requests 5000] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+from benchmarks.common import percentile
+
+
+# Mode name -> settings applied through the environment
+MODES: Dict[str, Dict[str, str]] = {
+    "off": {"TELEMETRY_ENABLED": "false"},
+    "ratio=1.0": {"TRACE_SAMPLE_RATIO": "1.0"},
+    "ratio=0.1": {"TRACE_SAMPLE_RATIO": "0.1"},
+    "ratio=0.01": {"TRACE_SAMPLE_RATIO": "0.01"},
+    "ratio=0.01+tail": {"TRACE_SAMPLE_RATIO": "0.01", "TRACE_TAIL_SAMPLING": "true"},
+}
+
+
+async def measure(requests: int, warmup: int) -> Dict[str, Any]:
+    """Time requests against an app configured from the current settings."""
+    import httpx
+    from fastapi import FastAPI
+
+    from app.core.config import settings
+    from app.core.telemetry import enable_tracing
+    from app.interfaces.tool import ITool, ToolCategory, ToolResult
+
+    class EchoTool(ITool):
+        name = "echo"
+        description = "Returns its input"
+        category = ToolCategory.UTILITY
+        parameters = []
+
+        async def execute(self, **kwargs) -> ToolResult:
+            return ToolResult(success=True, data=kwargs)
+
+    app = FastAPI()
+    tool = EchoTool("echo")
+
+    @app.get("/echo")
+    async def echo(q: str = "x"):
+        result = await tool.execute(q=q)
+        return result.data
+
+    if settings.telemetry_enabled:
+        from opentelemetry import trace
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+        from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+
+        from app.core.trace_sampling import build_tracer_provider
+
+        class NullSpanExporter(SpanExporter):
+            def export(self, spans):
+                return SpanExportResult.SUCCESS
+
+        trace.set_tracer_provider(build_tracer_provider(NullSpanExporter()))
+        enable_tracing()
+        FastAPIInstrumentor.instrument_app(app)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(warmup):
+            await client.get("/echo")
+        latencies: List[float] = []
+        started = time.perf_counter()
+        for _ in range(requests):
+            request_started = time.perf_counter()
+            response = await client.get("/echo")
+            latencies.append(time.perf_counter() - request_started)
+            response.raise_for_status()
+        elapsed = time.perf_counter() - started
+
+    return {
+        "requests": requests,
+        "requests_per_second": requests / elapsed,
+        "mean_us": statistics.fmean(latencies) * 1e6,
+        "p50_us": percentile(latencies, 50) * 1e6,
+        "p99_us": percentile(latencies, 99) * 1e6,
+    }
+
+
+def run_mode(mode: str, requests: int, warmup: int) -> Dict[str, Any]:
+    """Run one mode in a child interpreter and return its measurements."""
+    env = {**os.environ, **MODES[mode]}
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.tracing_overhead", "--child",
+         "--requests", str(requests), "--warmup", str(warmup)],
+        env=env, check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--warmup", type=int, default=500)
+    parser.add_argument("--modes", default=",".join(MODES), help="Comma-separated modes to run")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(asyncio.run(measure(args.requests, args.warmup))))
+        return
+
+    results = {mode: run_mode(mode, args.requests, args.warmup) for mode in args.modes.split(",")}
+    baseline = results.get("off")
+    for result in results.values():
+        result["overhead_us"] = result["mean_us"] - baseline["mean_us"] if baseline else None
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'mode':<18}{'req/s':>10}{'mean us':>10}{'p50 us':>10}{'p99 us':>10}{'overhead us':>13}")
+    for mode, result in results.items():
+        overhead = "" if result["overhead_us"] is None else f"{result['overhead_us']:.1f}"
+        print(f"{mode:<18}{result['requests_per_second']:>10.0f}{result['mean_us']:>10.1f}"
+              f"{result['p50_us']:>10.1f}{result['p99_us']:>10.1f}{overhead:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,51 +5,93 @@ This file sets up the FastAPI application with modern agentic system architectur
 including LangGraph workflows, OpenTelemetry observability, and agent coordination.
 """
 
+# Imported first so the startup report measures everything below
+from app.core.startup import startup_report, warm_up
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
+import asyncio
+import importlib
+import time
 import uvicorn
 import os
 from dotenv import load_dotenv
 
-# OpenTelemetry imports
-from opentelemetry import trace
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+# OpenTelemetry imports (exporter and SDK are imported in setup_telemetry)
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-from opentelemetry.sdk.resources import Resource
+
+from app.agents.registry import agent_registry
+from app.api.admin import router as admin_router
+from app.api.catalog import router as catalog_router
+from app.api.llm import router as llm_router
+from app.api.streaming import router as streaming_router
+from app.api.tasks import router as tasks_router
+from app.core.config import settings
+from app.core.database import check_database_health, get_engine, get_engines, get_pool_metrics
+from app.core.health import check_redis_health, health_monitor
+from app.core.profiling import ProfilingMiddleware, flight_recorder
+from app.core.serialization import FastJSONResponse
+from app.core.telemetry import enable_tracing
+from app.llm.client_pool import llm_client_pool
+from app.llm.embeddings import embedding_service
+from app.llm.orchestrator import llm_orchestrator
+from app.llm.providers import build_providers
+from app.tasks.dispatch import task_queue
 
 # Import your modules here (uncomment as needed)
-# from app.core.config import settings
-# from app.core.database import engine, Base
+# from app.core.database import Base
 # from app.api.routes import api_router
 # from app.agents.coordinator import AgentCoordinator
 # from app.workflows.manager import WorkflowManager
-# from app.llm.orchestrator import LLMOrchestrator
 
 # Load environment variables
 load_dotenv()
 
+startup_report.record("imports", time.perf_counter() - startup_report.started_at)
+
 # Initialize OpenTelemetry
 def setup_telemetry():
-    """Setup OpenTelemetry tracing."""
+    """Setup OpenTelemetry tracing, metrics and SQLAlchemy instrumentation."""
+    if not settings.telemetry_enabled:
+        return
+    
+    from opentelemetry import metrics, trace
+    from opentelemetry.exporter.otlp.proto.grpc.metric_exporter import OTLPMetricExporter
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+    from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+    from opentelemetry.sdk.resources import Resource
+    from app.core.trace_sampling import build_tracer_provider
+    
     resource = Resource.create({
         "service.name": os.getenv("SERVICE_NAME", "[PROJECT_NAME]-backend"),
         "service.version": "1.0.0",
     })
+    endpoint = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317")
     
-    provider = TracerProvider(resource=resource)
-    
-    # Configure OTLP exporter
+    # Configure OTLP exporter; the timeout bounds how long an unreachable
+    # collector can hold up an export (and the final flush on shutdown)
     otlp_exporter = OTLPSpanExporter(
-        endpoint=os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4317"),
-        insecure=True
+        endpoint=endpoint,
+        insecure=True,
+        timeout=settings.otel_exporter_timeout,
     )
     
-    provider.add_span_processor(BatchSpanProcessor(otlp_exporter))
-    trace.set_tracer_provider(provider)
+    # Sampling and export batching are configured by the TRACE_* and OTEL_BSP_* settings
+    trace.set_tracer_provider(build_tracer_provider(otlp_exporter, resource))
+    enable_tracing()
+    
+    # Agent, tool and workflow latency, concurrency and error metrics
+    metric_reader = PeriodicExportingMetricReader(
+        OTLPMetricExporter(endpoint=endpoint, insecure=True, timeout=settings.otel_exporter_timeout)
+    )
+    metrics.set_meter_provider(MeterProvider(resource=resource, metric_readers=[metric_reader]))
+    
+    # Trace queries on engines that already exist and on those created later
+    SQLAlchemyInstrumentor().instrument(engines=[engine.sync_engine for engine in get_engines()])
 
 # Application lifecycle
 @asynccontextmanager
@@ -58,21 +100,67 @@ async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Starting [PROJECT_NAME] backend...")
     
-    # Setup observability
-    setup_telemetry()
+    warmup_task = None
+    if settings.lazy_startup:
+        # Report ready immediately; telemetry, the database engine and heavy
+        # modules are initialized in the background
+        warmup_task = asyncio.create_task(
+            warm_up([setup_telemetry, get_engine], settings.startup_warmup_modules, startup_report)
+        )
+    else:
+        # Setup observability
+        with startup_report.phase("setup_telemetry"):
+            setup_telemetry()
+        for module in settings.startup_warmup_modules:
+            with startup_report.phase(f"import {module}"):
+                importlib.import_module(module)
+        startup_report.warmup_complete = True
+    
+    # Register health probes; results are cached and refreshed in the background
+    health_monitor.register("database", check_database_health)
+    health_monitor.register("redis", check_redis_health, critical=False)
+    health_monitor.register_source(
+        "agents",
+        lambda: {f"agent:{agent.agent_id}": agent.health_check for agent in agent_registry.list_agents()},
+    )
+    await health_monitor.start()
+    
+    # Register LLM providers for the configured API keys; they share pooled
+    # keep-alive connections and per-provider rate limiters
+    for provider in build_providers():
+        llm_orchestrator.register_provider(provider)
+    
+    # Batch concurrent embedding requests (also used by the semantic LLM cache)
+    await embedding_service.start()
+    llm_orchestrator.embed = embedding_service.embed
+    
+    # Run queued agent tasks and workflow runs (TASK_QUEUE_BACKEND)
+    await task_queue.start()
     
     # Initialize core components
     # await initialize_database()
     # await setup_agent_coordinator()
     # await initialize_workflow_manager()
-    # await setup_llm_orchestrator()
     
+    startup_report.mark_ready()
+    startup_report.print_summary()
     print("✅ [PROJECT_NAME] backend initialized successfully")
     
     yield
     
     # Shutdown
     print("🔄 Shutting down [PROJECT_NAME] backend...")
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+    await task_queue.stop()
+    await health_monitor.stop()
+    await embedding_service.stop()
+    await llm_client_pool.close()
+    # Imported here so numpy is only loaded at startup if an index is used
+    from app.retrieval.bm25 import save_bm25_indexes
+    from app.retrieval.vector_index import save_vector_indexes
+    save_vector_indexes()
+    save_bm25_indexes()
     # Clean up connections, agents, workflows, etc.
     print("✅ [PROJECT_NAME] backend shutdown complete")
 
@@ -82,17 +170,25 @@ app = FastAPI(
     description="[PROJECT_DESCRIPTION] - Multi-agent system with LangGraph workflows and intelligent automation",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     openapi_tags=[
         {"name": "health", "description": "Health check endpoints"},
         {"name": "agents", "description": "Agent management and coordination"},
         {"name": "workflows", "description": "LangGraph workflow execution"},
         {"name": "tools", "description": "Tool registry and execution"},
         {"name": "llm", "description": "LLM orchestration and task management"},
+        {"name": "tasks", "description": "Queued agent tasks and workflow runs"},
+        {"name": "admin", "description": "Request profiles and diagnostics"},
     ]
 )
 
-# Instrument FastAPI with OpenTelemetry
-FastAPIInstrumentor.instrument_app(app)
+# Instrument FastAPI with OpenTelemetry (skipped entirely in no-op mode)
+if settings.telemetry_enabled:
+    FastAPIInstrumentor.instrument_app(app)
+
+# Profile sampled requests (and any sent with X-Profile) into the flight recorder
+if settings.profiling_enabled:
+    app.add_middleware(ProfilingMiddleware, recorder=flight_recorder)
 
 # Configure CORS
 app.add_middleware(
@@ -116,20 +212,41 @@ async def health_check():
 
 @app.get("/health/detailed", tags=["health"])
 async def detailed_health_check():
-    """Detailed health check with component status."""
-    # Add actual health checks for your components
-    health_status = {
-        "status": "healthy",
+    """Detailed health check with component status (cached)."""
+    report = await health_monitor.get_report()
+    return {
+        "status": report.status,
         "service": "[PROJECT_NAME]",
         "version": "1.0.0",
-        "components": {
-            "database": "healthy",  # Replace with actual check
-            "redis": "healthy",     # Replace with actual check
-            "agents": "healthy",    # Replace with actual check
-            "workflows": "healthy", # Replace with actual check
-        }
+        "checked_at": report.checked_at,
+        "components": {name: c.model_dump() for name, c in report.components.items()},
     }
-    return health_status
+
+@app.get("/health/live", tags=["health"])
+async def liveness_check():
+    """Liveness probe; fails only if background health refreshes have stalled."""
+    age = health_monitor.report_age
+    if age is not None and age > 3 * health_monitor.cache_ttl + health_monitor.probe_timeout:
+        return JSONResponse(status_code=503, content={"status": "stalled", "report_age": age})
+    return {"status": "alive"}
+
+@app.get("/health/ready", tags=["health"])
+async def readiness_check():
+    """Readiness probe; requires startup to finish and critical components to be healthy (cached)."""
+    report = await health_monitor.get_report()
+    ready = startup_report.ready_at is not None and report.ready
+    content = {"status": "ready" if ready else "not_ready", "checked_at": report.checked_at}
+    return JSONResponse(status_code=200 if ready else 503, content=content)
+
+@app.get("/health/startup", tags=["health"])
+async def startup_timing():
+    """Startup phase timings and background warm-up status."""
+    return startup_report.as_dict()
+
+@app.get("/health/database/pool", tags=["health"])
+async def database_pool_metrics():
+    """Connection pool usage, wait time and pre-ping cost per engine."""
+    return get_pool_metrics()
 
 # Root endpoint
 @app.get("/")
@@ -141,19 +258,32 @@ async def root():
         "docs": "/docs"
     }
 
-# Include API routes (uncomment as needed)
+# Include API routes
+app.include_router(streaming_router, prefix="/api/v1")
+app.include_router(catalog_router, prefix="/api/v1")
+app.include_router(tasks_router, prefix="/api/v1", tags=["tasks"])
+app.include_router(llm_router, prefix="/api/v1/llm", tags=["llm"])
+if settings.profiling_enabled:
+    app.include_router(admin_router, prefix="/api/v1/admin", tags=["admin"])
+# (uncomment as needed)
 # app.include_router(api_router, prefix="/api/v1")
 # app.include_router(agent_router, prefix="/api/v1/agents", tags=["agents"])
 # app.include_router(workflow_router, prefix="/api/v1/workflows", tags=["workflows"])
 # app.include_router(tool_router, prefix="/api/v1/tools", tags=["tools"])
-# app.include_router(llm_router, prefix="/api/v1/llm", tags=["llm"])
 
 if __name__ == "__main__":
-    # Development server configuration
-    uvicorn.run(
-        "main:app",
-        host=os.getenv("HOST", "0.0.0.0"),
-        port=int(os.getenv("PORT", 8000)),
-        reload=os.getenv("ENVIRONMENT", "development") == "development",
-        log_level=os.getenv("LOG_LEVEL", "info").lower()
-    )
\ No newline at end of file
+    if os.getenv("ENVIRONMENT", "development") == "development":
+        # Development server configuration
+        uvicorn.run(
+            "main:app",
+            host=os.getenv("HOST", "0.0.0.0"),
+            port=int(os.getenv("PORT", 8000)),
+            reload=True,
+            log_level=os.getenv("LOG_LEVEL", "info").lower()
+        )
+    else:
+        # Production: pre-forked workers sharing one socket, one per CPU by
+        # default (one when single-worker features are configured); SIGHUP
+        # performs a rolling restart
+        from app.core.server import run_server
+        run_server("main:app", uvicorn_options={"log_level": os.getenv("LOG_LEVEL", "info").lower()})
@@ -0,0 +1,69 @@
+"""
+Tests for the agent registry.
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from app.agents.registry import AgentRegistry
+from app.interfaces.agent import AgentCapability, AgentStatus, IAgent
+
+
+class EchoAgent(IAgent):
+    """Agent that returns its task once released."""
+
+    def __init__(self, agent_id: str, reported: str = "idle"):
+        super().__init__(agent_id, {})
+        self.reported = reported
+        self.release = asyncio.Event()
+
+    @property
+    def capabilities(self):
+        return [AgentCapability(name="echo", description="Echo the task")]
+
+    async def initialize(self): return True
+    async def stop(self): return True
+
+    async def execute_task(self, task):
+        await self.release.wait()
+        return task
+
+    async def get_status(self):
+        return AgentStatus(agent_id=self.agent_id, status=self.reported,
+                           last_update=datetime.utcnow().isoformat())
+
+
+@pytest.mark.asyncio
+async def test_initialize_uses_the_reported_status():
+    registry = AgentRegistry()
+    assert await registry.initialize_agent(EchoAgent("a", reported="error"))
+    assert registry.find_agents("echo") == set()
+
+
+@pytest.mark.asyncio
+async def test_reported_idle_is_ignored_while_dispatches_are_in_flight():
+    registry = AgentRegistry()
+    agent = EchoAgent("a")
+    await registry.initialize_agent(agent)
+
+    dispatch = asyncio.create_task(registry.dispatch({"type": "echo"}))
+    await asyncio.sleep(0)
+    await registry.refresh_status()
+    assert registry.find_idle_agents("echo") == set()
+
+    agent.release.set()
+    assert await dispatch == {"type": "echo"}
+    assert registry.find_idle_agents("echo") == {"a"}
+
+
+@pytest.mark.asyncio
+async def test_streaming_from_an_unregistered_agent_raises_lookup_error():
+    registry = AgentRegistry()
+    agent = EchoAgent("a")
+    registry.register(agent)
+    registry.unregister("a")
+    with pytest.raises(LookupError):
+        async for _ in registry.stream(agent, {"type": "echo"}):
+            pass
@@ -0,0 +1,57 @@
+"""
+Tests for the bulk write path.
+"""
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.bulk import BulkWriter
+
+
+metadata = MetaData()
+products = Table(
+    "products",
+    metadata,
+    Column("sku", String, primary_key=True),
+    Column("name", String),
+    Column("price", Integer),
+)
+
+
+@pytest.mark.asyncio
+async def test_upsert_with_partial_rows_keeps_omitted_columns(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'bulk.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with BulkWriter(products, upsert_keys=["sku"], flush_interval=0, session_factory=session_factory) as writer:
+        await writer.add({"sku": "a", "name": "Shoe", "price": 1})
+    async with BulkWriter(products, upsert_keys=["sku"], flush_interval=0, session_factory=session_factory) as writer:
+        await writer.add({"sku": "a", "price": 2})
+
+    async with session_factory() as session:
+        rows = (await session.execute(select(products))).all()
+    await engine.dispose()
+    assert [tuple(row) for row in rows] == [("a", "Shoe", 2)]
+
+
+@pytest.mark.asyncio
+async def test_upsert_batch_with_repeated_keys_and_mixed_columns(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'bulk.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with BulkWriter(products, upsert_keys=["sku"], flush_interval=0, session_factory=session_factory) as writer:
+        await writer.add_many([
+            {"sku": "a", "name": "Shoe", "price": 1},
+            {"sku": "b", "name": "Hat"},
+            {"sku": "a", "price": 2},
+        ])
+
+    async with session_factory() as session:
+        rows = (await session.execute(select(products).order_by(products.c.sku))).all()
+    await engine.dispose()
+    assert [tuple(row) for row in rows] == [("a", "Shoe", 2), ("b", "Hat", None)]
@@ -0,0 +1,51 @@
+"""
+Tests for the tenant-fair priority queue.
+"""
+
+from app.tasks.fair_queue import FairQueue
+
+
+def drain(queue: FairQueue, eligible=None):
+    items = []
+    while (item := queue.pop(eligible)) is not None:
+        items.append(item)
+    return items
+
+
+def test_higher_priority_items_are_taken_first():
+    queue = FairQueue()
+    queue.push("low", priority=1, tenant="a")
+    queue.push("high", priority=9, tenant="a")
+    queue.push("mid", priority=5, tenant="b")
+    assert drain(queue) == ["high", "mid", "low"]
+    assert len(queue) == 0
+
+
+def test_tenants_take_turns_within_a_priority():
+    queue = FairQueue()
+    for index in range(3):
+        queue.push(f"a{index}", priority=5, tenant="a")
+    queue.push("b0", priority=5, tenant="b")
+    queue.push("c0", priority=5, tenant="c")
+    assert drain(queue) == ["a0", "b0", "c0", "a1", "a2"]
+
+
+def test_ineligible_tenants_are_skipped_and_keep_their_turn():
+    queue = FairQueue()
+    queue.push("a0", priority=5, tenant="a")
+    queue.push("a1", priority=5, tenant="a")
+    queue.push("b0", priority=5, tenant="b")
+    assert queue.pop(lambda tenant: tenant != "a") == "b0"
+    assert queue.pop(lambda tenant: tenant != "a") is None
+    assert queue.depth_by_tenant() == {"a": 2}
+    assert drain(queue) == ["a0", "a1"]
+
+
+def test_remove_takes_an_item_out_of_the_queue():
+    queue = FairQueue()
+    queue.push("a0", priority=5, tenant="a")
+    queue.push("a1", priority=5, tenant="a")
+    assert queue.remove("a0", priority=5, tenant="a")
+    assert not queue.remove("a0", priority=5, tenant="a")
+    assert not queue.remove("a1", priority=1, tenant="a")
+    assert drain(queue) == ["a1"]
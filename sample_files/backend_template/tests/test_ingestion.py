@@ -0,0 +1,59 @@
+"""
+Tests for ingestion sources, record preparation and chunking.
+"""
+
+import json
+
+import pytest
+
+from app.ingestion.chunking import chunk_text, prepare_records
+from app.ingestion.sources import iter_json_array
+
+
+def test_json_array_elements_are_read_across_blocks(tmp_path):
+    records = [{"id": index, "text": "x" * index, "tags": ["a, b", "]"]} for index in range(50)]
+    path = tmp_path / "records.json"
+    path.write_text(" \n" + json.dumps(records, indent=2))
+    assert list(iter_json_array(str(path), read_size=7)) == records
+
+
+def test_empty_json_array_yields_nothing(tmp_path):
+    path = tmp_path / "empty.json"
+    path.write_text("[ ]")
+    assert list(iter_json_array(str(path))) == []
+
+
+@pytest.mark.parametrize("content, message", [('{"id": 1}', "expected a top-level JSON array"),
+                                              ('[{"id": 1}, ', "unterminated JSON array")])
+def test_malformed_json_array_raises(tmp_path, content, message):
+    path = tmp_path / "bad.json"
+    path.write_text(content)
+    with pytest.raises(ValueError, match=message):
+        list(iter_json_array(str(path)))
+
+
+def test_short_text_is_one_chunk_with_whitespace_collapsed():
+    assert chunk_text("  red\n  shoe ", chunk_size=100, overlap=10) == ["red shoe"]
+    assert chunk_text("   ", chunk_size=100, overlap=10) == []
+
+
+def test_chunks_end_on_words_and_overlap():
+    words = [f"word{index:02d}" for index in range(40)]
+    chunks = chunk_text(" ".join(words), chunk_size=50, overlap=15)
+    assert all(len(chunk) <= 50 for chunk in chunks)
+    assert all(set(chunk.split()) <= set(words) for chunk in chunks)  # no word is cut
+    assert [word for word in words if not any(word in chunk for chunk in chunks)] == []
+    for previous, chunk in zip(chunks, chunks[1:]):
+        assert chunk.split()[0] in previous.split()
+
+
+def test_repeated_document_ids_keep_the_last_record():
+    records = [
+        (0, {"id": "a", "name": "red shoe"}),
+        (1, {"id": "b", "name": "green"}),
+        (2, {"id": "a", "name": "blue hat"}),
+    ]
+    chunks = prepare_records(records, id_field="id", text_fields=["name"], chunk_size=100, overlap=0)
+    assert [chunk["id"] for chunk in chunks] == ["a#0", "b#0"]
+    assert chunks[0]["text"] == "blue hat"
+    assert chunks[0]["offset"] == 2
@@ -0,0 +1,59 @@
+"""
+Tests for the retrieval indexes.
+"""
+
+import os
+
+import pytest
+
+from app.retrieval.bm25 import BM25Index
+from app.retrieval.hybrid import reciprocal_rank_fusion
+from app.retrieval.vector_index import VectorIndex
+
+
+def test_bm25_duplicate_ids_in_one_batch_keep_the_last_text():
+    index = BM25Index()
+    index.add(["a", "a", "b"], ["red shoe", "blue hat", "green"])
+    assert len(index) == 2
+    assert index.search("red") == []
+    assert [doc_id for doc_id, _ in index.search("blue")] == ["a"]
+
+    index.delete(["a"])
+    assert index.search("red") == []
+    assert index.search("blue") == []
+    assert index.get_stats()["terms"] == 1
+
+
+def test_vector_duplicate_ids_in_one_batch_keep_the_last_vector():
+    index = VectorIndex(dim=2)
+    index.add(["x", "x", "y"], [[1, 0], [0, 1], [1, 1]], metadata=[{"v": 1}, {"v": 2}, {"v": 3}])
+    assert len(index) == 2
+    assert index.tombstones == 0
+    hits = index.search([0, 1], k=10)[0]
+    assert [doc_id for doc_id, _, _ in hits] == ["x", "y"]
+    assert hits[0][2] == {"v": 2}
+
+
+def test_vector_index_reloads_after_growing_without_a_full_save(tmp_path):
+    index = VectorIndex(dim=2, path=str(tmp_path), initial_capacity=2)
+    index.add(["a", "b"], [[1, 0], [0, 1]])
+    index.save()
+    index.add(["c", "d", "e"], [[1, 1], [1, 2], [2, 1]])  # grows; only the header is written
+
+    reloaded = VectorIndex(path=str(tmp_path))
+    assert reloaded.capacity == index.capacity
+    assert len(reloaded) == 2 and "a" in reloaded and "c" not in reloaded
+    assert reloaded.search([1, 0], k=1)[0][0][0] == "a"
+    assert sorted(os.listdir(tmp_path)) == ["header.json", "meta.json", "vectors.2.f32"]
+
+
+def test_rrf_rewards_documents_ranked_by_several_retrievers():
+    scores = reciprocal_rank_fusion({"vector": ["a", "b"], "keyword": ["b", "c"]}, rrf_k=60)
+    assert scores["b"] == pytest.approx(1 / 62 + 1 / 61)
+    assert scores["a"] == pytest.approx(1 / 61)
+    assert max(scores, key=scores.get) == "b"
+
+
+def test_rrf_weights_scale_each_retriever():
+    scores = reciprocal_rank_fusion({"vector": ["a"], "keyword": ["b"]}, rrf_k=0, weights={"keyword": 2.0})
+    assert scores == {"a": 1.0, "b": 2.0}
@@ -0,0 +1,29 @@
+"""
+Tests for the pre-fork server.
+"""
+
+import pytest
+
+from app.core.config import settings
+from app.core.server import PreforkServer
+
+
+def test_single_worker_features_default_to_one_worker(monkeypatch):
+    monkeypatch.setattr(settings, "server_workers", None)
+    monkeypatch.setattr(settings, "task_queue_backend", "local")
+    assert PreforkServer("main:app").worker_count == 1
+
+
+def test_single_worker_features_refuse_several_workers(monkeypatch):
+    monkeypatch.setattr(settings, "task_queue_backend", "celery")
+    monkeypatch.setattr(settings, "vector_index_dir", "/tmp/indexes")
+    with pytest.raises(ValueError, match="VECTOR_INDEX_DIR"):
+        PreforkServer("main:app", workers=2)
+
+
+def test_workers_default_to_available_cpus(monkeypatch):
+    monkeypatch.setattr(settings, "server_workers", None)
+    monkeypatch.setattr(settings, "task_queue_backend", "celery")
+    monkeypatch.setattr(settings, "vector_index_dir", None)
+    monkeypatch.setattr("app.core.server.available_cpus", lambda: 3)
+    assert PreforkServer("main:app").worker_count == 3
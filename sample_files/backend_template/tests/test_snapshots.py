@@ -0,0 +1,45 @@
+"""
+Tests for snapshot content negotiation and ETags.
+"""
+
+import pytest
+
+from app.core import snapshots
+from app.core.snapshots import Snapshot, _etag_matches, negotiate_encoding
+
+
+@pytest.fixture
+def without_brotli(monkeypatch):
+    monkeypatch.setattr(snapshots, "_brotli_module", lambda: None)
+
+
+@pytest.fixture
+def with_brotli(monkeypatch):
+    monkeypatch.setattr(snapshots, "_brotli_module", lambda: object())
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip, deflate, br", "br"),
+    ("br;q=0, gzip", "gzip"),
+    ("*", "br"),
+    ("*;q=0, gzip;q=0.5", "gzip"),
+    ("identity", None),
+    ("gzip;q=bad", None),
+    ("", None),
+])
+def test_negotiate_prefers_brotli(with_brotli, header, expected):
+    assert negotiate_encoding(header) == expected
+
+
+def test_negotiate_skips_brotli_when_unavailable(without_brotli):
+    assert negotiate_encoding("br, gzip") == "gzip"
+    assert negotiate_encoding("br") is None
+
+
+def test_etag_matches_any_encoding_of_the_snapshot():
+    snapshot = Snapshot(1, {"tools": []})
+    assert _etag_matches(snapshot.etag(), snapshot)
+    assert _etag_matches(f'"other", W/{snapshot.etag("gzip")}', snapshot)
+    assert _etag_matches(" * ", snapshot)
+    assert not _etag_matches('"other"', snapshot)
+    assert not _etag_matches(Snapshot(2, {"tools": [1]}).etag(), snapshot)
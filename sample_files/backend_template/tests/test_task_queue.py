@@ -0,0 +1,150 @@
+"""
+Tests for the task queue.
+"""
+
+import asyncio
+import uuid
+
+import pytest
+import pytest_asyncio
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+from app.interfaces.streaming import StreamEvent, StreamEventType
+from app.interfaces.task_queue import QueuedTask, TaskKind, TaskOutcome, TaskState
+from app.tasks.local import InProcessTaskQueue
+from app.tasks.queue import DispatchingTaskQueue
+from app.tasks.task_store import RedisTaskStore, events_key
+
+
+class ControlledTaskQueue(DispatchingTaskQueue):
+    """Queue whose tasks run until the test releases them."""
+
+    backend = "test"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.started: "asyncio.Queue[str]" = asyncio.Queue()
+        self.releases = {}
+        self.aborted = []
+
+    async def _execute(self, record):
+        task_id = record.task.task_id
+        self.releases[task_id] = asyncio.Event()
+        self.started.put_nowait(task_id)
+        self._publish(record, StreamEvent(type=StreamEventType.PROGRESS, data=task_id))
+        await self.releases[task_id].wait()
+        return TaskOutcome(state=TaskState.COMPLETED, result=task_id)
+
+    async def _abort(self, record):
+        self.aborted.append(record.task.task_id)
+
+
+@pytest_asyncio.fixture
+async def task_queue():
+    queue = ControlledTaskQueue(workers=1)
+    await queue.start()
+    yield queue
+    await queue.stop()
+
+
+async def wait_finished(queue, task_id):
+    async for _ in queue.events(task_id):
+        pass
+    return await queue.get(task_id)
+
+
+@pytest.mark.asyncio
+async def test_tasks_wait_for_a_free_slot_and_run_in_priority_order(task_queue):
+    first = await task_queue.submit(QueuedTask(kind=TaskKind.AGENT))
+    assert await task_queue.started.get() == first.task_id
+    low = await task_queue.submit(QueuedTask(kind=TaskKind.AGENT, priority=1))
+    high = await task_queue.submit(QueuedTask(kind=TaskKind.AGENT, priority=9))
+    assert (await task_queue.get(low.task_id)).state == TaskState.QUEUED
+
+    previous = first
+    for expected in (high, low):
+        task_queue.releases[previous.task_id].set()
+        assert await task_queue.started.get() == expected.task_id
+        previous = expected
+    task_queue.releases[low.task_id].set()
+    task = await wait_finished(task_queue, low.task_id)
+    assert task.state == TaskState.COMPLETED and task.result == low.task_id
+    assert task_queue.get_stats()["running"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancel_queued_and_running_tasks_releases_their_slot(task_queue):
+    running = await task_queue.submit(QueuedTask(kind=TaskKind.AGENT))
+    queued = await task_queue.submit(QueuedTask(kind=TaskKind.AGENT))
+    await task_queue.started.get()
+
+    assert await task_queue.cancel(queued.task_id)
+    assert (await task_queue.get(queued.task_id)).state == TaskState.CANCELLED
+    assert await task_queue.cancel(running.task_id)
+    task = await wait_finished(task_queue, running.task_id)
+    assert task.state == TaskState.CANCELLED
+    assert not await task_queue.cancel(running.task_id)
+
+    # The freed slot runs the next task
+    after = await task_queue.submit(QueuedTask(kind=TaskKind.AGENT))
+    assert await asyncio.wait_for(task_queue.started.get(), 1) == after.task_id
+    assert task_queue.aborted == [running.task_id]
+    assert task_queue.get_stats()["running"] == 1
+
+
+@pytest.mark.asyncio
+async def test_overrunning_task_times_out_and_is_aborted(task_queue, monkeypatch):
+    monkeypatch.setattr(settings, "task_queue_timeout_grace", 0)
+    task = await task_queue.submit(QueuedTask(kind=TaskKind.AGENT, timeout=0.05))
+    events = [event async for event in task_queue.events(task.task_id)]
+    assert [event.type for event in events] == [StreamEventType.PROGRESS, StreamEventType.ERROR]
+    assert (await task_queue.get(task.task_id)).state == TaskState.TIMED_OUT
+    assert task_queue.aborted == [task.task_id]
+    assert task_queue.get_stats()["running"] == 0
+
+
+@pytest.mark.asyncio
+async def test_local_backend_refuses_several_server_workers(monkeypatch):
+    monkeypatch.setattr(settings, "server_workers", 2)
+    queue = InProcessTaskQueue(workers=1)
+    with pytest.raises(RuntimeError, match="SERVER_WORKERS=1"):
+        await queue.start()
+
+
+@pytest_asyncio.fixture
+async def redis_client():
+    client = aioredis.from_url(settings.redis_url)
+    try:
+        await client.ping()
+    except Exception:
+        await client.aclose()
+        pytest.skip("Redis is not reachable at REDIS_URL")
+    yield client
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_task_state_is_visible_to_other_processes(redis_client):
+    # Two stores stand in for the submitting API process and another one
+    owner, other = RedisTaskStore(redis_client, result_ttl=60), RedisTaskStore(redis_client, result_ttl=60)
+    task = QueuedTask(task_id=f"test-{uuid.uuid4()}", kind=TaskKind.AGENT, timeout=5)
+    await owner.save(task)
+    assert (await other.load(task.task_id)).state == TaskState.QUEUED
+
+    requests = other.cancel_requests()
+    listening = asyncio.ensure_future(requests.__anext__())
+    await asyncio.sleep(0.1)  # let the subscription start
+    assert await other.request_cancel(task.task_id)
+    assert await asyncio.wait_for(listening, 5) == task.task_id
+    await requests.aclose()
+
+    # Events come from the Celery worker; the outcome from the owner
+    await redis_client.xadd(events_key(task.task_id), {"event": StreamEvent(type=StreamEventType.PROGRESS, data=1).model_dump_json()})
+    task.state, task.error = TaskState.CANCELLED, "Task cancelled"
+    await owner.save(task)
+    events = [event async for event in other.events(task.task_id)]
+    assert [event.type for event in events] == [StreamEventType.PROGRESS, StreamEventType.ERROR]
+    assert events[-1].data == {"state": "cancelled", "error": "Task cancelled"}
+    assert not await other.request_cancel(task.task_id)
+    await redis_client.delete(events_key(task.task_id), f"tasks:{task.task_id}")
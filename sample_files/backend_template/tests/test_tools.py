@@ -0,0 +1,106 @@
+"""
+Tests for tool caching and execution.
+"""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from app.interfaces.tool import ITool, ToolCategory, ToolParameter, ToolResult
+from app.tools.cache import CachedTool, RedisResultCache, ToolResultCache
+from app.tools.executor import ToolCall, ToolExecutor
+
+
+class CountingTool(ITool):
+    """Tool returning how often it ran."""
+
+    def __init__(self, tool_id: str, config=None):
+        super().__init__(tool_id, config or {})
+        self.calls = 0
+
+    name = "counting"
+    description = "Counts its calls"
+    category = ToolCategory.UTILITY
+
+    @property
+    def parameters(self) -> List[ToolParameter]:
+        return []
+
+    async def execute(self, **kwargs) -> ToolResult:
+        self.calls += 1
+        return ToolResult(success=True, data=self.calls)
+
+
+@pytest.mark.asyncio
+async def test_cache_counts_hits_and_misses_per_tool():
+    cache = ToolResultCache(use_redis=False)
+    first, second = CachedTool(CountingTool("first"), cache), CachedTool(CountingTool("second"), cache)
+    await first.execute()
+    result = await first.execute()
+    assert result.metadata["cache"] == "hit"
+    assert (result.metadata["cache_hits"], result.metadata["cache_misses"]) == (1, 1)
+
+    result = await second.execute()
+    assert (result.metadata["cache_hits"], result.metadata["cache_misses"]) == (0, 1)
+    assert cache.get_stats()["tools"] == {"first": {"hits": 1, "misses": 1}, "second": {"hits": 0, "misses": 1}}
+
+
+@pytest.mark.asyncio
+async def test_zero_ttl_disables_caching():
+    tool = CountingTool("tool", {"cache_ttl": 0})
+    cached = CachedTool(tool, ToolResultCache(use_redis=False))
+    await cached.execute()
+    await cached.execute()
+    assert tool.calls == 2
+
+
+class FakeRedis:
+    def __init__(self, value):
+        self.value = value
+
+    async def get(self, key):
+        return self.value
+
+
+@pytest.mark.asyncio
+async def test_invalid_redis_entry_is_a_miss():
+    cache = RedisResultCache("redis://localhost:6379/0", ttl=60)  # connects lazily
+    cache._client = FakeRedis(b'{"success": "not a bool"}')
+    assert await cache.get("tool:x:y") is None
+
+
+class SlowValidationTool(CountingTool):
+    """Tool whose validation yields to the event loop."""
+
+    def __init__(self, tool_id: str):
+        super().__init__(tool_id)
+        self.validating = asyncio.Event()
+
+    async def validate_parameters(self, **kwargs) -> bool:
+        self.validating.set()
+        await asyncio.sleep(0)
+        return True
+
+
+class WrongResultTool(CountingTool):
+    """Tool returning raw data instead of a ToolResult."""
+
+    async def execute(self, **kwargs):
+        return {"rows": []}
+
+
+@pytest.mark.asyncio
+async def test_executor_reports_bad_tools_as_failed_results():
+    slow_tool = SlowValidationTool("slow")
+    executor = ToolExecutor([slow_tool, WrongResultTool("wrong"), CountingTool("ok")])
+    batch = asyncio.ensure_future(executor.execute_batch([
+        ToolCall(tool_id="slow"), ToolCall(tool_id="wrong"), ToolCall(tool_id="ok"),
+    ]))
+    await slow_tool.validating.wait()
+    executor.unregister_tool("slow")  # while its call is validating
+    slow, wrong, ok = await batch
+
+    assert slow.success
+    assert not wrong.success and "not a ToolResult" in wrong.error
+    assert ok.success and ok.data == 1
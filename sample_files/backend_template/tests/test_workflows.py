@@ -0,0 +1,116 @@
+"""
+Tests for the workflow runtime and checkpoint store.
+"""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from app.interfaces.workflow import IWorkflow, WorkflowNode, WorkflowStatus
+from app.workflows.checkpoint import FileCheckpointStore
+from app.workflows.runtime import INPUT_KEY, WorkflowRuntime, resolve_dependencies
+
+
+class ChainWorkflow(IWorkflow):
+    """Workflow whose nodes add one to their dependency's output."""
+
+    def __init__(self, node_ids: List[str], fail: str = ""):
+        super().__init__("chain")
+        self._nodes = [
+            WorkflowNode(node_id=node_id, name=node_id, type="step",
+                         config={"depends_on": node_ids[index - 1:index]})
+            for index, node_id in enumerate(node_ids)
+        ]
+        self.fail = fail
+
+    name = "chain"
+    description = "Adds one per node"
+
+    @property
+    def nodes(self) -> List[WorkflowNode]:
+        return self._nodes
+
+    async def initialize(self): return True
+    async def execute(self, input_data): raise NotImplementedError
+    async def pause(self, execution_id): return False
+    async def resume(self, execution_id): return False
+    async def cancel(self, execution_id): return False
+    async def get_status(self, execution_id): return None
+
+    async def execute_node(self, node: WorkflowNode, inputs: Dict[str, Any], input_data: Dict[str, Any]) -> Any:
+        if node.node_id == self.fail:
+            raise RuntimeError("boom")
+        return sum(inputs.values(), input_data["start"]) + 1
+
+
+def node(node_id: str, depends_on=()) -> WorkflowNode:
+    return WorkflowNode(node_id=node_id, name=node_id, type="step", config={"depends_on": depends_on})
+
+
+def test_dependencies_accept_a_single_node_id():
+    assert resolve_dependencies([node("a"), node("b", "a"), node("c", ["a", "b"])]) == {
+        "a": [], "b": ["a"], "c": ["a", "b"],
+    }
+
+
+def test_unknown_dependency_is_rejected():
+    with pytest.raises(ValueError, match="unknown node missing"):
+        resolve_dependencies([node("a", ["missing"])])
+
+
+def test_dependency_cycle_is_rejected():
+    with pytest.raises(ValueError, match=r"cycle involving: \['b', 'c'\]"):
+        resolve_dependencies([node("a"), node("b", ["a", "c"]), node("c", "b")])
+
+
+@pytest.mark.asyncio
+async def test_finished_execution_checkpoints_are_compacted(tmp_path):
+    store = FileCheckpointStore(str(tmp_path))
+    runtime = WorkflowRuntime(ChainWorkflow(["a", "b", "c"]), checkpoint_store=store)
+    execution = await runtime.execute({"start": 0}, execution_id="run")
+    assert execution.status == WorkflowStatus.COMPLETED
+    assert execution.result == {"c": 3}
+
+    records = await store._read("run")
+    assert [record.record_type for record in records] == ["execution", "node", "node", "node", "node"]
+    assert "run" not in store._last_state
+
+    state = await FileCheckpointStore(str(tmp_path)).load("run")
+    assert state.execution.status == WorkflowStatus.COMPLETED
+    assert state.node_outputs["c"] == 3
+
+
+class FailingStore(FileCheckpointStore):
+    """Checkpoint store whose node output writes fail."""
+
+    async def save_node_output(self, execution_id, node_id, output):
+        if node_id != INPUT_KEY:
+            raise OSError("disk full")
+        await super().save_node_output(execution_id, node_id, output)
+
+
+@pytest.mark.asyncio
+async def test_unexpected_errors_fail_the_execution_with_a_final_checkpoint(tmp_path):
+    runtime = WorkflowRuntime(ChainWorkflow(["a"]), checkpoint_store=FailingStore(str(tmp_path)))
+    execution = await runtime.execute({"start": 0}, execution_id="run")
+    assert execution.status == WorkflowStatus.FAILED
+    assert execution.error == "OSError: disk full"
+
+    state = await FileCheckpointStore(str(tmp_path)).load("run")
+    assert state.execution.status == WorkflowStatus.FAILED
+
+
+@pytest.mark.asyncio
+async def test_finished_executions_stay_queryable_and_resumable():
+    workflow = ChainWorkflow(["a", "b"], fail="b")
+    runtime = WorkflowRuntime(workflow)
+    execution = await runtime.execute({"start": 0}, execution_id="run")
+    assert execution.status == WorkflowStatus.FAILED
+    assert execution.current_node == "b"
+    assert runtime.get_status("run") is execution
+
+    workflow.fail = ""
+    execution = await runtime.resume("run")
+    assert execution.status == WorkflowStatus.COMPLETED
+    assert execution.result == {"b": 2}
+    assert runtime.get_status("run") is execution